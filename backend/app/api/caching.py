@@ -0,0 +1,105 @@
+"""Pre-serialized, ETag-validated responses for polled read-only endpoints.
+
+Payloads that only change when the underlying data changes are encoded to
+bytes once and served as-is. Each body carries a strong ETag (a hash of the
+bytes), so a client revalidating with ``If-None-Match`` gets an empty 304
+instead of the full document.
+
+Compressed variants (gzip / brotli) are produced once per body on first
+request and kept next to it. Each variant gets its own strong ETag, as
+RFC 9110 requires for different representations.
+"""
+
+import hashlib
+from dataclasses import dataclass, field
+from typing import Any
+
+import orjson
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+from app.api.compression import compress, negotiate_encoding
+from app.core.metrics import cache_lookup
+from app.core.settings import settings
+
+
+@dataclass(frozen=True)
+class CachedBody:
+    """An encoded response body and its strong ETag."""
+
+    body: bytes
+    etag: str
+    media_type: str = "application/json"
+    # Content coding -> (compressed body, ETag), filled on first use
+    variants: dict[str, tuple[bytes, str]] = field(default_factory=dict, compare=False, repr=False)
+
+    def encoded(self, encoding: str | None) -> tuple[bytes, str, str | None]:
+        """
+        The body in ``encoding`` (compressed once, then reused).
+
+        Returns:
+            ``(body, etag, content_encoding)``; identity when ``encoding`` is None
+            or the body is below the compression threshold
+        """
+        if encoding is None or len(self.body) < settings.compression_minimum_size:
+            return self.body, self.etag, None
+        variant = self.variants.get(encoding)
+        cache_lookup("compressed_body", hit=variant is not None)
+        if variant is None:
+            compressed = compress(self.body, encoding, settings.gzip_level, settings.brotli_quality)
+            variant = self.variants[encoding] = (compressed, f'{self.etag[:-1]}-{encoding}"')
+        return variant[0], variant[1], encoding
+
+
+def cached_body(body: bytes, media_type: str = "application/json") -> CachedBody:
+    """Wrap encoded bytes with a content-hash ETag."""
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    return CachedBody(body=body, etag=etag, media_type=media_type)
+
+
+def model_body(model: BaseModel) -> CachedBody:
+    """Serialize a model the way FastAPI would (JSON mode, by alias) and wrap it."""
+    return cached_body(model.model_dump_json(by_alias=True).encode())
+
+
+def json_body(content: Any) -> CachedBody:
+    """Serialize plain JSON data (dicts, lists) with orjson and wrap it."""
+    return cached_body(orjson.dumps(content))
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an ``If-None-Match`` header matches ``etag`` (weak comparison, per RFC 9110)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def cached_response(request: Request, cached: CachedBody, max_age: int = 0) -> Response:
+    """
+    Serve a cached body, or 304 Not Modified if the client already has it.
+
+    Args:
+        request: Incoming request (for ``If-None-Match``)
+        cached: Pre-encoded body
+        max_age: Seconds clients may reuse the body before revalidating (0 = always revalidate)
+
+    Returns:
+        200 with the body (compressed if the client accepts it), or an empty
+        304; both carry ETag, Cache-Control and Vary
+    """
+    body, etag, content_encoding = cached.encoded(negotiate_encoding(request.headers.get("accept-encoding")))
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={max_age}, must-revalidate" if max_age > 0 else "no-cache",
+        "Vary": "Accept-Encoding",
+    }
+    not_modified = etag_matches(request.headers.get("if-none-match"), etag)
+    # "hit" = the client's copy was current and only a 304 was sent
+    cache_lookup("http_etag", hit=not_modified)
+    if not_modified:
+        return Response(status_code=304, headers=headers)
+    if content_encoding:
+        headers["Content-Encoding"] = content_encoding
+    return Response(content=body, media_type=cached.media_type, headers=headers)
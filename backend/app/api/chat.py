@@ -2,13 +2,21 @@
 
 import asyncio
 import uuid
+
+import orjson
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
+from app.api.responses import OrjsonResponse
+from app.core.log import get_logger
 from app.core.settings import settings
+from app.core.tracing import span, traced
+from app.services.health import STATUS_OK, health_monitor
 from app.services.watsonx_client import watsonx_client, WatsonxClientError
 
+logger = get_logger(__name__)
+
 router = APIRouter(tags=["chat"])
 
 
@@ -326,6 +334,7 @@ class ChatResponse(BaseModel):
     - "Analyze the bottlenecks in our pipeline"
     """,
 )
+@traced("chat")
 async def chat(request: ChatRequest) -> ChatResponse:
     """
     Proxy chat requests to watsonx Orchestrate.
@@ -356,14 +365,16 @@ async def chat(request: ChatRequest) -> ChatResponse:
         if request.context and request.context.workflow_graph:
             workflow_graph = request.context.workflow_graph
         else:
-            # Fetch from mock endpoint to provide context to the agent
-            from app.api.mock import get_mock_workflow
+            # Use the /mock/workflow snapshot as context for the agent
+            from app.api.mock import mock_snapshot
             try:
-                graph_response = await get_mock_workflow()
-                workflow_graph = graph_response.workflow_graph.model_dump() if graph_response.workflow_graph else None
-                print(f"[DEBUG] Auto-loaded workflow graph with {len(workflow_graph.get('nodes', []))} nodes")
+                with span("load_graph") as load_span:
+                    await mock_snapshot.refresh()
+                    workflow_graph = orjson.loads(mock_snapshot.workflow.body)["workflow_graph"]
+                    load_span.set_attribute("graph.nodes", len(workflow_graph.get("nodes", [])))
+                logger.debug("Auto-loaded workflow graph with %d nodes", len(workflow_graph.get("nodes", [])))
             except Exception as e:
-                print(f"[DEBUG] Could not auto-load workflow graph: {e}")
+                logger.warning("Could not auto-load workflow graph: %s", e)
 
         response = await watsonx_client.chat(
             message=request.message,
@@ -372,38 +383,37 @@ async def chat(request: ChatRequest) -> ChatResponse:
             context={"workflow_graph": workflow_graph} if workflow_graph else None,
         )
 
-        # Parse the response - structure may vary based on watsonx API version
-        # Typical OpenAI-compatible response structure
-        choices = response.get("choices", [])
-        if choices:
-            message_data = choices[0].get("message", {})
-            message = ChatMessage(
-                role=message_data.get("role", "assistant"),
-                content=message_data.get("content", ""),
-            )
-        else:
-            # Fallback for different response structures
-            message = ChatMessage(
-                role="assistant",
-                content=response.get("output", response.get("response", str(response))),
+        with span("parse_response"):
+            # Parse the response - structure may vary based on watsonx API version
+            # Typical OpenAI-compatible response structure
+            choices = response.get("choices", [])
+            if choices:
+                message_data = choices[0].get("message", {})
+                message = ChatMessage(
+                    role=message_data.get("role", "assistant"),
+                    content=message_data.get("content", ""),
+                )
+            else:
+                # Fallback for different response structures
+                message = ChatMessage(
+                    role="assistant",
+                    content=response.get("output", response.get("response", str(response))),
+                )
+
+            return ChatResponse(
+                message=message,
+                conversation_id=response.get("conversation_id"),
+                raw_response=response if request.agent_id else None,  # Only include raw for debugging
             )
 
-        return ChatResponse(
-            message=message,
-            conversation_id=response.get("conversation_id"),
-            raw_response=response if request.agent_id else None,  # Only include raw for debugging
-        )
-
     except WatsonxClientError as e:
-        print(f"[ERROR] WatsonxClientError: {e.message}")
+        logger.error("watsonx Orchestrate error (status %s): %s", e.status_code, e.message)
         raise HTTPException(
             status_code=e.status_code or 500,
             detail=f"watsonx Orchestrate error: {e.message}"
         )
     except Exception as e:
-        import traceback
-        print(f"[ERROR] Exception in chat endpoint:")
-        traceback.print_exc()
+        logger.exception("Unhandled error in chat endpoint")
         raise HTTPException(
             status_code=500,
             detail=f"Internal error: {str(e)}"
@@ -467,10 +477,12 @@ async def chat_stream(request: ChatRequest):
 @router.get(
     "/chat/health",
     summary="Check watsonx Orchestrate connectivity",
-    description="Verify that the backend can connect to watsonx Orchestrate.",
+    description="Whether the backend can authenticate to watsonx Orchestrate, "
+    "as of the last background health check.",
+    response_class=OrjsonResponse,
 )
 async def chat_health():
-    """Check if watsonx Orchestrate is reachable."""
+    """Report watsonx Orchestrate connectivity from the health monitor's cached IAM check."""
     # Stub mode - always healthy
     if settings.stub_mode:
         return {
@@ -480,26 +492,19 @@ async def chat_health():
             "message": "Running in stub mode - returning mock responses",
         }
 
-    try:
-        # Try to get an access token as a connectivity check
-        await watsonx_client._get_access_token()
+    iam = health_monitor.results.get("iam")
+    if iam is not None and iam.status == STATUS_OK:
         return {
             "status": "healthy",
             "mode": "live",
             "watsonx_connected": True,
             "agent_id": watsonx_client.agent_id or "not configured",
+            "checked_at": iam.checked_at,
         }
-    except WatsonxClientError as e:
-        return {
-            "status": "unhealthy",
-            "mode": "live",
-            "watsonx_connected": False,
-            "error": e.message,
-        }
-    except Exception as e:
-        return {
-            "status": "unhealthy",
-            "mode": "live",
-            "watsonx_connected": False,
-            "error": str(e),
-        }
+    return {
+        "status": "unhealthy",
+        "mode": "live",
+        "watsonx_connected": False,
+        "error": (iam.error or "IAM not configured") if iam is not None else "Health check pending",
+        "checked_at": iam.checked_at if iam is not None else None,
+    }
@@ -0,0 +1,141 @@
+"""Response compression: gzip, and brotli when the ``brotli`` package is installed.
+
+``CompressionMiddleware`` compresses complete (single-message) responses at
+or above a size threshold, picking brotli over gzip when the client accepts
+both. Streaming responses (chat SSE) and bodies that already carry a
+Content-Encoding pass through untouched, so pre-encoded cached payloads
+(see ``app.api.caching``) are never compressed twice.
+"""
+
+import asyncio
+import gzip
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # Optional: gzip only
+    brotli = None
+
+# Compressing these is wasted CPU (already compressed or streamed)
+SKIP_CONTENT_TYPES = ("text/event-stream", "image/", "audio/", "video/", "application/zip", "application/gzip")
+
+# Bodies above this size are compressed off the event loop
+THREAD_MINIMUM_SIZE = 256 * 1024
+
+
+def available_encodings() -> tuple[str, ...]:
+    """Content codings this server can produce, in preference order."""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate_encoding(accept_encoding: str | None) -> str | None:
+    """
+    Pick the best supported coding from an ``Accept-Encoding`` header.
+
+    Returns:
+        "br", "gzip" or None (identity)
+    """
+    if not accept_encoding:
+        return None
+    accepted: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip().lower()] = quality
+
+    best, best_quality = None, 0.0
+    for coding in available_encodings():
+        quality = accepted.get(coding, accepted.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def compress(body: bytes, encoding: str, gzip_level: int = 6, brotli_quality: int = 5) -> bytes:
+    """Compress ``body`` with "gzip" or "br"."""
+    if encoding == "br":
+        return brotli.compress(body, quality=brotli_quality)
+    # mtime=0 keeps output deterministic for identical bodies
+    return gzip.compress(body, compresslevel=gzip_level, mtime=0)
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing responses of at least ``minimum_size`` bytes."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 5,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Message | None = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start_message, passthrough
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                content_type = headers.get("content-type", "")
+                passthrough = "content-encoding" in headers or content_type.startswith(SKIP_CONTENT_TYPES)
+                if passthrough:
+                    await send(message)
+                else:
+                    # Hold the headers until the body shows whether to compress
+                    start_message = message
+                return
+
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            if start_message is not None:
+                initial, start_message = start_message, None
+                headers = MutableHeaders(raw=initial["headers"])
+                if message.get("more_body", False) or len(body) < self.minimum_size:
+                    # Streaming or small: send as-is
+                    passthrough = True
+                    await send(initial)
+                    await send(message)
+                    return
+
+                if len(body) >= THREAD_MINIMUM_SIZE:
+                    body = await asyncio.to_thread(
+                        compress, body, encoding, self.gzip_level, self.brotli_quality
+                    )
+                else:
+                    body = compress(body, encoding, self.gzip_level, self.brotli_quality)
+                headers["Content-Encoding"] = encoding
+                headers["Content-Length"] = str(len(body))
+                headers.add_vary_header("Accept-Encoding")
+                await send(initial)
+                await send({"type": "http.response.body", "body": body})
+                return
+
+            await send(message)
+
+        await self.app(scope, receive, send_compressed)
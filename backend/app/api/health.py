@@ -0,0 +1,27 @@
+"""Liveness and readiness probes.
+
+``/livez`` answers as long as the event loop is serving requests; it never
+looks at dependencies, so an upstream outage doesn't get the process
+restarted. ``/readyz`` reports the background health monitor's cached
+result (503 until the first check round and while a dependency is
+failing), so both probes are O(1) and never call upstream.
+"""
+
+from fastapi import APIRouter
+
+from app.api.responses import OrjsonResponse
+from app.services.health import health_monitor
+
+router = APIRouter(tags=["health"])
+
+
+@router.get("/livez", summary="Liveness probe", response_class=OrjsonResponse)
+async def liveness() -> dict:
+    """The process is up and serving."""
+    return {"status": "alive"}
+
+
+@router.get("/readyz", summary="Readiness probe", response_class=OrjsonResponse)
+async def readiness() -> OrjsonResponse:
+    """Cached dependency state; 503 while not ready to take traffic."""
+    return OrjsonResponse(health_monitor.snapshot(), status_code=200 if health_monitor.ready else 503)
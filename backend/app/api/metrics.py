@@ -0,0 +1,53 @@
+"""Request latency instrumentation for the API."""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import HTTP_REQUEST_SECONDS
+
+
+def route_template(scope: Scope) -> str:
+    """Path template of the route that handled a request ("unmatched" if none)."""
+    # FastAPI versions that resolve included routers lazily keep the
+    # prefixed template in their own scope entry; older ones copy routes
+    # with the full path onto the app
+    context = scope.get("fastapi", {}).get("effective_route_context")
+    if context is not None and getattr(context, "path", None):
+        return context.path
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording request latency per route template.
+
+    Requests are labeled with the matched route's path template (e.g.
+    ``/api/v1/mock/branch/{branch_id:path}``) rather than the raw URL, so
+    series stay bounded; unmatched requests share the "unmatched" route.
+    Streaming responses are timed until their last chunk is sent.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_REQUEST_SECONDS.observe(
+                time.perf_counter() - start, scope["method"], route_template(scope), str(status)
+            )
@@ -1,12 +1,23 @@
 """Mock API endpoints for the FlowSight tool."""
 
+import asyncio
+import time
 from datetime import datetime, timedelta, timezone
+from functools import cache
 
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 
+from app.api.caching import CachedBody, cached_body, cached_response, json_body, model_body
+from app.api.responses import OrjsonResponse
+from app.core.metrics import cache_lookup
+from app.core.settings import settings
+from app.core.shared_state import shared_store
+from app.core.tracing import traced
 from app.models.events import RawEvent, RawEventsPayload
 from app.models.graph import Edge, GraphEnvelope, Node, WorkflowGraph
+from app.services.graph_query import GRAPH_PAGE_SIZE, MAX_GRAPH_PAGE_SIZE, NODE_FIELDS, graph_page
 from app.services.normalizer import normalize_events_to_graph
+from app.services.warehouse import EventWarehouse
 
 router = APIRouter(tags=["mock"])
 
@@ -40,6 +51,7 @@ def _get_mock_raw_events() -> list[RawEvent]:
             status="open",
             author="dev1",
             branch="feature/auth-flow",
+            references=["commit:a1b2c3d", "commit:e4f5g6h", "issue:PROJ-101"],
         ),
         RawEvent(
             source="ci",
@@ -47,6 +59,7 @@ def _get_mock_raw_events() -> list[RawEvent]:
             id="77",
             timestamp=base_time + timedelta(hours=3),
             conclusion="failure",
+            references=["pr:42"],
         ),
         RawEvent(
             source="ci",
@@ -54,6 +67,7 @@ def _get_mock_raw_events() -> list[RawEvent]:
             id="78",
             timestamp=base_time + timedelta(hours=5),
             conclusion="success",
+            references=["pr:42"],
         ),
         RawEvent(
             source="jira",
@@ -81,6 +95,7 @@ def _get_mock_raw_events() -> list[RawEvent]:
             status="draft",
             author="dev2",
             branch="feature/dashboard",
+            references=["issue:PROJ-102"],
         ),
     ]
 
@@ -151,7 +166,121 @@ def _get_mock_workflow_graph() -> WorkflowGraph:
     return WorkflowGraph(nodes=nodes, edges=edges)
 
 
-@router.get("/healthz", summary="Health check endpoint")
+def _pack(*bodies: bytes) -> bytes:
+    """Length-prefix and concatenate bodies into one shared-store value."""
+    return b"".join(len(body).to_bytes(8, "big") + body for body in bodies)
+
+
+def _unpack(value: bytes) -> list[bytes]:
+    bodies, offset = [], 0
+    while offset < len(value):
+        size = int.from_bytes(value[offset:offset + 8], "big")
+        bodies.append(value[offset + 8:offset + 8 + size])
+        offset += 8 + size
+    return bodies
+
+
+class MockSnapshot:
+    """Serialized /mock/events and /mock/workflow bodies, built once.
+
+    In "generated" mode the built-in demo data is rendered on first use and
+    kept for the life of the process. In "warehouse" mode the events and
+    graph come from the local warehouse and are rebuilt only when its write
+    generation changes, so polling never re-normalizes unchanged data. Under
+    steady ingestion the full bodies are re-rendered at most once per
+    ``mock_refresh_interval``; paged graph queries read the warehouse
+    directly and are always current.
+
+    ``store`` is the warehouse that paged graph queries read from; in
+    "generated" mode it is an in-memory one holding the demo graph.
+
+    The rendered bodies are kept in the shared state store, so with several
+    workers the data is rendered once and every worker serves the same
+    ETags.
+    """
+
+    def __init__(self, source: str = "generated"):
+        self.source = source
+        self.generation: int | None = None
+        self.events: CachedBody | None = None
+        self.workflow: CachedBody | None = None
+        self.store: EventWarehouse | None = None
+        self.built_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def _build(self, generation: int | None) -> None:
+        if self.source == "warehouse":
+            from app.services.warehouse import warehouse
+
+            self.store = warehouse
+            if generation == 0:
+                # Empty warehouse: seed it from the pipeline's JSON output
+                warehouse.load_directory(settings.warehouse_seed_dir)
+                generation = warehouse.generation
+
+        # Workers share the rendered bodies, so every worker serves the same
+        # bytes (and ETags) and only the first one to get here renders them
+        key = self._shared_key(generation)
+        if self.events is not None and generation != self.generation:
+            shared_store.delete(self._shared_key(self.generation))
+        shared = shared_store.get(key)
+        if shared is None:
+            events_body, workflow_body = self._render()
+            if not shared_store.add(key, _pack(events_body, workflow_body)):
+                shared = shared_store.get(key)
+        if shared is not None:
+            events_body, workflow_body = _unpack(shared)
+
+        if self.source != "warehouse":
+            # Paged graph queries read the same graph the full body holds
+            self.store = EventWarehouse()
+            self.store.replace_graph(GraphEnvelope.model_validate_json(workflow_body).workflow_graph)
+
+        self.events = cached_body(events_body)
+        self.workflow = cached_body(workflow_body)
+        self.generation = generation
+        self.built_at = time.monotonic()
+
+    def _shared_key(self, generation: int | None) -> str:
+        return f"mock_snapshot:{settings.app_version}:{self.source}:{generation}"
+
+    def _render(self) -> tuple[bytes, bytes]:
+        """Serialize the /mock/events and /mock/workflow bodies from the data source."""
+        if self.source == "warehouse":
+            events = self.store.query_events()
+            graph = self.store.get_graph()
+        else:
+            events = _get_mock_raw_events()
+            graph = _get_mock_workflow_graph()
+        return (
+            model_body(RawEventsPayload(raw_events=events)).body,
+            model_body(GraphEnvelope(workflow_graph=graph)).body,
+        )
+
+    async def refresh(self) -> None:
+        """Rebuild the bodies if they are missing or the warehouse changed."""
+        generation = None
+        if self.source == "warehouse":
+            from app.services.warehouse import warehouse
+
+            generation = await asyncio.to_thread(lambda: warehouse.generation)
+        if self.events is not None and (
+            generation == self.generation
+            or time.monotonic() - self.built_at < settings.mock_refresh_interval
+        ):
+            cache_lookup("mock_snapshot", hit=True)
+            return
+        cache_lookup("mock_snapshot", hit=False)
+        async with self._lock:
+            if self.events is None or generation != self.generation:
+                await asyncio.to_thread(self._build, generation)
+
+
+# Singleton instance
+mock_snapshot = MockSnapshot(settings.mock_data_source)
+
+
+@router.get("/healthz", summary="Health check endpoint", response_class=OrjsonResponse)
 async def health_check() -> dict:
     """Check if the service is healthy."""
     return {"status": "healthy", "service": "flowsight-mock-tool"}
@@ -166,7 +295,7 @@ async def health_check() -> dict:
     "to demonstrate the ingestion agent's normalization capabilities.",
     operation_id="get_mock_events",
 )
-async def get_mock_events() -> RawEventsPayload:
+async def get_mock_events(request: Request) -> Response:
     """
     Fetch mock project events from various source systems.
 
@@ -177,8 +306,10 @@ async def get_mock_events() -> RawEventsPayload:
     - Jira issues
 
     These events can be processed by the ingestion agent to create a workflow graph.
+    The body is pre-serialized; clients sending ``If-None-Match`` get a 304 when unchanged.
     """
-    return RawEventsPayload(raw_events=_get_mock_raw_events())
+    await mock_snapshot.refresh()
+    return cached_response(request, mock_snapshot.events, settings.mock_cache_max_age)
 
 
 @router.get(
@@ -187,10 +318,27 @@ async def get_mock_events() -> RawEventsPayload:
     summary="Get prebuilt workflow graph",
     description="Returns a ready-made workflow graph for fast demos. Use this endpoint "
     "when you want to skip the normalization step and directly test analysis, "
-    "bottleneck detection, or recommendation agents.",
+    "bottleneck detection, or recommendation agents. With any filter, cursor, limit "
+    "or fields parameter the graph is returned in pages of nodes ordered by creation "
+    "time, each with the edges leaving its nodes and a next_cursor for the next page.",
     operation_id="get_mock_workflow",
 )
-async def get_mock_workflow() -> GraphEnvelope:
+@traced("get_mock_workflow")
+async def get_mock_workflow(
+    request: Request,
+    type: list[str] | None = Query(None, description="Node types to include (repeatable)"),
+    status: list[str] | None = Query(None, description="Node statuses to include (repeatable)"),
+    since: datetime | None = Query(None, description="Only nodes created at or after this time"),
+    until: datetime | None = Query(None, description="Only nodes created before this time"),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
+    limit: int | None = Query(
+        None, ge=1, le=MAX_GRAPH_PAGE_SIZE, description=f"Nodes per page (default {GRAPH_PAGE_SIZE})"
+    ),
+    fields: str | None = Query(
+        None, description=f"Comma-separated node fields to return ({', '.join(NODE_FIELDS)})"
+    ),
+    include_edges: bool = Query(True, description="Include the edges leaving each page's nodes"),
+) -> Response:
     """
     Fetch a prebuilt workflow graph.
 
@@ -199,8 +347,30 @@ async def get_mock_workflow() -> GraphEnvelope:
     - Edges showing relationships (triggers, depends_on, blocks)
 
     This is useful for fast demos or testing downstream agents.
+    The body is pre-serialized; clients sending ``If-None-Match`` get a 304 when unchanged.
+    Query parameters switch to paged reads served from the graph indexes.
     """
-    return GraphEnvelope(workflow_graph=_get_mock_workflow_graph())
+    await mock_snapshot.refresh()
+    paged = any(p is not None for p in (type, status, since, until, cursor, limit, fields))
+    if not paged and include_edges:
+        return cached_response(request, mock_snapshot.workflow, settings.mock_cache_max_age)
+
+    try:
+        page = await asyncio.to_thread(
+            graph_page,
+            mock_snapshot.store,
+            type=type,
+            status=status,
+            since=since,
+            until=until,
+            cursor=cursor,
+            limit=limit or GRAPH_PAGE_SIZE,
+            fields=fields,
+            include_edges=include_edges,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return cached_response(request, json_body(page), settings.mock_cache_max_age)
 
 
 def _get_mock_branches() -> list[dict]:
@@ -345,15 +515,34 @@ def _get_mock_branch_details() -> dict[str, dict]:
     }
 
 
+@cache
+def _branches_body() -> CachedBody:
+    """The /mock/branches payload, encoded once."""
+    return json_body({"branches": _get_mock_branches()})
+
+
+@cache
+def _branch_detail_bodies() -> dict[str, CachedBody]:
+    """Encoded /mock/branch/{id} payloads for every known branch."""
+    bodies = {branch_id: json_body(detail) for branch_id, detail in _get_mock_branch_details().items()}
+    # Basic info for branches without detailed analysis
+    for branch in _get_mock_branches():
+        if branch["id"] not in bodies:
+            bodies[branch["id"]] = json_body(
+                {**branch, "owner": "Unknown", "bottleneck": None, "recommendation": None}
+            )
+    return bodies
+
+
 @router.get(
     "/mock/branches",
     summary="Get all branches for Flow page",
     description="Returns all branches with their status and relationships.",
     operation_id="get_mock_branches",
 )
-async def get_mock_branches() -> dict:
+async def get_mock_branches(request: Request) -> Response:
     """Fetch all branches for the Flow page visualization."""
-    return {"branches": _get_mock_branches()}
+    return cached_response(request, _branches_body(), settings.mock_cache_max_age)
 
 
 @router.get(
@@ -362,16 +551,12 @@ async def get_mock_branches() -> dict:
     description="Returns detailed branch info including AI-detected bottlenecks and recommendations.",
     operation_id="get_mock_branch_detail",
 )
-async def get_mock_branch_detail(branch_id: str) -> dict:
+async def get_mock_branch_detail(branch_id: str, request: Request) -> Response:
     """Fetch detailed branch info for hover panel."""
-    details = _get_mock_branch_details()
-    if branch_id in details:
-        return details[branch_id]
-    # Return basic info for branches without detailed analysis
-    branches = {b["id"]: b for b in _get_mock_branches()}
-    if branch_id in branches:
-        return {**branches[branch_id], "owner": "Unknown", "bottleneck": None, "recommendation": None}
-    return {"error": "Branch not found", "id": branch_id}
+    body = _branch_detail_bodies().get(branch_id)
+    if body is not None:
+        return cached_response(request, body, settings.mock_cache_max_age)
+    return OrjsonResponse({"error": "Branch not found", "id": branch_id})
 
 
 @router.post(
@@ -387,8 +572,10 @@ async def normalize_events(payload: RawEventsPayload) -> GraphEnvelope:
     Normalize raw events into a workflow graph.
 
     This endpoint accepts raw events from various sources and:
-    1. Creates nodes for each event
-    2. Infers edges based on temporal and logical relationships
+    1. Creates nodes for commits, PRs, CI runs, issues and deployments
+       (messages and meetings only contribute references)
+    2. Links events through their reference keys (``pr:145``, ``issue:PAY-102``,
+       ``commit:<sha>``), resolved with exact ``ReferenceIndex`` lookups
     3. Returns a structured workflow graph
     """
     graph = normalize_events_to_graph(payload.raw_events)
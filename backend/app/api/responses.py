@@ -0,0 +1,17 @@
+"""Response classes for the API."""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class OrjsonResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    For routes returning plain dicts and lists. Routes with a Pydantic
+    ``response_model`` are already serialized to bytes by Pydantic itself.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
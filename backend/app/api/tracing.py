@@ -0,0 +1,78 @@
+"""Request spans and the ``Server-Timing`` response header."""
+
+import re
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.api.metrics import route_template
+from app.core.tracing import SPAN_KIND_SERVER, STATUS_ERROR, Span, collect_request_spans, span
+
+# Server-Timing metric names are HTTP tokens
+_NON_TOKEN = re.compile(r"[^A-Za-z0-9!#$%&'*+.^_`|~-]")
+
+
+def server_timing(spans: list[Span], total_ms: float) -> str:
+    """
+    Render finished spans as a ``Server-Timing`` header value.
+
+    Spans sharing a name (e.g. a retried upstream call) are summed, with
+    the call count in ``desc``. ``total`` is the time until headers were sent.
+    """
+    durations: dict[str, list[float]] = {}
+    for finished in spans:
+        entry = durations.setdefault(_NON_TOKEN.sub("_", finished.name), [0.0, 0])
+        entry[0] += finished.duration_ms
+        entry[1] += 1
+    parts = [
+        f'{name};desc="x{count}";dur={ms:.1f}' if count > 1 else f"{name};dur={ms:.1f}"
+        for name, (ms, count) in durations.items()
+    ]
+    parts.append(f"total;dur={total_ms:.1f}")
+    return ", ".join(parts)
+
+
+class TracingMiddleware:
+    """ASGI middleware opening a server span per request and adding ``Server-Timing``.
+
+    The span continues an incoming ``traceparent`` and is renamed to the
+    matched route template once routing has run. Spans finished before the
+    response headers go out (for /chat: graph loading, context
+    serialization, IAM, the upstream POST and parsing) are listed in the
+    header; streaming responses only report what finished before the
+    first chunk.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        headers = Headers(scope=scope)
+        with span(
+            f"{method} {scope['path']}",
+            kind=SPAN_KIND_SERVER,
+            traceparent=headers.get("traceparent"),
+            **{"http.method": method, "http.target": scope["path"]},
+        ) as request_span, collect_request_spans() as finished:
+
+            async def send_with_timing(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    route = route_template(scope)
+                    request_span.name = f"{method} {route}"
+                    request_span.set_attribute("http.route", route)
+                    request_span.set_attribute("http.status_code", message["status"])
+                    if message["status"] >= 500:
+                        request_span.status = STATUS_ERROR
+                    response_headers = MutableHeaders(scope=message)
+                    response_headers.append(
+                        "Server-Timing", server_timing(list(finished), request_span.duration_ms)
+                    )
+                    response_headers.append("traceparent", request_span.traceparent())
+                await send(message)
+
+            await self.app(scope, receive, send_with_timing)
@@ -0,0 +1,148 @@
+"""Webhook receivers for incremental ingestion from GitHub, Jira and Slack."""
+
+import hashlib
+import hmac
+import json
+import time
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import JSONResponse
+
+from app.api.responses import OrjsonResponse
+from app.core.settings import settings
+from app.services.ingest_queue import WebhookDelivery, ingest_queue
+
+router = APIRouter(prefix="/webhooks", tags=["webhooks"])
+
+# Slack rejects replays older than five minutes; so do we
+SLACK_MAX_CLOCK_SKEW_SECONDS = 300
+
+
+def _verify_hub_signature(secret: str, body: bytes, signature: str | None) -> None:
+    """Verify a ``sha256=<hex>`` HMAC header (GitHub, Jira Cloud)."""
+    if not secret:
+        return
+    expected = "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    if not signature or not hmac.compare_digest(expected, signature):
+        raise HTTPException(status_code=401, detail="Invalid webhook signature")
+
+
+def _verify_slack_signature(body: bytes, timestamp: str | None, signature: str | None) -> None:
+    """Verify Slack's ``v0`` request signature."""
+    if not settings.slack_signing_secret:
+        return
+    try:
+        skew = abs(time.time() - int(timestamp or ""))
+    except ValueError:
+        raise HTTPException(status_code=401, detail="Missing Slack request timestamp")
+    if skew > SLACK_MAX_CLOCK_SKEW_SECONDS:
+        raise HTTPException(status_code=401, detail="Stale Slack request")
+
+    basestring = b"v0:" + timestamp.encode() + b":" + body
+    expected = "v0=" + hmac.new(
+        settings.slack_signing_secret.encode(), basestring, hashlib.sha256
+    ).hexdigest()
+    if not signature or not hmac.compare_digest(expected, signature):
+        raise HTTPException(status_code=401, detail="Invalid Slack signature")
+
+
+def _parse_body(body: bytes) -> dict:
+    """Parse a JSON webhook body."""
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Webhook body must be JSON")
+    if not isinstance(payload, dict):
+        raise HTTPException(status_code=400, detail="Webhook body must be a JSON object")
+    return payload
+
+
+def _enqueue(delivery: WebhookDelivery) -> JSONResponse:
+    """Hand a delivery to the ingest queue and acknowledge with 202."""
+    if not ingest_queue.submit(delivery):
+        return JSONResponse(
+            status_code=503,
+            content={"status": "rejected", "detail": "Ingest queue is full or not running"},
+            headers={"Retry-After": "5"},
+        )
+    return JSONResponse(
+        status_code=202,
+        content={"status": "accepted", "source": delivery.source, "event": delivery.event_name},
+    )
+
+
+@router.post(
+    "/github",
+    status_code=202,
+    summary="Receive GitHub webhook deliveries",
+    description="Accepts push, pull_request, workflow_run and deployment_status events.",
+)
+async def github_webhook(request: Request) -> JSONResponse:
+    """Queue a GitHub webhook delivery for processing."""
+    body = await request.body()
+    _verify_hub_signature(
+        settings.github_webhook_secret, body, request.headers.get("X-Hub-Signature-256")
+    )
+    event_name = request.headers.get("X-GitHub-Event", "")
+    if event_name == "ping":
+        return JSONResponse(status_code=200, content={"status": "pong"})
+
+    return _enqueue(WebhookDelivery(source="github", event_name=event_name, payload=_parse_body(body)))
+
+
+@router.post(
+    "/jira",
+    status_code=202,
+    summary="Receive Jira webhook deliveries",
+    description="Accepts jira:issue_created and jira:issue_updated events.",
+)
+async def jira_webhook(request: Request) -> JSONResponse:
+    """Queue a Jira webhook delivery for processing."""
+    body = await request.body()
+    _verify_hub_signature(
+        settings.jira_webhook_secret, body, request.headers.get("X-Hub-Signature")
+    )
+    payload = _parse_body(body)
+
+    return _enqueue(
+        WebhookDelivery(source="jira", event_name=payload.get("webhookEvent", ""), payload=payload)
+    )
+
+
+@router.post(
+    "/slack",
+    status_code=202,
+    summary="Receive Slack Events API callbacks",
+    description="Accepts message events; answers the url_verification handshake inline.",
+)
+async def slack_webhook(request: Request) -> JSONResponse:
+    """Queue a Slack event callback for processing."""
+    body = await request.body()
+    _verify_slack_signature(
+        body,
+        request.headers.get("X-Slack-Request-Timestamp"),
+        request.headers.get("X-Slack-Signature"),
+    )
+    payload = _parse_body(body)
+
+    # Slack expects the challenge echoed back synchronously
+    if payload.get("type") == "url_verification":
+        return JSONResponse(status_code=200, content={"challenge": payload.get("challenge", "")})
+
+    event_name = payload.get("event", {}).get("type", payload.get("type", ""))
+    return _enqueue(WebhookDelivery(source="slack", event_name=event_name, payload=payload))
+
+
+@router.get(
+    "/status",
+    summary="Ingest queue status",
+    description="Returns queue depth and processing counters for webhook ingestion.",
+    response_class=OrjsonResponse,
+)
+async def webhook_status() -> dict:
+    """Report ingest queue health."""
+    return {
+        "running": ingest_queue.running,
+        "queue_depth": ingest_queue.depth,
+        **ingest_queue.stats,
+    }
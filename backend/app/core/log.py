@@ -0,0 +1,243 @@
+"""Structured, non-blocking application logging.
+
+Every module logs through ``get_logger(__name__)``. ``configure_logging``
+attaches a single ``QueueHandler`` to the ``app`` logger: callers only
+format the record and put it on an in-memory queue, while a background
+``QueueListener`` thread does the actual stream writes. Nothing on the
+event loop blocks on stdout/stderr.
+
+Records are redacted (bearer tokens, API keys, Slack/GitHub tokens) before
+they are queued. Verbose debug payloads go through ``log_payload``, which
+is a no-op unless DEBUG is enabled, samples a fraction of calls and
+truncates what it keeps.
+
+Formats:
+    text   ``2026-01-01T12:00:00.000Z INFO app.services.x message key=value``
+    json   one JSON object per line (for log shippers)
+    plain  message only; used by the pipeline CLIs so their ✓ output is unchanged
+
+CLIs log synchronously (``use_queue=False``) so progress lines interleave
+correctly with their printed summaries.
+"""
+
+import atexit
+import logging
+import queue
+import random
+import re
+import sys
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any
+
+import orjson
+
+ROOT_LOGGER = "app"
+
+REDACTED = "[REDACTED]"
+REDACT_PATTERNS = (
+    # Authorization headers
+    (re.compile(r"(Bearer\s+)[A-Za-z0-9._~+/=-]+", re.IGNORECASE), r"\1" + REDACTED),
+    # key=value / "key": "value" pairs for credential-like keys
+    (
+        re.compile(
+            r"""(["']?(?:access_token|refresh_token|id_token|api_?key|apikey|token|password|secret|client_secret)["']?\s*[:=]\s*["']?)[^"'\s,&}]+""",
+            re.IGNORECASE,
+        ),
+        r"\1" + REDACTED,
+    ),
+    # Slack bot/user/app tokens
+    (re.compile(r"xox[abposr]-[A-Za-z0-9-]+"), REDACTED),
+    # GitHub personal/OAuth/app tokens
+    (re.compile(r"gh[pousr]_[A-Za-z0-9]{20,}"), REDACTED),
+)
+# Cheap pre-check: messages containing none of these (lower-cased) skip the patterns
+_REDACT_HINTS = ("bearer", "token", "key", "password", "secret", "xox", "gh")
+
+# LogRecord attributes that are not user-supplied ``extra`` fields
+_RECORD_FIELDS = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime", "sample_rate"}
+
+_listener: QueueListener | None = None
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Logger for a module (pass ``__name__``)."""
+    return logging.getLogger(name)
+
+
+def redact(text: str) -> str:
+    """Mask credentials in ``text``."""
+    lowered = text.lower()
+    if not any(hint in lowered for hint in _REDACT_HINTS):
+        return text
+    for pattern, replacement in REDACT_PATTERNS:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+def _extras(record: logging.LogRecord) -> dict[str, Any]:
+    """``extra={...}`` fields attached to a record."""
+    return {k: v for k, v in record.__dict__.items() if k not in _RECORD_FIELDS}
+
+
+class RedactingFilter(logging.Filter):
+    """Render the message once and mask credentials in it and its extra fields."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.msg = redact(record.getMessage())
+        record.args = None
+        for key in record.__dict__.keys() - _RECORD_FIELDS:
+            value = record.__dict__[key]
+            if isinstance(value, str):
+                record.__dict__[key] = redact(value)
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """Drop records logged with ``extra={"sample_rate": r}`` with probability ``1 - r``."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        rate = getattr(record, "sample_rate", None)
+        return rate is None or rate >= 1.0 or random.random() < rate
+
+
+class StructuredFormatter(logging.Formatter):
+    """Formats records as ``text``, ``json`` or ``plain`` lines."""
+
+    def __init__(self, fmt: str = "text"):
+        super().__init__()
+        self.fmt = fmt
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+
+        if self.fmt == "plain":
+            return f"{message}\n{record.exc_text}" if record.exc_text else message
+
+        timestamp = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created))
+        timestamp += f".{int(record.msecs):03d}Z"
+        extras = _extras(record)
+
+        if self.fmt == "json":
+            entry = {
+                "ts": timestamp,
+                "level": record.levelname,
+                "logger": record.name,
+                "msg": message,
+                **extras,
+            }
+            if record.exc_text:
+                entry["exc"] = record.exc_text
+            return orjson.dumps(entry, default=str).decode()
+
+        line = f"{timestamp} {record.levelname:<7} {record.name} {message}"
+        if extras:
+            line += " " + " ".join(f"{k}={v}" for k, v in extras.items())
+        return f"{line}\n{record.exc_text}" if record.exc_text else line
+
+
+class _PreparedQueueHandler(QueueHandler):
+    """QueueHandler that keeps ``extra`` fields and exception text for the listener's formatter.
+
+    The record is handed over as-is (no copy): this is the only handler on
+    the ``app`` logger and ``RedactingFilter`` has already merged its args.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.exc_info:
+            # Tracebacks can't cross threads safely; render them now
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def configure_logging(level: str | None = None, fmt: str | None = None, use_queue: bool = True) -> None:
+    """
+    Route all ``app.*`` loggers through a single redacting handler.
+
+    Safe to call more than once; later calls replace the handler and level.
+
+    Args:
+        level: Log level name (default: ``settings.log_level``)
+        fmt: "text", "json" or "plain" (default: ``settings.log_format``)
+        use_queue: Hand records to a background writer thread. CLIs pass
+            False so log lines stay in order with their own print() output.
+    """
+    global _listener
+    from app.core.settings import settings
+
+    level = (level or settings.log_level).upper()
+    fmt = fmt or settings.log_format
+    if fmt not in ("text", "json", "plain"):
+        raise ValueError(f"Unknown log format: {fmt!r} (expected text, json or plain)")
+
+    shutdown_logging()
+
+    # CLIs print their progress to stdout; the server logs to stderr
+    stream_handler = logging.StreamHandler(sys.stdout if fmt == "plain" else sys.stderr)
+    stream_handler.setFormatter(StructuredFormatter(fmt))
+
+    if use_queue:
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        handler: logging.Handler = _PreparedQueueHandler(log_queue)
+        _listener = QueueListener(log_queue, stream_handler)
+        _listener.start()
+    else:
+        handler = stream_handler
+    handler.addFilter(SamplingFilter())
+    handler.addFilter(RedactingFilter())
+
+    logger = logging.getLogger(ROOT_LOGGER)
+    logger.handlers = [handler]
+    logger.setLevel(level)
+    logger.propagate = False
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the writer thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(shutdown_logging)
+
+
+def log_payload(logger: logging.Logger, label: str, payload: Any, sample_rate: float | None = None) -> None:
+    """
+    Log a large debug payload (request/response bodies) cheaply.
+
+    Does nothing unless ``logger`` has DEBUG enabled; otherwise keeps
+    ``sample_rate`` of calls and truncates the serialized payload to
+    ``settings.log_payload_max_chars``. The payload is only serialized
+    for records that are actually kept.
+
+    Args:
+        logger: Module logger
+        label: Short description ("watsonx chat request")
+        payload: str, bytes or JSON-serializable value
+        sample_rate: Fraction of calls to log (default: ``settings.log_debug_sample_rate``)
+    """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    from app.core.settings import settings
+
+    rate = settings.log_debug_sample_rate if sample_rate is None else sample_rate
+    if rate < 1.0 and random.random() >= rate:
+        return
+
+    limit = settings.log_payload_max_chars
+    if isinstance(payload, bytes):
+        text = payload[:limit].decode(errors="replace")
+        size = len(payload)
+    elif isinstance(payload, str):
+        text, size = payload[:limit], len(payload)
+    else:
+        encoded = orjson.dumps(payload, default=str)
+        text, size = encoded[:limit].decode(errors="replace"), len(encoded)
+
+    suffix = f"... ({size - limit} more chars)" if size > limit else ""
+    logger.debug("%s: %s%s", label, text, suffix, extra={"payload_size": size})
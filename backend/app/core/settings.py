@@ -16,6 +16,34 @@ class Settings(BaseSettings):
     # API settings
     api_v1_prefix: str = "/api/v1"
 
+    # Logging (see app/core/log.py)
+    log_level: str = "INFO"
+    log_format: str = "text"  # "text", "json" or "plain"
+    # Fraction of verbose DEBUG payload logs (upstream request/response bodies) kept
+    log_debug_sample_rate: float = 0.1
+    # Longest payload excerpt written per DEBUG record
+    log_payload_max_chars: int = 2000
+
+    # Request tracing: OTel-style spans and the Server-Timing header
+    tracing_enabled: bool = True
+    trace_buffer_size: int = 2048  # recent spans kept in memory
+    trace_export_path: str = ""  # append spans as OTLP/JSON lines here (empty = memory only)
+
+    # Prometheus metrics at /metrics (request latency, upstream calls, caches)
+    metrics_enabled: bool = True
+
+    # Response compression (brotli is used when the brotli package is installed)
+    compression_minimum_size: int = 1024  # bytes; smaller bodies are sent as-is
+    gzip_level: int = 6
+    brotli_quality: int = 5
+
+    # Production serving (python -m app.serve)
+    # Worker processes; 0 = one per available CPU
+    web_concurrency: int = 0
+    # SQLite file for state shared by the workers (IAM token, mock bodies).
+    # Empty = per-process; app.serve picks a file under /dev/shm for multiple workers
+    shared_state_path: str = ""
+
     # Stub mode - returns mock responses without calling watsonx
     stub_mode: bool = True
 
@@ -31,6 +59,48 @@ class Settings(BaseSettings):
     watsonx_agent_id: str = ""
     # Agent environment ID: "draft" for testing, or deployment ID for live
     watsonx_agent_env_id: str = "draft"
+    # IBM Cloud IAM token endpoint (overridable for the local fake server in benchmarks/)
+    watsonx_iam_url: str = "https://iam.cloud.ibm.com/identity/token"
+    # Pooled connections to IAM and Orchestrate, shared by all requests
+    watsonx_max_connections: int = 100
+    watsonx_max_keepalive: int = 20
+
+    # Create the watsonx connection pool and fetch an IAM token before serving
+    # (skipped in stub mode), so the first /chat after a cold start doesn't pay for it
+    startup_warmup: bool = True
+
+    # Background dependency checks behind /readyz (probes never call upstream)
+    health_check_interval: float = 30.0  # seconds between check rounds
+    health_check_timeout: float = 5.0  # per check
+    # Consecutive failed checks before a dependency makes the service unready
+    health_failure_threshold: int = 3
+
+    # Webhook ingestion
+    # Shared secrets used to verify webhook signatures (verification is skipped when empty)
+    github_webhook_secret: str = ""
+    jira_webhook_secret: str = ""
+    slack_signing_secret: str = ""
+    # In-process ingest queue sizing and micro-batching
+    ingest_queue_size: int = 10000
+    ingest_workers: int = 2
+    ingest_batch_size: int = 50
+    ingest_batch_timeout: float = 1.0  # seconds to wait while filling a batch
+    # Upsert ingested events into Astra DB (uses ASTRA_DB_TOKEN / ASTRA_DB_ENDPOINT)
+    ingest_upload_to_astra: bool = False
+    # Also store ingested events in the local warehouse
+    ingest_write_warehouse: bool = False
+
+    # Local event warehouse (SQLite), filled by app/pipeline/cli/load_warehouse.py
+    warehouse_path: str = "data/flowsight.db"
+    # JSON directory loaded into an empty warehouse when the mock API is data-backed
+    warehouse_seed_dir: str = "data"
+
+    # Mock API data: "generated" (built-in demo data) or "warehouse" (ingested events)
+    mock_data_source: str = "generated"
+    # Cache-Control max-age for /mock/events and /mock/workflow (0 = always revalidate via ETag)
+    mock_cache_max_age: int = 5
+    # Minimum seconds between re-renders of the full warehouse bodies under steady writes
+    mock_refresh_interval: float = 1.0
 
     class Config:
         env_file = ".env"
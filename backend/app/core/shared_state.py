@@ -0,0 +1,120 @@
+"""Key-value state shared by all worker processes on one host.
+
+With several uvicorn workers each process has its own memory, so a cache
+held in a Python object is filled once per worker: N workers mean N IAM
+token fetches and N differently-timestamped mock bodies (and therefore N
+ETags, so a client revalidating against another worker gets a full 200).
+
+``SharedStore`` keeps such values in a small SQLite file in WAL mode.
+Readers don't block each other or the writer, and ``add`` (insert unless
+a live value exists) doubles as a cross-process lease for "only one
+worker refreshes" logic. ``app.serve`` points it at a file under
+``/dev/shm`` (memory-backed) when it starts more than one worker; with an
+empty ``shared_state_path`` it is an in-memory database private to the
+process, which is all a single worker needs.
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from app.core.settings import settings
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS kv (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    expires_at REAL  -- unix time; NULL = never
+);
+"""
+
+
+class SharedStore:
+    """SQLite-backed bytes store with optional per-key expiry."""
+
+    def __init__(self, path: str = ""):
+        """Initialize the store (the database is opened on first use).
+
+        Args:
+            path: SQLite file shared by the workers, or "" for a per-process store
+        """
+        self.path = path or ":memory:"
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.RLock()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """The open connection, creating the database if needed."""
+        if self._conn is None:
+            with self._lock:
+                if self._conn is None:
+                    if self.path != ":memory:":
+                        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+                    # Autocommit: every statement is its own (atomic) transaction
+                    conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+                    conn.execute("PRAGMA busy_timeout=5000")
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.execute("PRAGMA synchronous=NORMAL")
+                    conn.executescript(SCHEMA)
+                    self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Close the connection (reopened on next use)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def get(self, key: str) -> bytes | None:
+        """The live value for ``key``, or None if missing or expired."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT value FROM kv WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (key, time.time()),
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        """Store ``value``, replacing any previous one."""
+        expires_at = time.time() + ttl if ttl else None
+        with self._lock:
+            self.conn.execute(
+                "INSERT INTO kv (key, value, expires_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value, expires_at = excluded.expires_at",
+                (key, value, expires_at),
+            )
+
+    def add(self, key: str, value: bytes, ttl: float | None = None) -> bool:
+        """
+        Store ``value`` only if ``key`` has no live value.
+
+        Atomic across processes, so it can be used as a lease: the worker
+        whose ``add`` succeeds does the work, the others wait for its result.
+
+        Returns:
+            True if this call stored the value
+        """
+        now = time.time()
+        expires_at = now + ttl if ttl else None
+        with self._lock:
+            cursor = self.conn.execute(
+                "INSERT INTO kv (key, value, expires_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value, expires_at = excluded.expires_at "
+                "WHERE kv.expires_at IS NOT NULL AND kv.expires_at <= ?",
+                (key, value, expires_at, now),
+            )
+        return cursor.rowcount > 0
+
+    def delete(self, key: str, value: bytes | None = None) -> None:
+        """Remove ``key`` (only while it still holds ``value``, when given)."""
+        with self._lock:
+            if value is None:
+                self.conn.execute("DELETE FROM kv WHERE key = ?", (key,))
+            else:
+                self.conn.execute("DELETE FROM kv WHERE key = ? AND value = ?", (key, value))
+
+
+# Singleton instance
+shared_store = SharedStore(settings.shared_state_path)
@@ -0,0 +1,272 @@
+"""Lightweight request tracing with OpenTelemetry-compatible spans.
+
+Spans use W3C trace-context IDs (32-hex trace ID, 16-hex span ID) and are
+exported in the OTLP/JSON span layout, so a collector or any OTel viewer
+can ingest them as-is. A ``traceparent`` header on an incoming request
+continues the caller's trace, and outgoing watsonx calls carry one too.
+
+The local exporter keeps recent spans in a ring buffer and, when
+``settings.trace_export_path`` is set, appends them as JSON lines from a
+background thread. Finished spans of the current request are also
+collected for the ``Server-Timing`` response header (see
+``app.api.tracing``).
+
+Usage::
+
+    with span("load_graph", nodes=len(nodes)):
+        ...
+
+    @traced("iam_token")
+    async def _get_access_token(self): ...
+"""
+
+import contextvars
+import functools
+import inspect
+import os
+import queue
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator
+
+import orjson
+
+from app.core.settings import settings
+
+# OTLP SpanKind values
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+
+# OTLP status codes
+STATUS_UNSET = 0
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+
+@dataclass
+class Span:
+    """One timed operation within a trace."""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None = None
+    kind: int = SPAN_KIND_INTERNAL
+    start_ns: int = 0
+    end_ns: int = 0
+    # perf_counter timestamps for accurate durations (wall clock is for export only)
+    start_perf: float = 0.0
+    end_perf: float = 0.0
+    attributes: dict[str, Any] = field(default_factory=dict)
+    status: int = STATUS_UNSET
+    status_message: str = ""
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end_perf or time.perf_counter()
+        return (end - self.start_perf) * 1000
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def traceparent(self) -> str:
+        """W3C ``traceparent`` header naming this span as the parent."""
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def to_otlp(self) -> dict[str, Any]:
+        """The span in OTLP/JSON field layout."""
+        entry: dict[str, Any] = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [{"key": k, "value": _otlp_value(v)} for k, v in self.attributes.items()],
+            "status": {"code": self.status},
+        }
+        if self.parent_id:
+            entry["parentSpanId"] = self.parent_id
+        if self.status_message:
+            entry["status"]["message"] = self.status_message
+        return entry
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    """Wrap an attribute value as an OTLP AnyValue."""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def parse_traceparent(header: str | None) -> tuple[str, str] | None:
+    """
+    Parse a W3C ``traceparent`` header.
+
+    Returns:
+        ``(trace_id, parent_span_id)``, or None if the header is missing or malformed
+    """
+    if not header:
+        return None
+    parts = header.strip().split("-")
+    if len(parts) < 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    trace_id, span_id = parts[1].lower(), parts[2].lower()
+    try:
+        int(trace_id, 16), int(span_id, 16)
+    except ValueError:
+        return None
+    if trace_id == "0" * 32 or span_id == "0" * 16:
+        return None
+    return trace_id, span_id
+
+
+class LocalSpanExporter:
+    """Keeps recent finished spans in memory and optionally appends them to a JSONL file."""
+
+    def __init__(self, buffer_size: int = 2048, path: str | None = None):
+        self._spans: deque[Span] = deque(maxlen=buffer_size)
+        self.path = path
+        self._queue: queue.SimpleQueue | None = None
+        if path:
+            self._queue = queue.SimpleQueue()
+            threading.Thread(target=self._write_loop, name="span-exporter", daemon=True).start()
+
+    def export(self, span: Span) -> None:
+        self._spans.append(span)
+        if self._queue is not None:
+            self._queue.put(span)
+
+    def recent(self, limit: int = 100, trace_id: str | None = None) -> list[dict[str, Any]]:
+        """Most recent spans (newest last) in OTLP/JSON layout."""
+        spans = [s for s in list(self._spans) if trace_id is None or s.trace_id == trace_id]
+        return [s.to_otlp() for s in spans[-limit:]]
+
+    def _write_loop(self) -> None:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "ab") as f:
+            while True:
+                batch = [self._queue.get()]
+                # Drain whatever else is waiting before flushing once
+                while True:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                f.write(b"".join(orjson.dumps(s.to_otlp()) + b"\n" for s in batch))
+                f.flush()
+
+
+# Singleton instance
+exporter = LocalSpanExporter(settings.trace_buffer_size, settings.trace_export_path or None)
+
+_current_span: contextvars.ContextVar[Span | None] = contextvars.ContextVar("current_span", default=None)
+# Finished spans of the current request, read by the Server-Timing middleware
+_request_spans: contextvars.ContextVar[list[Span] | None] = contextvars.ContextVar("request_spans", default=None)
+
+
+def current_span() -> Span | None:
+    return _current_span.get()
+
+
+def current_traceparent() -> str | None:
+    """``traceparent`` value for outgoing requests made inside the current span."""
+    active = _current_span.get()
+    return active.traceparent() if active else None
+
+
+@contextmanager
+def collect_request_spans() -> Iterator[list[Span]]:
+    """Collect every span finished within the block (including in threads and tasks it starts)."""
+    spans: list[Span] = []
+    token = _request_spans.set(spans)
+    try:
+        yield spans
+    finally:
+        _request_spans.reset(token)
+
+
+@contextmanager
+def span(
+    name: str,
+    kind: int = SPAN_KIND_INTERNAL,
+    traceparent: str | None = None,
+    **attributes: Any,
+) -> Iterator[Span]:
+    """
+    Time a block as a child of the current span (or a new root).
+
+    Args:
+        name: Span name; also the Server-Timing metric name
+        kind: OTLP span kind (``SPAN_KIND_*``)
+        traceparent: Incoming W3C header to continue a remote trace (root spans only)
+        **attributes: Initial span attributes
+
+    Yields:
+        The span, for adding attributes while it runs
+    """
+    parent = _current_span.get()
+    if parent is not None:
+        trace_id, parent_id = parent.trace_id, parent.span_id
+    else:
+        remote = parse_traceparent(traceparent)
+        trace_id, parent_id = remote if remote else (os.urandom(16).hex(), None)
+
+    current = Span(
+        name=name,
+        trace_id=trace_id,
+        span_id=os.urandom(8).hex(),
+        parent_id=parent_id,
+        kind=kind,
+        start_ns=time.time_ns(),
+        start_perf=time.perf_counter(),
+        attributes=attributes,
+    )
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.status = STATUS_ERROR
+        current.status_message = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        _current_span.reset(token)
+        current.end_perf = time.perf_counter()
+        current.end_ns = current.start_ns + int((current.end_perf - current.start_perf) * 1e9)
+        if settings.tracing_enabled:
+            exporter.export(current)
+            collected = _request_spans.get()
+            if collected is not None:
+                collected.append(current)
+
+
+def traced(name: str | None = None, kind: int = SPAN_KIND_INTERNAL) -> Callable:
+    """Decorator wrapping each call of a sync or async function in a span."""
+
+    def decorator(fn: Callable) -> Callable:
+        span_name = name or fn.__name__
+
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                with span(span_name, kind=kind):
+                    return await fn(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(span_name, kind=kind):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
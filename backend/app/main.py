@@ -1,11 +1,50 @@
 """FastAPI application entry point."""
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.api.mock import router as mock_router
+from app.api.compression import CompressionMiddleware
+from app.api.health import router as health_router
+from app.api.metrics import MetricsMiddleware
+from app.api.mock import mock_snapshot, router as mock_router
 from app.api.chat import router as chat_router
+from app.api.responses import OrjsonResponse
+from app.api.tracing import TracingMiddleware
+from app.api.webhooks import router as webhooks_router
+from app.core.log import configure_logging
+from app.core.metrics import registry
 from app.core.settings import settings
+from app.core.tracing import exporter
+from app.services.health import health_monitor
+from app.services.ingest_queue import astra_sink, ingest_queue, warehouse_sink
+from app.services.watsonx_client import watsonx_client
+
+# Log through a background writer thread so the event loop never blocks on stderr
+configure_logging()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start background ingestion workers and warm caches and pools before serving."""
+    if settings.ingest_upload_to_astra:
+        ingest_queue.add_sink(astra_sink())
+    if settings.ingest_write_warehouse:
+        ingest_queue.add_sink(warehouse_sink())
+    await ingest_queue.start()
+    # Load and serialize the mock payloads before the first request
+    await mock_snapshot.refresh()
+    if settings.startup_warmup and not settings.stub_mode:
+        await watsonx_client.warmup()
+    # Readiness follows the first dependency check round
+    await health_monitor.start()
+    yield
+    await health_monitor.stop()
+    await ingest_queue.stop()
+    await watsonx_client.aclose()
+
 
 app = FastAPI(
     title=settings.app_name,
@@ -18,6 +57,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -27,17 +67,46 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing", "traceparent"],
+)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.compression_minimum_size,
+    gzip_level=settings.gzip_level,
+    brotli_quality=settings.brotli_quality,
 )
+if settings.tracing_enabled:
+    app.add_middleware(TracingMiddleware)
+if settings.metrics_enabled:
+    # Outermost, so latency includes compression and CORS handling
+    app.add_middleware(MetricsMiddleware)
 
 # Mount routers
 app.include_router(mock_router, prefix=settings.api_v1_prefix)
 app.include_router(chat_router, prefix=settings.api_v1_prefix)
+app.include_router(webhooks_router, prefix=settings.api_v1_prefix)
 
 # Also mount health check at root level
 app.include_router(mock_router, prefix="", include_in_schema=False)
+# Probes (kept out of the OpenAPI spec imported into Orchestrate)
+app.include_router(health_router, include_in_schema=False)
+
+
+@app.get("/metrics", include_in_schema=False, response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    """Prometheus scrape endpoint."""
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+if settings.debug:
+
+    @app.get("/debug/traces", include_in_schema=False, response_class=OrjsonResponse)
+    async def debug_traces(limit: int = 100, trace_id: str | None = None):
+        """Recently finished spans in OTLP/JSON layout (debug mode only)."""
+        return {"spans": exporter.recent(limit, trace_id)}
 
 
-@app.get("/", include_in_schema=False)
+@app.get("/", include_in_schema=False, response_class=OrjsonResponse)
 async def root():
     """Root endpoint with API information."""
     return {
@@ -46,11 +115,15 @@ async def root():
         "docs": "/docs",
         "openapi": "/openapi.json",
         "health": "/healthz",
+        "liveness": "/livez",
+        "readiness": "/readyz",
         "endpoints": {
             "chat": "/api/v1/chat",
             "chat_stream": "/api/v1/chat/stream",
             "chat_health": "/api/v1/chat/health",
             "mock_events": "/api/v1/mock/events",
             "mock_workflow": "/api/v1/mock/workflow",
+            "webhooks": "/api/v1/webhooks/{github,jira,slack}",
+            "metrics": "/metrics",
         },
     }
@@ -9,7 +9,7 @@ from pydantic import BaseModel, Field
 class RawEvent(BaseModel):
     """A raw event from any source system (Git, GitHub, Jira, CI, etc.)."""
 
-    source: Literal["git", "github", "jira", "ci", "slack"]
+    source: Literal["git", "github", "jira", "ci", "slack", "teams"]
     type: str
     id: str
     timestamp: datetime
@@ -20,6 +20,10 @@ class RawEvent(BaseModel):
     assignee: str | None = None
     conclusion: str | None = None
     key: str | None = None  # For Jira issues
+    # Artifacts this event points at, e.g. ["pr:145", "issue:PAY-102", "commit:a1b2c3"]
+    references: list[str] | None = None
+    # For interval events (e.g. a Jira issue's time in one status)
+    duration_hours: float | None = None
 
     class Config:
         json_schema_extra = {
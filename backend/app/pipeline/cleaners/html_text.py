@@ -0,0 +1,165 @@
+"""Streaming HTML-to-text extraction for chat message bodies.
+
+Teams message bodies are HTML, sometimes large (tables, code blocks,
+embedded card markup). ``html_to_text`` walks the body once and stops as
+soon as the output cap is reached, so a multi-megabyte body costs no more
+than its first few KB. All HTML entities are decoded, script/style content
+is dropped, and block-level tags become word breaks instead of gluing
+words together.
+
+Bodies made of plain tags (the vast majority) go through a single-pass tag
+tokenizer; anything with comments, declarations or skipped elements is fed
+in chunks to :class:`HTMLTextExtractor`, an ``html.parser`` subclass.
+"""
+
+import re
+from html import unescape
+from html.parser import HTMLParser
+
+# Default cap on extracted characters per body
+DEFAULT_MAX_CHARS = 20000
+
+# Size of each slice handed to the parser
+FEED_CHUNK_SIZE = 8192
+
+# Elements whose content is never user-visible text
+SKIP_TAGS = frozenset({"script", "style", "template", "head", "title", "noscript"})
+
+# Elements that imply a word break before/after their content
+BLOCK_TAGS = frozenset({
+    "address", "article", "attachment", "blockquote", "br", "dd", "div", "dl", "dt",
+    "footer", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "li", "ol", "p",
+    "pre", "section", "table", "tbody", "td", "tfoot", "th", "thead", "tr", "ul",
+})
+
+# A start/end tag; quoted attribute values may contain ">"
+_TAG_BODY = r"""(?:[^>"']|"[^"]*"|'[^']*')*>"""
+_TAG_RE = re.compile(r"</?[a-zA-Z][^\s/>]*" + _TAG_BODY)
+_BLOCK_TAG_RE = re.compile(
+    r"</?(?:" + "|".join(sorted(BLOCK_TAGS, key=len, reverse=True)) + r")(?=[\s/>])" + _TAG_BODY,
+    re.I,
+)
+
+# Markup only the full parser handles correctly
+_PARSER_ONLY_RE = re.compile(r"<(?:[!?]|/?(?:script|style|template|head|title|noscript)\b)", re.I)
+
+
+class HTMLTextExtractor(HTMLParser):
+    """Collect visible text from HTML, stopping after ``max_chars`` characters."""
+
+    def __init__(self, max_chars: int = DEFAULT_MAX_CHARS):
+        super().__init__(convert_charrefs=True)
+        self.max_chars = max_chars
+        self.truncated = False
+        self._parts: list[str] = []
+        self._length = 0
+        # Raw length at which to re-check the collapsed output length
+        self._check_at = max_chars
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        if tag in SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag in BLOCK_TAGS:
+            self._parts.append(" ")
+
+    def handle_startendtag(self, tag: str, attrs: list) -> None:
+        # Self-closing <br/>, <hr/>: a break, and never opens a skip block
+        if tag in BLOCK_TAGS:
+            self._parts.append(" ")
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in SKIP_TAGS:
+            if self._skip_depth:
+                self._skip_depth -= 1
+        elif tag in BLOCK_TAGS:
+            self._parts.append(" ")
+
+    def handle_data(self, data: str) -> None:
+        if self._skip_depth or self.truncated:
+            return
+        self._parts.append(data)
+        self._length += len(data)
+        if self._length >= self._check_at:
+            # Raw text overstates the output (whitespace collapses), so
+            # only stop once the collapsed text actually fills the cap
+            missing = self.max_chars - len(_collapse(self._parts))
+            if missing <= 0:
+                self.truncated = True
+            else:
+                self._check_at = self._length + missing
+
+    def text(self) -> str:
+        """Return the collected text with whitespace collapsed and the cap applied."""
+        return _collapse(self._parts)[: self.max_chars]
+
+
+def _collapse(parts: list[str]) -> str:
+    """Join text fragments and collapse runs of whitespace."""
+    return " ".join("".join(parts).split())
+
+
+def _tokenize(html_text: str, max_chars: int) -> str | None:
+    """
+    Fast path for bodies made of ordinary tags.
+
+    The body is processed in slices cut just before a ``<`` (so no tag is
+    split), and processing stops once the output cap is filled.
+
+    Returns:
+        Extracted text, or None if the body needs the full parser
+    """
+    parts: list[str] = []
+    length = 0
+    pos = 0
+    size = len(html_text)
+
+    while pos < size:
+        end = html_text.find("<", pos + FEED_CHUNK_SIZE) if size - pos > FEED_CHUNK_SIZE else -1
+        if end == -1:
+            end = size
+        chunk = html_text[pos:end]
+        if _PARSER_ONLY_RE.search(chunk):
+            return None
+        chunk = _TAG_RE.sub("", _BLOCK_TAG_RE.sub(" ", chunk))
+        if "&" in chunk:
+            # Entities never span a cut, which is always at a "<"
+            chunk = unescape(chunk)
+        parts.append(chunk)
+        length += len(chunk)
+        pos = end
+        if length >= max_chars and len(_collapse(parts)) >= max_chars:
+            break
+
+    return _collapse(parts)[:max_chars]
+
+
+def html_to_text(html_text: str, max_chars: int = DEFAULT_MAX_CHARS) -> str:
+    """
+    Convert an HTML fragment to plain text.
+
+    Args:
+        html_text: HTML body (plain text is returned with whitespace collapsed)
+        max_chars: Maximum number of characters to return
+
+    Returns:
+        Visible text with entities decoded and whitespace collapsed
+    """
+    # Plain-text bodies need no parsing at all
+    if "<" not in html_text:
+        text = unescape(html_text) if "&" in html_text else html_text
+        return " ".join(text.split())[:max_chars]
+
+    text = _tokenize(html_text, max_chars)
+    if text is not None:
+        return text
+
+    parser = HTMLTextExtractor(max_chars=max_chars)
+    for start in range(0, len(html_text), FEED_CHUNK_SIZE):
+        parser.feed(html_text[start:start + FEED_CHUNK_SIZE])
+        if parser.truncated:
+            break
+    else:
+        parser.close()
+
+    return parser.text()
@@ -3,6 +3,26 @@
 from datetime import datetime
 from typing import Any
 
+from app.core.log import get_logger
+from app.pipeline.cleaners.parallel import clean_records
+from app.pipeline.cleaners.stats import StatsAccumulator
+from app.pipeline.cleaners.text_scan import extract_references
+
+logger = get_logger(__name__)
+
+# Lower-cased issue type / status -> enrichment counter name
+ISSUE_TYPE_COUNTS = {
+    "bug": "bugs_count",
+    "story": "stories_count",
+    "task": "tasks_count",
+    "epic": "epics_count",
+}
+ISSUE_STATUS_COUNTS = {
+    "blocked": "blocked_count",
+    "in progress": "in_progress_count",
+    "done": "done_count",
+}
+
 
 class JiraCleaner:
     """Clean and normalize Jira data for FlowSight."""
@@ -82,6 +102,27 @@ class JiraCleaner:
         if issue.get("time_tracking"):
             cleaned["time_tracking"] = self._clean_time_tracking(issue["time_tracking"])
 
+        # Status history: normalize names so intervals match the current status
+        if issue.get("status_history"):
+            cleaned["status_history"] = [
+                {**interval, "status": self._normalize_status(interval["status"])}
+                for interval in issue["status_history"]
+            ]
+        if issue.get("time_in_status"):
+            time_in_status: dict[str, float] = {}
+            for status, hours in issue["time_in_status"].items():
+                status = self._normalize_status(status)
+                time_in_status[status] = round(time_in_status.get(status, 0) + hours, 2)
+            cleaned["time_in_status"] = time_in_status
+
+        # PRs / other issues named in the summary (excluding the issue itself)
+        references = [
+            ref for ref in extract_references(cleaned["summary"])
+            if not (ref["type"] == "issue" and ref["id"] == key)
+        ]
+        if references:
+            cleaned["references"] = references
+
         # Cache for relationship resolution
         self.issue_cache[cleaned["key"]] = cleaned
 
@@ -202,62 +243,74 @@ class JiraCleaner:
         return categories
 
     def enrich_with_metadata(self, data: dict[str, Any]) -> dict[str, Any]:
-        """Add metadata and statistics to cleaned data."""
+        """Add metadata and statistics to cleaned data (one pass over issues)."""
         issues = data.get("issues", [])
 
-        # Calculate statistics
-        total_issues = len(issues)
-        total_story_points = sum(
-            issue.get("story_points", 0) for issue in issues if issue.get("story_points")
-        )
+        stats = StatsAccumulator()
+        # Type and status buckets, as in categorize_issues
+        type_counts = stats.counter("types")
+        status_counts = stats.counter("statuses")
+        priority_counts = stats.counter("priority")
+        assignee_counts = stats.counter("assignee")
+        story_points = 0
 
-        # Categorize
-        categories = self.categorize_issues(issues)
-
-        # Count by priority
-        priority_counts = {}
         for issue in issues:
+            points = issue.get("story_points")
+            if points:
+                story_points += points
+            issue_type = issue.get("type", "")
+            type_counts[issue_type] = type_counts.get(issue_type, 0) + 1
+            status = issue.get("status", "")
+            status_counts[status] = status_counts.get(status, 0) + 1
             priority = issue.get("priority", "Unknown")
             priority_counts[priority] = priority_counts.get(priority, 0) + 1
-
-        # Count by assignee
-        assignee_counts = {}
-        for issue in issues:
             assignee = issue.get("assignee", "Unassigned")
             if assignee:
                 assignee_counts[assignee] = assignee_counts.get(assignee, 0) + 1
 
+        # Fold raw type/status values into the lower-cased buckets
+        categories = dict.fromkeys([*ISSUE_TYPE_COUNTS.values(), *ISSUE_STATUS_COUNTS.values()], 0)
+        for issue_type, count in type_counts.items():
+            name = ISSUE_TYPE_COUNTS.get(issue_type.lower())
+            if name:
+                categories[name] += count
+        for status, count in status_counts.items():
+            name = ISSUE_STATUS_COUNTS.get(status.lower())
+            if name:
+                categories[name] += count
+
         # Add enrichment metadata
         data["enrichment"] = {
-            "total_issues": total_issues,
-            "total_story_points": total_story_points,
-            "bugs_count": len(categories["bugs"]),
-            "stories_count": len(categories["stories"]),
-            "tasks_count": len(categories["tasks"]),
-            "epics_count": len(categories["epics"]),
-            "blocked_count": len(categories["blocked"]),
-            "in_progress_count": len(categories["in_progress"]),
-            "done_count": len(categories["done"]),
-            "priority_distribution": priority_counts,
-            "assignee_distribution": assignee_counts,
+            "total_issues": len(issues),
+            "total_story_points": story_points,
+            **categories,
+            "priority_distribution": stats.distribution("priority"),
+            "assignee_distribution": stats.distribution("assignee"),
         }
 
         return data
 
-    def clean_all(self, jira_data: dict[str, Any]) -> dict[str, Any]:
+    def clean_all(
+        self, jira_data: dict[str, Any], workers: int = 1, chunk_size: int = 2000
+    ) -> dict[str, Any]:
         """
         Clean all Jira data.
 
+        Args:
+            jira_data: Extracted Jira dataset
+            workers: Processes used to clean issues (1 = serial, 0 = one per CPU)
+            chunk_size: Issues per worker task
+
         Returns cleaned and normalized dataset.
         """
-        print("Cleaning Jira data...")
+        logger.info("Cleaning Jira data...")
 
         cleaned_data = {}
 
         # Clean project
         if "project" in jira_data:
             cleaned_data["project"] = self.clean_project(jira_data["project"])
-            print("✓ Project cleaned")
+            logger.info("✓ Project cleaned")
 
         # Clean sprints
         if "sprints" in jira_data:
@@ -267,20 +320,26 @@ class JiraCleaner:
                 cleaned_sprints.append(cleaned_sprint)
 
             cleaned_data["sprints"] = cleaned_sprints
-            print(f"✓ {len(cleaned_sprints)} sprints cleaned")
+            logger.info("✓ %s sprints cleaned", len(cleaned_sprints))
 
         # Clean issues
         if "issues" in jira_data:
-            cleaned_issues = []
-            for issue in jira_data["issues"]:
-                cleaned_issue = self.clean_issue(issue)
-                cleaned_issues.append(cleaned_issue)
+            cleaned_issues = clean_records(
+                self,
+                "clean_issue",
+                jira_data["issues"],
+                workers=workers,
+                chunk_size=chunk_size,
+            )
+            # Workers filled their own caches; rebuild ours for relationship resolution
+            for cleaned_issue in cleaned_issues:
+                self.issue_cache[cleaned_issue["key"]] = cleaned_issue
 
             # Deduplicate
             cleaned_issues = self.deduplicate_issues(cleaned_issues)
 
             cleaned_data["issues"] = cleaned_issues
-            print(f"✓ {len(cleaned_issues)} issues cleaned")
+            logger.info("✓ %s issues cleaned", len(cleaned_issues))
 
         # Add enrichment metadata
         cleaned_data = self.enrich_with_metadata(cleaned_data)
@@ -292,6 +351,6 @@ class JiraCleaner:
             "cleaning_version": "1.0.0",
         }
 
-        print("✓ Jira data cleaning complete")
+        logger.info("✓ Jira data cleaning complete")
 
         return cleaned_data
@@ -0,0 +1,89 @@
+"""Process-pool sharding for CPU-bound record cleaning.
+
+Records are split into fixed-size chunks and cleaned by worker processes,
+each holding its own cleaner instance. Lookup caches built by the parent
+(e.g. the Slack channel cache) are shipped to every worker once, through the
+pool initializer, and treated as read-only there. ``ProcessPoolExecutor.map``
+yields chunk results in submission order, so the merged output is identical
+to a serial run.
+
+Workers are started through a fork server rather than forked from the
+caller: the pipeline cleans from orchestrator threads while other stages
+hold HTTP and logging locks, and a child forked mid-way would inherit those
+locks held. Everything a worker needs arrives through the initializer.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+# forkserver where available (POSIX), spawn elsewhere; never a plain fork
+MP_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+# Per-process cleaner, created by _init_worker
+_worker_cleaner: Any = None
+
+
+def _init_worker(cleaner_cls: type, shared_state: dict[str, Any]) -> None:
+    """Create this worker's cleaner and install the shared read-only caches."""
+    global _worker_cleaner
+    _worker_cleaner = cleaner_cls()
+    for attr, value in shared_state.items():
+        setattr(_worker_cleaner, attr, value)
+
+
+def _clean_chunk(method_name: str, records: list[dict[str, Any]]) -> list[Any]:
+    """Clean one chunk of records in a worker process."""
+    clean = getattr(_worker_cleaner, method_name)
+    return [clean(record) for record in records]
+
+
+def resolve_workers(workers: int | None) -> int:
+    """Normalize a worker count (0 or None means one per CPU)."""
+    if not workers:
+        return os.cpu_count() or 1
+    return max(1, workers)
+
+
+def clean_records(
+    cleaner: Any,
+    method_name: str,
+    records: list[dict[str, Any]],
+    workers: int = 1,
+    chunk_size: int = 2000,
+    shared_attrs: tuple[str, ...] = (),
+) -> list[Any]:
+    """
+    Apply ``cleaner.<method_name>`` to every record, optionally in parallel.
+
+    Args:
+        cleaner: Cleaner instance (its class is re-instantiated in workers)
+        method_name: Per-record method to call, e.g. ``"clean_message"``
+        records: Records to clean
+        workers: Number of processes (1 = serial in this process, 0 = one per CPU)
+        chunk_size: Records per task sent to a worker
+        shared_attrs: Cleaner attributes copied read-only into every worker
+
+    Returns:
+        Cleaned results in input order (``None`` entries are preserved)
+    """
+    workers = resolve_workers(workers)
+    if workers == 1 or len(records) <= chunk_size:
+        clean = getattr(cleaner, method_name)
+        return [clean(record) for record in records]
+
+    shared_state = {attr: getattr(cleaner, attr) for attr in shared_attrs}
+    chunks = [records[i:i + chunk_size] for i in range(0, len(records), chunk_size)]
+
+    results: list[Any] = []
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(chunks)),
+        mp_context=multiprocessing.get_context(MP_START_METHOD),
+        initializer=_init_worker,
+        initargs=(type(cleaner), shared_state),
+    ) as pool:
+        for chunk_result in pool.map(_clean_chunk, [method_name] * len(chunks), chunks):
+            results.extend(chunk_result)
+
+    return results
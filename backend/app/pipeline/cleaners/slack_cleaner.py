@@ -2,7 +2,13 @@
 
 from datetime import datetime
 from typing import Any
-import re
+
+from app.core.log import get_logger
+from app.pipeline.cleaners.parallel import clean_records
+from app.pipeline.cleaners.stats import StatsAccumulator
+from app.pipeline.cleaners.text_scan import extract_references, scan_slack_text
+
+logger = get_logger(__name__)
 
 
 class SlackCleaner:
@@ -59,14 +65,8 @@ class SlackCleaner:
         user_id = message.get("user", "unknown")
         username = message.get("username", user_id)
 
-        # Clean text - remove Slack formatting
-        text = self._clean_text(message.get("text", ""))
-
-        # Extract and clean mentions
-        mentions = self._extract_mentions(message.get("text", ""))
-
-        # Extract issue/PR references
-        references = self._extract_references(message.get("text", ""))
+        # Clean text and extract mentions / issue+PR references in one pass
+        text, mentions, references = scan_slack_text(message.get("text", ""))
 
         cleaned = {
             "ts": message.get("ts"),
@@ -95,42 +95,15 @@ class SlackCleaner:
 
     def _clean_text(self, text: str) -> str:
         """Remove Slack formatting from text."""
-        # Remove user mentions <@U123>
-        text = re.sub(r"<@[\w]+>", "", text)
-
-        # Remove channel mentions <#C123|channel-name>
-        text = re.sub(r"<#[\w]+\|[\w-]+>", "", text)
-
-        # Remove URLs <http://example.com|example>
-        text = re.sub(r"<https?://[^|>]+\|([^>]+)>", r"\1", text)
-        text = re.sub(r"<https?://[^>]+>", "", text)
-
-        # Clean up whitespace
-        text = " ".join(text.split())
-
-        return text.strip()
+        return scan_slack_text(text)[0]
 
     def _extract_mentions(self, text: str) -> list[str]:
         """Extract user mentions from text."""
-        # Find all <@USER_ID> patterns
-        mentions = re.findall(r"<@([\w]+)>", text)
-        return list(set(mentions))  # Deduplicate
+        return scan_slack_text(text)[1]
 
     def _extract_references(self, text: str) -> list[dict[str, str]]:
         """Extract issue/PR references from text."""
-        references = []
-
-        # GitHub PR references: PR-123, #123
-        pr_refs = re.findall(r"(?:PR-|#)(\d+)", text)
-        for pr_num in pr_refs:
-            references.append({"type": "pull_request", "id": pr_num})
-
-        # Jira issue references: PROJ-123, PAY-456
-        jira_refs = re.findall(r"([A-Z]+-\d+)", text)
-        for issue_key in jira_refs:
-            references.append({"type": "issue", "id": issue_key})
-
-        return references
+        return extract_references(text)
 
     def _clean_reactions(self, reactions: list[dict]) -> list[dict]:
         """Clean and normalize reactions."""
@@ -161,57 +134,59 @@ class SlackCleaner:
         return unique
 
     def enrich_with_metadata(self, data: dict[str, Any]) -> dict[str, Any]:
-        """Add metadata and statistics to cleaned data."""
+        """Add metadata and statistics to cleaned data (one pass over messages)."""
         messages = data.get("messages", [])
 
-        # Calculate statistics
-        total_messages = len(messages)
-        thread_count = len([m for m in messages if m.get("is_thread_reply")])
-        unique_users = len(set(m.get("user") for m in messages if m.get("user")))
-
-        # Extract top mentioned users
-        all_mentions = []
-        for msg in messages:
-            all_mentions.extend(msg.get("mentions", []))
-
-        mention_counts = {}
-        for mention in all_mentions:
-            mention_counts[mention] = mention_counts.get(mention, 0) + 1
+        stats = StatsAccumulator()
+        see_user = stats.distinct("users").add
+        mention_counts = stats.counter("mentions")
+        reference_types = stats.counter("reference_types")
+        thread_replies = 0
 
-        top_mentions = sorted(mention_counts.items(), key=lambda x: x[1], reverse=True)[:5]
-
-        # Extract referenced issues/PRs
-        all_references = []
         for msg in messages:
-            all_references.extend(msg.get("references", []))
+            if msg.get("is_thread_reply"):
+                thread_replies += 1
+            user = msg.get("user")
+            if user:
+                see_user(user)
+            for mention in msg.get("mentions", ()):
+                mention_counts[mention] = mention_counts.get(mention, 0) + 1
+            for reference in msg.get("references", ()):
+                ref_type = reference["type"]
+                reference_types[ref_type] = reference_types.get(ref_type, 0) + 1
 
         # Add enrichment metadata
         data["enrichment"] = {
-            "total_messages": total_messages,
-            "thread_replies": thread_count,
-            "unique_users": unique_users,
-            "top_mentioned_users": [{"user": u, "count": c} for u, c in top_mentions],
-            "total_references": len(all_references),
-            "pr_references": len([r for r in all_references if r["type"] == "pull_request"]),
-            "issue_references": len([r for r in all_references if r["type"] == "issue"]),
+            "total_messages": len(messages),
+            "thread_replies": thread_replies,
+            "unique_users": stats.distinct_count("users"),
+            "top_mentioned_users": [{"user": u, "count": c} for u, c in stats.top("mentions", 5)],
+            **stats.reference_summary(),
         }
 
         return data
 
-    def clean_all(self, slack_data: dict[str, Any]) -> dict[str, Any]:
+    def clean_all(
+        self, slack_data: dict[str, Any], workers: int = 1, chunk_size: int = 2000
+    ) -> dict[str, Any]:
         """
         Clean all Slack data.
 
+        Args:
+            slack_data: Extracted Slack dataset
+            workers: Processes used to clean messages (1 = serial, 0 = one per CPU)
+            chunk_size: Messages per worker task
+
         Returns cleaned and normalized dataset.
         """
-        print("Cleaning Slack data...")
+        logger.info("Cleaning Slack data...")
 
         cleaned_data = {}
 
         # Clean workspace (if present)
         if "workspace" in slack_data:
             cleaned_data["workspace"] = slack_data["workspace"]  # Already a string
-            print("✓ Workspace cleaned")
+            logger.info("✓ Workspace cleaned")
 
         # Clean channels
         if "channels" in slack_data:
@@ -221,15 +196,22 @@ class SlackCleaner:
                 cleaned_channels.append(cleaned_channel)
 
             cleaned_data["channels"] = cleaned_channels
-            print(f"✓ {len(cleaned_channels)} channels cleaned")
+            logger.info("✓ %s channels cleaned", len(cleaned_channels))
 
         # Clean messages
         if "messages" in slack_data:
             cleaned_messages = []
             skipped = 0
 
-            for message in slack_data["messages"]:
-                cleaned_msg = self.clean_message(message)
+            results = clean_records(
+                self,
+                "clean_message",
+                slack_data["messages"],
+                workers=workers,
+                chunk_size=chunk_size,
+                shared_attrs=("channel_cache",),
+            )
+            for cleaned_msg in results:
                 if cleaned_msg:
                     cleaned_messages.append(cleaned_msg)
                 else:
@@ -239,7 +221,7 @@ class SlackCleaner:
             cleaned_messages = self.deduplicate_messages(cleaned_messages)
 
             cleaned_data["messages"] = cleaned_messages
-            print(f"✓ {len(cleaned_messages)} messages cleaned ({skipped} skipped)")
+            logger.info("✓ %s messages cleaned (%s skipped)", len(cleaned_messages), skipped)
 
         # Add enrichment metadata
         cleaned_data = self.enrich_with_metadata(cleaned_data)
@@ -251,6 +233,6 @@ class SlackCleaner:
             "cleaning_version": "1.0.0",
         }
 
-        print("✓ Slack data cleaning complete")
+        logger.info("✓ Slack data cleaning complete")
 
         return cleaned_data
@@ -0,0 +1,60 @@
+"""Single-pass statistics accumulator for cleaner enrichment metadata.
+
+Each cleaner's ``enrich_with_metadata`` walks its records once and feeds
+this accumulator, instead of re-scanning (and re-listing) the records for
+every statistic. Memory is bounded by the number of distinct keys being
+counted, not by the number of records.
+
+Hot loops bind the underlying containers once (``counter("x")``,
+``distinct("x").add``) so the per-record cost is a plain dict/set update
+rather than an accumulator method call. Counters are plain dicts updated
+with ``d[k] = d.get(k, 0) + 1``, which is markedly faster per increment
+than ``collections.Counter`` item assignment.
+"""
+
+from typing import Any
+
+
+class StatsAccumulator:
+    """Key counters and distinct-value sets filled in one scan."""
+
+    __slots__ = ("counters", "sets")
+
+    def __init__(self):
+        self.counters: dict[str, dict[Any, int]] = {}
+        self.sets: dict[str, set] = {}
+
+    def counter(self, name: str) -> dict[Any, int]:
+        """Key -> count dict for a distribution (keys keep first-seen order)."""
+        counts = self.counters.get(name)
+        if counts is None:
+            counts = self.counters[name] = {}
+        return counts
+
+    def distinct(self, name: str) -> set:
+        """Set collecting the distinct values of ``name``."""
+        values = self.sets.get(name)
+        if values is None:
+            values = self.sets[name] = set()
+        return values
+
+    def distribution(self, name: str) -> dict[Any, int]:
+        """Counts per key as a plain dict."""
+        return dict(self.counters.get(name, {}))
+
+    def distinct_count(self, name: str) -> int:
+        """Number of distinct values seen."""
+        return len(self.sets.get(name, ()))
+
+    def top(self, name: str, n: int) -> list[tuple[Any, int]]:
+        """The ``n`` most frequent keys (ties in first-seen order)."""
+        return sorted(self.counters.get(name, {}).items(), key=lambda x: x[1], reverse=True)[:n]
+
+    def reference_summary(self) -> dict[str, int]:
+        """Counts from the ``"reference_types"`` counter in enrichment-dict shape."""
+        reference_types = self.counters.get("reference_types", {})
+        return {
+            "total_references": sum(reference_types.values()),
+            "pr_references": reference_types.get("pull_request", 0),
+            "issue_references": reference_types.get("issue", 0),
+        }
@@ -2,12 +2,22 @@
 
 from datetime import datetime
 from typing import Any
-import re
+
+from app.core.log import get_logger
+from app.pipeline.cleaners.html_text import html_to_text
+from app.pipeline.cleaners.parallel import clean_records
+from app.pipeline.cleaners.stats import StatsAccumulator
+from app.pipeline.cleaners.text_scan import extract_references
+
+logger = get_logger(__name__)
 
 
 class TeamsCleaner:
     """Clean and normalize Teams data for FlowSight."""
 
+    # Longest plain-text body kept per message; the original HTML is retained
+    MAX_BODY_CHARS = 20000
+
     def __init__(self):
         """Initialize Teams cleaner."""
         self.channel_cache = {}
@@ -127,37 +137,12 @@ class TeamsCleaner:
         return cleaned
 
     def _clean_html(self, html_text: str) -> str:
-        """Remove HTML tags from text."""
-        # Remove HTML tags
-        text = re.sub(r"<[^>]+>", "", html_text)
-
-        # Decode HTML entities
-        text = text.replace("&nbsp;", " ")
-        text = text.replace("&amp;", "&")
-        text = text.replace("&lt;", "<")
-        text = text.replace("&gt;", ">")
-        text = text.replace("&quot;", '"')
-
-        # Clean up whitespace
-        text = " ".join(text.split())
-
-        return text.strip()
+        """Convert an HTML body to plain text (capped at MAX_BODY_CHARS)."""
+        return html_to_text(html_text, max_chars=self.MAX_BODY_CHARS)
 
     def _extract_references(self, text: str) -> list[dict[str, str]]:
         """Extract issue/PR references from text."""
-        references = []
-
-        # GitHub PR references: PR-123, #123
-        pr_refs = re.findall(r"(?:PR-|#)(\d+)", text)
-        for pr_num in pr_refs:
-            references.append({"type": "pull_request", "id": pr_num})
-
-        # Jira issue references: PROJ-123, PAY-456
-        jira_refs = re.findall(r"([A-Z]+-\d+)", text)
-        for issue_key in jira_refs:
-            references.append({"type": "issue", "id": issue_key})
-
-        return references
+        return extract_references(text)
 
     def deduplicate_messages(self, messages: list[dict]) -> list[dict]:
         """Remove duplicate messages based on ID."""
@@ -186,59 +171,64 @@ class TeamsCleaner:
         return unique
 
     def enrich_with_metadata(self, data: dict[str, Any]) -> dict[str, Any]:
-        """Add metadata and statistics to cleaned data."""
+        """Add metadata and statistics to cleaned data (one pass per collection)."""
         messages = data.get("messages", [])
         meetings = data.get("meetings", [])
 
-        # Calculate message statistics
-        total_messages = len(messages)
-        unique_senders = len(set(m.get("from") for m in messages if m.get("from")))
+        stats = StatsAccumulator()
+        see_sender = stats.distinct("senders").add
+        importance_counts = stats.counter("importance")
+        reference_types = stats.counter("reference_types")
 
-        # Extract importance distribution
-        importance_counts = {}
         for msg in messages:
+            sender = msg.get("from")
+            if sender:
+                see_sender(sender)
             importance = msg.get("importance", "normal")
             importance_counts[importance] = importance_counts.get(importance, 0) + 1
+            for reference in msg.get("references", ()):
+                ref_type = reference["type"]
+                reference_types[ref_type] = reference_types.get(ref_type, 0) + 1
 
         # Calculate meeting statistics
         total_meetings = len(meetings)
         total_attendees = sum(m.get("attendee_count", 0) for m in meetings)
         avg_attendees = total_attendees / total_meetings if total_meetings > 0 else 0
 
-        # Extract referenced issues/PRs
-        all_references = []
-        for msg in messages:
-            all_references.extend(msg.get("references", []))
-
         # Add enrichment metadata
         data["enrichment"] = {
-            "total_messages": total_messages,
-            "unique_senders": unique_senders,
-            "importance_distribution": importance_counts,
+            "total_messages": len(messages),
+            "unique_senders": stats.distinct_count("senders"),
+            "importance_distribution": stats.distribution("importance"),
             "total_meetings": total_meetings,
             "total_attendees": total_attendees,
             "avg_attendees_per_meeting": round(avg_attendees, 1),
-            "total_references": len(all_references),
-            "pr_references": len([r for r in all_references if r["type"] == "pull_request"]),
-            "issue_references": len([r for r in all_references if r["type"] == "issue"]),
+            **stats.reference_summary(),
         }
 
         return data
 
-    def clean_all(self, teams_data: dict[str, Any]) -> dict[str, Any]:
+    def clean_all(
+        self, teams_data: dict[str, Any], workers: int = 1, chunk_size: int = 2000
+    ) -> dict[str, Any]:
         """
         Clean all Teams data.
 
+        Args:
+            teams_data: Extracted Teams dataset
+            workers: Processes used to clean messages (1 = serial, 0 = one per CPU)
+            chunk_size: Messages per worker task
+
         Returns cleaned and normalized dataset.
         """
-        print("Cleaning Teams data...")
+        logger.info("Cleaning Teams data...")
 
         cleaned_data = {}
 
         # Clean team
         if "team" in teams_data:
             cleaned_data["team"] = self.clean_team(teams_data["team"])
-            print("✓ Team cleaned")
+            logger.info("✓ Team cleaned")
 
         # Clean channels
         if "channels" in teams_data:
@@ -248,15 +238,21 @@ class TeamsCleaner:
                 cleaned_channels.append(cleaned_channel)
 
             cleaned_data["channels"] = cleaned_channels
-            print(f"✓ {len(cleaned_channels)} channels cleaned")
+            logger.info("✓ %s channels cleaned", len(cleaned_channels))
 
         # Clean messages
         if "messages" in teams_data:
             cleaned_messages = []
             skipped = 0
 
-            for message in teams_data["messages"]:
-                cleaned_msg = self.clean_message(message)
+            results = clean_records(
+                self,
+                "clean_message",
+                teams_data["messages"],
+                workers=workers,
+                chunk_size=chunk_size,
+            )
+            for cleaned_msg in results:
                 if cleaned_msg:
                     cleaned_messages.append(cleaned_msg)
                 else:
@@ -266,7 +262,7 @@ class TeamsCleaner:
             cleaned_messages = self.deduplicate_messages(cleaned_messages)
 
             cleaned_data["messages"] = cleaned_messages
-            print(f"✓ {len(cleaned_messages)} messages cleaned ({skipped} skipped)")
+            logger.info("✓ %s messages cleaned (%s skipped)", len(cleaned_messages), skipped)
 
         # Clean meetings
         if "meetings" in teams_data:
@@ -284,7 +280,7 @@ class TeamsCleaner:
             cleaned_meetings = self.deduplicate_meetings(cleaned_meetings)
 
             cleaned_data["meetings"] = cleaned_meetings
-            print(f"✓ {len(cleaned_meetings)} meetings cleaned ({skipped} skipped)")
+            logger.info("✓ %s meetings cleaned (%s skipped)", len(cleaned_meetings), skipped)
 
         # Add enrichment metadata
         cleaned_data = self.enrich_with_metadata(cleaned_data)
@@ -296,6 +292,6 @@ class TeamsCleaner:
             "cleaning_version": "1.0.0",
         }
 
-        print("✓ Teams data cleaning complete")
+        logger.info("✓ Teams data cleaning complete")
 
         return cleaned_data
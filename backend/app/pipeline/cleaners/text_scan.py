@@ -0,0 +1,114 @@
+"""Single-pass tokenizer for chat message text.
+
+Slack and Teams cleaners need three things from every message: the text
+with markup stripped, the user mentions, and the PR / Jira references.
+``scan_slack_text`` produces all three from one ``finditer`` pass over a
+module-level compiled pattern instead of re-scanning the message once per
+``re.sub`` / ``re.findall`` call.
+"""
+
+import re
+
+# One alternation covering every token we care about. Order matters: markup
+# tokens are tried first so references inside them are handled explicitly.
+_TOKEN_RE = re.compile(
+    r"<@(?P<mention>\w+)>"  # <@U123>
+    r"|<#\w+\|[\w-]+>"  # <#C123|channel-name>
+    r"|<(?P<url>https?://[^|>]+)(?:\|(?P<label>[^>]+))?>"  # <http://x|label> / <http://x>
+    r"|(?P<jira>[A-Z]+-\d+)"  # PAY-123 (also PR-123)
+    r"|#(?P<hash>\d+)"  # #123
+)
+
+# Reference-only pattern for cleaned text and for link tokens
+_REF_RE = re.compile(r"([A-Z]+-\d+)|#(\d+)")
+
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_HTML_ENTITY_RE = re.compile(r"&(?:nbsp|amp|lt|gt|quot);")
+_HTML_ENTITIES = {"&nbsp;": " ", "&amp;": "&", "&lt;": "<", "&gt;": ">", "&quot;": '"'}
+
+
+def _collect_references(
+    pairs: list[tuple[str, str]], pr_ids: list[str], issue_ids: list[str]
+) -> None:
+    """Record ``(jira, hash)`` group pairs from a reference match."""
+    for jira, number in pairs:
+        if jira:
+            issue_ids.append(jira)
+            # "PR-12" (or "XPR-12") is both a Jira-style key and a PR reference
+            prefix, _, digits = jira.rpartition("-")
+            if prefix.endswith("PR"):
+                pr_ids.append(digits)
+        elif number:
+            pr_ids.append(number)
+
+
+def _build_references(pr_ids: list[str], issue_ids: list[str]) -> list[dict[str, str]]:
+    """PR references first, then issue references (matches the cleaners' output)."""
+    return [{"type": "pull_request", "id": pr} for pr in pr_ids] + [
+        {"type": "issue", "id": key} for key in issue_ids
+    ]
+
+
+def scan_slack_text(text: str) -> tuple[str, list[str], list[dict[str, str]]]:
+    """
+    Clean Slack markup and extract mentions and references in one pass.
+
+    Returns:
+        (cleaned_text, mentions, references) where mentions are unique user
+        IDs in first-seen order and references are ``{"type", "id"}`` dicts
+    """
+    parts: list[str] = []
+    mentions: dict[str, None] = {}
+    pr_ids: list[str] = []
+    issue_ids: list[str] = []
+    pos = 0
+
+    for match in _TOKEN_RE.finditer(text):
+        mention, url, label, jira, number = match.groups()
+
+        # Plain-text references stay in the cleaned text
+        if jira:
+            issue_ids.append(jira)
+            prefix, _, digits = jira.rpartition("-")
+            if prefix.endswith("PR"):
+                pr_ids.append(digits)
+            continue
+        if number:
+            pr_ids.append(number)
+            continue
+
+        # Markup token: cut it out of the cleaned text
+        start, end = match.span()
+        parts.append(text[pos:start])
+        pos = end
+
+        if mention:
+            mentions[mention] = None
+        elif url:
+            # Links can carry references in the URL or label; the label is kept
+            _collect_references(_REF_RE.findall(match.group(0)), pr_ids, issue_ids)
+            if label:
+                parts.append(label)
+        # Channel mentions are dropped entirely
+
+    if pos:
+        parts.append(text[pos:])
+        text = "".join(parts)
+
+    return " ".join(text.split()), list(mentions), _build_references(pr_ids, issue_ids)
+
+
+def extract_references(text: str) -> list[dict[str, str]]:
+    """Extract PR / Jira references from already-cleaned text in one pass."""
+    pr_ids: list[str] = []
+    issue_ids: list[str] = []
+    _collect_references(_REF_RE.findall(text), pr_ids, issue_ids)
+    return _build_references(pr_ids, issue_ids)
+
+
+def strip_html(html_text: str) -> str:
+    """Remove HTML tags, decode common entities and collapse whitespace."""
+    text = _HTML_TAG_RE.sub("", html_text)
+    if "&" in text:
+        text = _HTML_ENTITY_RE.sub(lambda m: _HTML_ENTITIES[m.group(0)], text)
+    return " ".join(text.split())
@@ -6,11 +6,13 @@ import os
 import sys
 from pathlib import Path
 
+from app.core.log import configure_logging
 from app.pipeline.extractors.github_extractor import GitHubExtractor
 
 
 def main():
     """Run GitHub data extraction pipeline."""
+    configure_logging(fmt="plain", use_queue=False)
     parser = argparse.ArgumentParser(
         description="Extract GitHub repository data for FlowSight AI"
     )
@@ -44,6 +46,12 @@ def main():
         action="store_true",
         help="Generate embeddings using watsonx.ai before upload",
     )
+    parser.add_argument(
+        "--embedding-checkpoint",
+        default="data/.cache/embeddings.db",
+        help="Per-record embedding progress, so an interrupted run resumes "
+        "(default: data/.cache/embeddings.db)",
+    )
 
     args = parser.parse_args()
 
@@ -83,7 +91,11 @@ def main():
                 from app.pipeline.core.embedding_strategy import HybridEmbeddingStrategy
 
                 embedding_strategy = HybridEmbeddingStrategy()
-                data = embedding_strategy.embed_github_data(data)
+                data = embedding_strategy.embed_github_data(
+                    data,
+                    checkpoint_path=args.embedding_checkpoint,
+                    job_id=f"github:{args.repo}",
+                )
 
                 # Save updated data with embeddings
                 import json
@@ -10,6 +10,7 @@ from pathlib import Path
 backend_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(backend_root))
 
+from app.core.log import configure_logging
 from app.pipeline.extractors.jira_extractor import JiraExtractor
 from app.pipeline.cleaners.jira_cleaner import JiraCleaner
 from app.pipeline.core.transformer import transform_jira_to_raw_events
@@ -17,6 +18,7 @@ from app.pipeline.core.transformer import transform_jira_to_raw_events
 
 def main():
     """Run Jira data extraction pipeline."""
+    configure_logging(fmt="plain", use_queue=False)
     parser = argparse.ArgumentParser(
         description="Extract Jira project data for FlowSight AI"
     )
@@ -46,6 +48,24 @@ def main():
         "--board-id",
         help="Board ID for extracting sprints (optional)",
     )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes used for cleaning (default: 1, 0 = one per CPU)",
+    )
+    parser.add_argument(
+        "--max-issues",
+        type=int,
+        default=100,
+        help="Maximum number of issues to extract (default: 100, 0 = all)",
+    )
+    parser.add_argument(
+        "--no-history",
+        action="store_true",
+        help="Skip changelog expansion (no status history / time in status)",
+    )
 
     args = parser.parse_args()
 
@@ -74,13 +94,15 @@ def main():
         data = extractor.extract_all(
             project_key=args.project_key,
             board_id=args.board_id,
-            output_path=args.output
+            output_path=args.output,
+            max_issues=args.max_issues or None,
+            include_history=not args.no_history,
         )
 
         # Clean data
         print("\nCleaning data...")
         cleaner = JiraCleaner()
-        cleaned_data = cleaner.clean_all(data)
+        cleaned_data = cleaner.clean_all(data, workers=args.workers)
 
         # Add raw events
         raw_events = transform_jira_to_raw_events(cleaned_data)
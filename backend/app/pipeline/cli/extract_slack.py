@@ -2,6 +2,7 @@
 """Extract Slack data for FlowSight AI."""
 
 import argparse
+import json
 import os
 import sys
 from pathlib import Path
@@ -10,6 +11,7 @@ from pathlib import Path
 backend_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(backend_root))
 
+from app.core.log import configure_logging
 from app.pipeline.extractors.slack_extractor import SlackExtractor
 from app.pipeline.cleaners.slack_cleaner import SlackCleaner
 from app.pipeline.core.transformer import transform_slack_to_raw_events
@@ -17,6 +19,7 @@ from app.pipeline.core.transformer import transform_slack_to_raw_events
 
 def main():
     """Run Slack data extraction pipeline."""
+    configure_logging(fmt="plain", use_queue=False)
     parser = argparse.ArgumentParser(
         description="Extract Slack workspace data for FlowSight AI"
     )
@@ -35,12 +38,61 @@ def main():
         "--token",
         help="Slack Bot User OAuth Token (or set SLACK_TOKEN env var)",
     )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes used for cleaning (default: 1, 0 = one per CPU)",
+    )
+    parser.add_argument(
+        "--user-cache",
+        default=None,
+        help="User directory cache file (default: data/.cache/slack_users_<workspace>.json)",
+    )
+    parser.add_argument(
+        "--user-cache-ttl",
+        type=int,
+        default=24 * 3600,
+        help="Seconds before the cached user directory is refetched (default: 86400)",
+    )
+    parser.add_argument(
+        "-c",
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Channels crawled concurrently (default: 4)",
+    )
+    parser.add_argument(
+        "--messages-per-channel",
+        type=int,
+        default=50,
+        help="Messages per channel (default: 50, 0 = full history)",
+    )
+    parser.add_argument(
+        "--max-channels",
+        type=int,
+        default=None,
+        help="Maximum number of channels to crawl (default: all)",
+    )
+    parser.add_argument(
+        "--spool-dir",
+        default=None,
+        help="Stream per-channel messages to JSONL files here (resumable)",
+    )
+    parser.add_argument(
+        "--no-threads",
+        action="store_true",
+        help="Skip fetching thread replies",
+    )
 
     args = parser.parse_args()
 
     # Set default output path
     if not args.output:
         args.output = f"data/slack_cleaned_{args.workspace_name}.json"
+    if not args.user_cache:
+        args.user_cache = f"data/.cache/slack_users_{args.workspace_name}.json"
 
     # Get Slack token
     slack_token = args.token or os.getenv("SLACK_TOKEN")
@@ -51,23 +103,35 @@ def main():
 
     # Extract data
     try:
-        extractor = SlackExtractor(slack_token=slack_token)
+        extractor = SlackExtractor(
+            slack_token=slack_token,
+            user_cache_path=args.user_cache,
+            user_cache_ttl=args.user_cache_ttl,
+        )
         data = extractor.extract_all(
             output_path=args.output,
-            workspace_name=args.workspace_name
+            workspace_name=args.workspace_name,
+            messages_per_channel=args.messages_per_channel or None,
+            max_channels=args.max_channels,
+            concurrency=args.concurrency,
+            spool_dir=args.spool_dir,
+            include_threads=not args.no_threads,
         )
 
+        # Messages were streamed to the output file rather than kept in memory
+        with open(args.output) as f:
+            data = json.load(f)
+
         # Clean data
         print("\nCleaning data...")
         cleaner = SlackCleaner()
-        cleaned_data = cleaner.clean_all(data)
+        cleaned_data = cleaner.clean_all(data, workers=args.workers)
 
         # Add raw events
         raw_events = transform_slack_to_raw_events(cleaned_data)
         cleaned_data["raw_events"] = [event.model_dump(mode="json") for event in raw_events]
 
         # Save updated data
-        import json
         with open(args.output, "w") as f:
             json.dump(cleaned_data, f, indent=2)
 
@@ -2,6 +2,7 @@
 """Extract Microsoft Teams data for FlowSight AI."""
 
 import argparse
+import json
 import os
 import sys
 from pathlib import Path
@@ -10,6 +11,7 @@ from pathlib import Path
 backend_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(backend_root))
 
+from app.core.log import configure_logging
 from app.pipeline.extractors.teams_extractor import TeamsExtractor
 from app.pipeline.cleaners.teams_cleaner import TeamsCleaner
 from app.pipeline.core.transformer import transform_teams_to_raw_events
@@ -17,6 +19,7 @@ from app.pipeline.core.transformer import transform_teams_to_raw_events
 
 def main():
     """Run Teams data extraction pipeline."""
+    configure_logging(fmt="plain", use_queue=False)
     parser = argparse.ArgumentParser(
         description="Extract Microsoft Teams data for FlowSight AI"
     )
@@ -40,6 +43,37 @@ def main():
         action="store_true",
         help="Include calendar meetings in extraction",
     )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes used for cleaning (default: 1, 0 = one per CPU)",
+    )
+    parser.add_argument(
+        "-c",
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Channels crawled concurrently (default: 4)",
+    )
+    parser.add_argument(
+        "--messages-per-channel",
+        type=int,
+        default=50,
+        help="Messages per channel (default: 50, 0 = full history)",
+    )
+    parser.add_argument(
+        "--max-channels",
+        type=int,
+        default=None,
+        help="Maximum number of channels to crawl (default: all)",
+    )
+    parser.add_argument(
+        "--spool-dir",
+        default=None,
+        help="Stream per-channel messages to JSONL files here (resumable)",
+    )
 
     args = parser.parse_args()
 
@@ -60,20 +94,27 @@ def main():
         data = extractor.extract_all(
             team_id=args.team_id,
             output_path=args.output,
-            include_meetings=args.include_meetings
+            include_meetings=args.include_meetings,
+            messages_per_channel=args.messages_per_channel or None,
+            max_channels=args.max_channels,
+            concurrency=args.concurrency,
+            spool_dir=args.spool_dir,
         )
 
+        # Messages were streamed to the output file rather than kept in memory
+        with open(args.output) as f:
+            data = json.load(f)
+
         # Clean data
         print("\nCleaning data...")
         cleaner = TeamsCleaner()
-        cleaned_data = cleaner.clean_all(data)
+        cleaned_data = cleaner.clean_all(data, workers=args.workers)
 
         # Add raw events
         raw_events = transform_teams_to_raw_events(cleaned_data)
         cleaned_data["raw_events"] = [event.model_dump(mode="json") for event in raw_events]
 
         # Save updated data
-        import json
         with open(args.output, "w") as f:
             json.dump(cleaned_data, f, indent=2)
 
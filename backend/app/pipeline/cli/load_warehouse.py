@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Bulk-load pipeline JSON output into the local event warehouse.
+
+Usage:
+    python load_warehouse.py                      # every data/*.json
+    python load_warehouse.py data/github_cleaned_acme.json --db data/flowsight.db
+    python load_warehouse.py --fresh              # drop existing rows first
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add backend root to path
+backend_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(backend_root))
+
+from app.core.log import configure_logging
+from app.core.settings import settings
+from app.services.warehouse import EventWarehouse
+
+
+def main():
+    """Load JSON files into the warehouse and build the workflow graph."""
+    configure_logging(fmt="plain", use_queue=False)
+    parser = argparse.ArgumentParser(
+        description="Load FlowSight pipeline JSON into the local SQLite warehouse"
+    )
+    parser.add_argument(
+        "files",
+        nargs="*",
+        help="JSON files to load (default: every *.json in --data-dir)",
+    )
+    parser.add_argument("--data-dir", default="data", help="Directory scanned when no files are given")
+    parser.add_argument(
+        "--db",
+        default=settings.warehouse_path,
+        help=f"Warehouse database file (default: {settings.warehouse_path})",
+    )
+    parser.add_argument("--fresh", action="store_true", help="Delete existing rows before loading")
+
+    args = parser.parse_args()
+
+    warehouse = EventWarehouse(args.db)
+    if args.fresh:
+        warehouse.clear()
+
+    start = time.perf_counter()
+    if args.files:
+        loaded = {}
+        for path in args.files:
+            try:
+                loaded[Path(path).name] = warehouse.load_json(path)
+            except (OSError, KeyError, TypeError, ValueError) as e:
+                print(f"  ⚠ Skipping {path}: {e}")
+    else:
+        loaded = warehouse.load_directory(args.data_dir)
+
+    for name, count in loaded.items():
+        print(f"  ✓ {name}: {count} events")
+
+    graph = warehouse.rebuild_graph()
+    elapsed = time.perf_counter() - start
+
+    stats = warehouse.stats()
+    print(f"\n✅ Warehouse {args.db} ready in {elapsed:.2f}s")
+    print(f"   Events: {stats['events']} | Nodes: {len(graph.nodes)} | Edges: {len(graph.edges)}")
+    for name, count in stats["events_by_type"].items():
+        print(f"   - {name}: {count}")
+
+
+if __name__ == "__main__":
+    main()
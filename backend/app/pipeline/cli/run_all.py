@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Unified multi-source pipeline for FlowSight AI.
+
+Runs extract → clean → transform (→ embed) for every requested source
+concurrently, then optionally uploads everything to Astra DB.
+
+Usage:
+    python run_all.py --github owner/repo --jira PAY --slack acme --upload-to-astra
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add backend root to path
+backend_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(backend_root))
+
+from app.core.log import configure_logging
+from app.pipeline.core.multi_source import build_stages
+from app.pipeline.core.orchestrator import PipelineRunner, print_stage_summary
+
+
+def main():
+    """Run the multi-source pipeline."""
+    configure_logging(fmt="plain", use_queue=False)
+    parser = argparse.ArgumentParser(
+        description="Extract, clean and transform data from all sources for FlowSight AI"
+    )
+    parser.add_argument("--github", metavar="OWNER/REPO", help="GitHub repository to extract")
+    parser.add_argument("--jira", metavar="PROJECT_KEY", help="Jira project key to extract")
+    parser.add_argument("--jira-board-id", help="Jira board ID for sprint data (optional)")
+    parser.add_argument("--slack", metavar="WORKSPACE", help="Slack workspace name (uses SLACK_TOKEN)")
+    parser.add_argument("--teams", metavar="TEAM_ID", help="Microsoft Teams team ID (uses TEAMS_TOKEN)")
+    parser.add_argument(
+        "--include-meetings",
+        action="store_true",
+        help="Include Teams calendar meetings",
+    )
+    parser.add_argument(
+        "--generate-embeddings",
+        action="store_true",
+        help="Generate embeddings for GitHub data using watsonx.ai",
+    )
+    parser.add_argument(
+        "--embedding-checkpoint",
+        default="data/.cache/embeddings.db",
+        help="Per-record embedding progress, so interrupted backfills resume "
+        "(default: data/.cache/embeddings.db; disabled by --no-checkpoint)",
+    )
+    parser.add_argument(
+        "--upload-to-astra",
+        action="store_true",
+        help="Upload all results to Astra DB after every source finishes",
+    )
+    parser.add_argument("-o", "--output-dir", default="data", help="Output directory (default: data)")
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=4,
+        help="Number of stages to run concurrently (default: 4)",
+    )
+    parser.add_argument(
+        "--clean-workers",
+        type=int,
+        default=1,
+        help="Processes used by each cleaner (default: 1, 0 = one per CPU)",
+    )
+    parser.add_argument(
+        "--checkpoint-dir",
+        default="data/.checkpoints",
+        help="Directory for stage checkpoints (default: data/.checkpoints)",
+    )
+    parser.add_argument(
+        "--no-checkpoint",
+        action="store_true",
+        help="Disable checkpoints (outputs are kept in memory only)",
+    )
+    parser.add_argument(
+        "--metrics-out",
+        metavar="PATH",
+        help="Write stage metrics in Prometheus text format (e.g. for a textfile collector)",
+    )
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Ignore checkpoints left by an interrupted run and run every stage again",
+    )
+
+    args = parser.parse_args()
+
+    sources: dict[str, dict] = {}
+    if args.github:
+        if args.github.count("/") != 1:
+            print("Error: --github must be in format 'owner/repo'")
+            sys.exit(1)
+        sources["github"] = {"repo": args.github}
+        if args.generate_embeddings and not args.no_checkpoint:
+            sources["github"]["embedding_checkpoint"] = args.embedding_checkpoint
+    if args.jira:
+        sources["jira"] = {
+            "project_key": args.jira,
+            "board_id": args.jira_board_id,
+            "clean_workers": args.clean_workers,
+        }
+    if args.slack:
+        sources["slack"] = {"workspace": args.slack, "clean_workers": args.clean_workers}
+    if args.teams:
+        sources["teams"] = {
+            "team_id": args.teams,
+            "include_meetings": args.include_meetings,
+            "clean_workers": args.clean_workers,
+        }
+
+    if not sources:
+        print("Error: specify at least one of --github, --jira, --slack, --teams")
+        sys.exit(1)
+
+    stages = build_stages(
+        sources,
+        output_dir=args.output_dir,
+        embed=args.generate_embeddings,
+        upload=args.upload_to_astra,
+    )
+    runner = PipelineRunner(
+        stages,
+        max_workers=args.workers,
+        checkpoint_dir=None if args.no_checkpoint else args.checkpoint_dir,
+        run_config={
+            "sources": sources,
+            "embed": args.generate_embeddings,
+            "upload": args.upload_to_astra,
+        },
+    )
+    if args.fresh:
+        runner.clear_checkpoints()
+
+    print(f"Running pipeline for: {', '.join(sources)} ({len(stages)} stages, {args.workers} workers)\n")
+    results = runner.run()
+    print_stage_summary(results)
+
+    if args.metrics_out:
+        from app.core.metrics import registry
+
+        Path(args.metrics_out).write_text(registry.render())
+        print(f"\nMetrics written to {args.metrics_out}")
+
+    failed = [r for r in results.values() if r.status in ("failed", "skipped")]
+    if failed:
+        print(f"\n❌ {len(failed)} stage(s) did not complete; re-run to resume from checkpoints")
+        sys.exit(1)
+
+    print("\n✅ Pipeline complete")
+
+
+if __name__ == "__main__":
+    main()
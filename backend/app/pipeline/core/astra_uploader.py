@@ -2,10 +2,24 @@
 
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any
 
-from astrapy import DataAPIClient
+from app.core.log import get_logger
+
+logger = get_logger(__name__)
+
+# Concurrent replace_one calls used for documents that already exist
+REPLACE_CONCURRENCY = 8
+
+
+def _inserted_ids(error: Exception) -> list[Any]:
+    """IDs a failed insert_many still managed to insert (astrapy 1.x and 2.x)."""
+    ids = getattr(error, "inserted_ids", None)
+    if ids is None:
+        ids = getattr(getattr(error, "partial_result", None), "inserted_ids", None)
+    return list(ids or [])
 
 
 class AstraDBUploader:
@@ -34,7 +48,9 @@ class AstraDBUploader:
                 "Set ASTRA_DB_TOKEN and ASTRA_DB_ENDPOINT environment variables."
             )
 
-        # Initialize client
+        # Initialize client (astrapy is only needed once an upload is configured)
+        from astrapy import DataAPIClient
+
         self.client = DataAPIClient(self.token)
         self.db = self.client.get_database(self.api_endpoint)
 
@@ -50,7 +66,7 @@ class AstraDBUploader:
 
     def _ensure_collections(self):
         """Create collections if they don't exist."""
-        print("Setting up Astra DB collections...")
+        logger.info("Setting up Astra DB collections...")
 
         for collection_name in self.collections.values():
             try:
@@ -58,11 +74,11 @@ class AstraDBUploader:
                 collections = self.db.list_collection_names()
                 if collection_name not in collections:
                     self.db.create_collection(collection_name)
-                    print(f"  ✓ Created collection: {collection_name}")
+                    logger.info("  ✓ Created collection: %s", collection_name)
                 else:
-                    print(f"  ✓ Collection exists: {collection_name}")
+                    logger.info("  ✓ Collection exists: %s", collection_name)
             except Exception as e:
-                print(f"  ✗ Error with collection {collection_name}: {e}")
+                logger.error("  ✗ Error with collection %s: %s", collection_name, e)
 
     def upload_github_data(self, data: dict[str, Any], repo_id: str | None = None) -> dict[str, int]:
         """Upload GitHub data to Astra DB.
@@ -91,7 +107,7 @@ class AstraDBUploader:
         }
 
         # Upload repository info
-        print(f"\nUploading data for repository: {repo_id}")
+        logger.info("Uploading data for repository: %s", repo_id)
 
         repo_doc = {
             "_id": repo_id,
@@ -102,7 +118,7 @@ class AstraDBUploader:
         repo_collection = self.db.get_collection(self.collections["repositories"])
         repo_collection.insert_one(repo_doc)
         counts["repositories"] = 1
-        print(f"  ✓ Repository info uploaded")
+        logger.info("  ✓ Repository info uploaded")
 
         # Upload commits
         commits_collection = self.db.get_collection(self.collections["commits"])
@@ -114,7 +130,7 @@ class AstraDBUploader:
             }
             commits_collection.insert_one(commit_doc)
             counts["commits"] += 1
-        print(f"  ✓ {counts['commits']} commits uploaded")
+        logger.info("  ✓ %s commits uploaded", counts['commits'])
 
         # Upload pull requests
         prs_collection = self.db.get_collection(self.collections["pull_requests"])
@@ -126,7 +142,7 @@ class AstraDBUploader:
             }
             prs_collection.insert_one(pr_doc)
             counts["pull_requests"] += 1
-        print(f"  ✓ {counts['pull_requests']} pull requests uploaded")
+        logger.info("  ✓ %s pull requests uploaded", counts['pull_requests'])
 
         # Upload CI runs
         ci_collection = self.db.get_collection(self.collections["ci_runs"])
@@ -138,7 +154,7 @@ class AstraDBUploader:
             }
             ci_collection.insert_one(ci_doc)
             counts["ci_runs"] += 1
-        print(f"  ✓ {counts['ci_runs']} CI runs uploaded")
+        logger.info("  ✓ %s CI runs uploaded", counts['ci_runs'])
 
         # Upload deployments
         deploy_collection = self.db.get_collection(self.collections["deployments"])
@@ -150,7 +166,7 @@ class AstraDBUploader:
             }
             deploy_collection.insert_one(deploy_doc)
             counts["deployments"] += 1
-        print(f"  ✓ {counts['deployments']} deployments uploaded")
+        logger.info("  ✓ %s deployments uploaded", counts['deployments'])
 
         # Create normalized workflow events for AI analysis
         events_collection = self.db.get_collection(self.collections["workflow_events"])
@@ -158,7 +174,7 @@ class AstraDBUploader:
         for event in workflow_events:
             events_collection.insert_one(event)
             counts["workflow_events"] += 1
-        print(f"  ✓ {counts['workflow_events']} workflow events created")
+        logger.info("  ✓ %s workflow events created", counts['workflow_events'])
 
         return counts
 
@@ -267,6 +283,50 @@ class AstraDBUploader:
 
         return self.upload_github_data(data, repo_id)
 
+    def upload_raw_events(self, events: list[dict[str, Any]], repo_id: str = "webhooks") -> int:
+        """Upsert already-normalized RawEvent dicts into the workflow_events collection.
+
+        Used by incremental (webhook) ingestion, where events arrive in small
+        batches instead of as a full extractor dump. A batch is written with
+        one ``insert_many``; documents that already exist are then replaced
+        concurrently, so a batch never costs one sequential round-trip per event.
+
+        Args:
+            events: RawEvent dicts (``model_dump(mode="json")``)
+            repo_id: Repository ID to tag the events with
+
+        Returns:
+            Number of events written
+        """
+        events_collection = self.db.get_collection(self.collections["workflow_events"])
+
+        # Last write wins within a batch, as with sequential upserts
+        docs: dict[str, dict[str, Any]] = {}
+        for event in events:
+            doc_id = f"{repo_id}/event-{event['source']}-{event['type']}-{event['id']}"
+            docs[doc_id] = {"_id": doc_id, "repo_id": repo_id, **event}
+        if not docs:
+            return 0
+
+        # New events (the common case for webhooks) go in one bulk request;
+        # only the ones that already exist fall back to replaces
+        try:
+            events_collection.insert_many(list(docs.values()), ordered=False)
+            return len(events)
+        except Exception as e:
+            inserted = set(_inserted_ids(e))
+        existing = [doc for doc_id, doc in docs.items() if doc_id not in inserted]
+        if not existing:
+            return len(events)
+
+        def replace(doc: dict[str, Any]) -> None:
+            events_collection.replace_one({"_id": doc["_id"]}, doc, upsert=True)
+
+        with ThreadPoolExecutor(max_workers=min(REPLACE_CONCURRENCY, len(existing))) as pool:
+            list(pool.map(replace, existing))
+
+        return len(events)
+
     def query_workflow_events(
         self, repo_id: str, event_type: str | None = None, limit: int = 100
     ) -> list[dict[str, Any]]:
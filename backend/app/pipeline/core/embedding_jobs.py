@@ -0,0 +1,404 @@
+"""
+Resumable, checkpointed embedding jobs.
+
+Embedding a large backfill means tens of thousands of watsonx.ai calls; a
+crash or a rate-limit storm halfway through must not throw that work away.
+``EmbeddingJob`` embeds records in batches and commits each batch's
+results to a SQLite checkpoint keyed by (job, record id):
+
+- On restart, records already embedded are loaded from the checkpoint
+  instead of being embedded again. A record counts as done only while its
+  fingerprint (the texts that get embedded, plus the model) is unchanged,
+  so edited records are re-embedded.
+- Each batch's distinct texts are embedded in one request (see
+  ``EmbeddingJob``), so repeated texts cost one embedding.
+- Failing requests are retried with exponential backoff and jitter
+  (honoring ``Retry-After``). Records still failing after ``max_retries``
+  are recorded as failed and retried on the next run; the rest of the job
+  carries on. Only a rejected input (400, 413, 422) is narrowed down text
+  by text; throttling, auth and server errors fail the whole batch.
+- Progress (done / total, items per second, ETA) is logged every
+  ``progress_interval`` seconds.
+
+Usage::
+
+    checkpoint = EmbeddingCheckpoint("data/.cache/embeddings.db")
+    job = EmbeddingJob(strategy.embedding_texts, strategy.generate_embeddings, checkpoint, "github:acme/payments")
+    results, stats = job.run(records, fingerprint=strategy.fingerprint)
+"""
+
+import hashlib
+import random
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+import orjson
+
+from app.core.log import get_logger
+
+logger = get_logger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS embedding_items (
+    job TEXT NOT NULL,
+    record_id TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    status TEXT NOT NULL,  -- "done" or "failed"
+    attempts INTEGER NOT NULL DEFAULT 0,
+    result BLOB,  -- JSON embedding fields when done
+    error TEXT,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (job, record_id)
+) WITHOUT ROWID;
+"""
+
+
+def fingerprint_texts(*texts: str) -> str:
+    """Stable short hash of the inputs that determine an embedding."""
+    digest = hashlib.blake2b(digest_size=16)
+    for text in texts:
+        digest.update(text.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _describe(error: Exception) -> str:
+    return f"{type(error).__name__}: {error}"
+
+
+def _status_code(error: Exception) -> int | None:
+    """HTTP status of a failed request (``requests.HTTPError`` carries its response)."""
+    return getattr(getattr(error, "response", None), "status_code", None)
+
+
+# Rejections of the request body itself; auth (401/403) and 429 are not about the texts
+INPUT_ERROR_STATUSES = {400, 413, 422}
+
+
+def is_input_error(error: Exception) -> bool:
+    """Whether the service rejected the texts themselves, so resending them can't help."""
+    return _status_code(error) in INPUT_ERROR_STATUSES
+
+
+def _retry_after(error: Exception) -> float:
+    """Seconds the server asked us to wait (``Retry-After``), or 0."""
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        return max(float(headers.get("Retry-After", 0)), 0.0)
+    except (TypeError, ValueError):
+        # HTTP-date form; fall back to our own backoff
+        return 0.0
+
+
+def format_eta(seconds: float) -> str:
+    if seconds < 60:
+        return f"{seconds:.0f}s"
+    if seconds < 3600:
+        return f"{seconds // 60:.0f}m{seconds % 60:02.0f}s"
+    return f"{seconds // 3600:.0f}h{seconds % 3600 // 60:02.0f}m"
+
+
+class EmbeddingCheckpoint:
+    """Per-record embedding results persisted in SQLite."""
+
+    def __init__(self, path: str = ":memory:"):
+        """Initialize the checkpoint (the database is opened on first use).
+
+        Args:
+            path: SQLite file, or ":memory:" for a run that doesn't need to resume
+        """
+        self.path = path
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.RLock()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """The open connection, creating the database and schema if needed."""
+        if self._conn is None:
+            with self._lock:
+                if self._conn is None:
+                    if self.path != ":memory:":
+                        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+                    conn = sqlite3.connect(self.path, check_same_thread=False)
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.execute("PRAGMA synchronous=NORMAL")
+                    conn.executescript(SCHEMA)
+                    self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Close the connection (reopened on next use)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def completed(self, job: str) -> dict[str, tuple[str, dict[str, Any]]]:
+        """Embedded records of ``job``: record id -> (fingerprint, result)."""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT record_id, fingerprint, result FROM embedding_items WHERE job = ? AND status = 'done'",
+                (job,),
+            ).fetchall()
+        return {record_id: (fingerprint, orjson.loads(result)) for record_id, fingerprint, result in rows}
+
+    def save(
+        self,
+        job: str,
+        done: list[tuple[str, str, int, dict[str, Any]]],
+        failed: list[tuple[str, str, int, str]],
+    ) -> None:
+        """
+        Record one batch in a single transaction.
+
+        Args:
+            job: Job ID
+            done: ``(record_id, fingerprint, attempts, result)`` per embedded record
+            failed: ``(record_id, fingerprint, attempts, error)`` per failed record
+        """
+        now = time.time()
+        rows = [
+            (job, record_id, fingerprint, "done", attempts, orjson.dumps(result), None, now)
+            for record_id, fingerprint, attempts, result in done
+        ] + [
+            (job, record_id, fingerprint, "failed", attempts, None, error, now)
+            for record_id, fingerprint, attempts, error in failed
+        ]
+        with self._lock, self.conn:
+            self.conn.executemany("INSERT OR REPLACE INTO embedding_items VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def clear(self, job: str) -> None:
+        """Forget every record of ``job``."""
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM embedding_items WHERE job = ?", (job,))
+
+    def summary(self, job: str) -> dict[str, int]:
+        """Record counts by status for ``job``."""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT status, COUNT(*) FROM embedding_items WHERE job = ? GROUP BY status", (job,)
+            ).fetchall()
+        return dict(rows)
+
+
+@dataclass
+class EmbeddingJobStats:
+    """Outcome of one ``EmbeddingJob.run``."""
+
+    total: int = 0
+    resumed: int = 0  # loaded from the checkpoint
+    embedded: int = 0
+    failed: int = 0
+    retries: int = 0
+    texts: int = 0  # texts the embedded records needed
+    unique_texts: int = 0  # texts actually sent after deduplication
+    calls: int = 0  # embedding API requests
+    seconds: float = 0.0
+
+    @property
+    def items_per_sec(self) -> float:
+        return self.embedded / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def dedup_savings(self) -> float:
+        """Fraction of texts that didn't need their own embedding."""
+        return 1 - self.unique_texts / self.texts if self.texts else 0.0
+
+
+class EmbeddingJob:
+    """
+    Embed records in checkpointed batches.
+
+    Each record maps to named texts (``texts_fn``), e.g. an event text and
+    a contextual text. Within a batch every distinct text is embedded once,
+    in a single ``embed_texts`` request, and the vector is fanned out to
+    every field that uses it: deployments have identical event and
+    contextual texts, and commit messages such as "Merge branch 'main'"
+    repeat throughout a repository.
+    """
+
+    def __init__(
+        self,
+        texts_fn: Callable[[dict[str, Any]], dict[str, str]],
+        embed_texts: Callable[[list[str]], list[list[float]]],
+        checkpoint: EmbeddingCheckpoint,
+        job_id: str,
+        batch_size: int = 50,
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        backoff_max: float = 30.0,
+        progress_interval: float = 10.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize the job.
+
+        Args:
+            texts_fn: Result field -> text to embed, for one record
+            embed_texts: Embeds a list of texts in one request (vectors in input order)
+            checkpoint: Where per-record results are persisted
+            job_id: Namespace for this job's records in the checkpoint
+            batch_size: Records per embedding request and checkpoint commit
+            max_retries: Retries per request before it is marked failed
+            backoff_base: First retry delay in seconds (doubles per attempt)
+            backoff_max: Upper bound for a retry delay
+            progress_interval: Seconds between progress log lines
+            sleep: Sleep function (injectable for tests and dry runs)
+        """
+        self.texts_fn = texts_fn
+        self.embed_texts = embed_texts
+        self.checkpoint = checkpoint
+        self.job_id = job_id
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.progress_interval = progress_interval
+        self.sleep = sleep
+
+    def _call_with_retries(
+        self, texts: list[str], stats: EmbeddingJobStats, retries: int
+    ) -> tuple[list[list[float]] | None, Exception | None]:
+        """One embedding request, retried; returns (vectors or None, last error)."""
+        error: Exception | None = None
+        for attempt in range(retries + 1):
+            if attempt:
+                stats.retries += 1
+                # Exponential backoff with jitter so retries don't arrive in lockstep
+                delay = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+                delay *= random.uniform(0.5, 1.0)
+                self.sleep(min(self.backoff_max, max(delay, _retry_after(error))))
+            stats.calls += 1
+            try:
+                vectors = self.embed_texts(texts)
+                if len(vectors) != len(texts):
+                    raise ValueError(f"expected {len(texts)} embeddings, got {len(vectors)}")
+                return vectors, None
+            except Exception as e:
+                error = e
+                if is_input_error(e):
+                    # The same request would be rejected again
+                    break
+        return None, error
+
+    def _embed_unique(self, texts: list[str], stats: EmbeddingJobStats) -> tuple[dict[str, list[float]], dict[str, str]]:
+        """
+        Embed distinct texts, isolating bad inputs.
+
+        The whole batch goes out as one request. If the service rejects it
+        as invalid (see ``INPUT_ERROR_STATUSES``), each text is sent once on
+        its own so a single bad input doesn't fail every record in the
+        batch. Any other failure (throttling, auth, server or network
+        errors) hits every text alike, so the batch is failed as a whole after its retries and
+        left for the next run rather than multiplied into per-text calls.
+
+        Returns:
+            Vector per embedded text, and error per text that failed
+        """
+        vectors, error = self._call_with_retries(texts, stats, self.max_retries)
+        if vectors is not None:
+            return dict(zip(texts, vectors)), {}
+        if len(texts) == 1 or not is_input_error(error):
+            return {}, dict.fromkeys(texts, _describe(error))
+
+        embedded, errors = {}, {}
+        for i, text in enumerate(texts):
+            single, error = self._call_with_retries([text], stats, 0)
+            if single is not None:
+                embedded[text] = single[0]
+                continue
+            errors[text] = _describe(error)
+            if not is_input_error(error):
+                # Throttled or down mid-way: stop, the rest is retried next run
+                errors.update(dict.fromkeys(texts[i + 1:], errors[text]))
+                break
+        return embedded, errors
+
+    def run(
+        self,
+        records: list[tuple[str, dict[str, Any]]],
+        fingerprint: Callable[[dict[str, Any]], str],
+    ) -> tuple[dict[str, dict[str, Any]], EmbeddingJobStats]:
+        """
+        Embed every record not already in the checkpoint.
+
+        Args:
+            records: ``(record_id, record)`` pairs; IDs must be unique within the job
+            fingerprint: Hash of what gets embedded for a record
+
+        Returns:
+            Vectors by field per record ID (failed records are absent) and run stats
+        """
+        stats = EmbeddingJobStats(total=len(records))
+        started = time.perf_counter()
+
+        previous = self.checkpoint.completed(self.job_id)
+        results: dict[str, dict[str, Any]] = {}
+        pending: list[tuple[str, str, dict[str, Any]]] = []
+        for record_id, record in records:
+            fp = fingerprint(record)
+            done = previous.get(record_id)
+            if done is not None and done[0] == fp:
+                results[record_id] = done[1]
+            else:
+                pending.append((record_id, fp, record))
+        stats.resumed = len(results)
+        if stats.resumed:
+            logger.info("  ✓ Resumed %s/%s embedded records from checkpoint", stats.resumed, stats.total)
+
+        last_report = time.perf_counter()
+        for offset in range(0, len(pending), self.batch_size):
+            batch = [
+                (record_id, fp, self.texts_fn(record))
+                for record_id, fp, record in pending[offset:offset + self.batch_size]
+            ]
+            # Dedup stage: each distinct text is embedded once and fanned out below
+            unique = list(dict.fromkeys(text for _, _, texts in batch for text in texts.values()))
+            stats.texts += sum(len(texts) for _, _, texts in batch)
+            stats.unique_texts += len(unique)
+            calls_before = stats.calls
+            vectors, errors = self._embed_unique(unique, stats)
+            attempts = stats.calls - calls_before
+
+            done_rows, failed_rows = [], []
+            for record_id, fp, texts in batch:
+                failed = [errors[text] for text in texts.values() if text not in vectors]
+                if failed:
+                    failed_rows.append((record_id, fp, attempts, failed[0]))
+                    logger.warning("  ⚠ Failed to embed %s: %s", record_id, failed[0])
+                else:
+                    result = {field: vectors[text] for field, text in texts.items()}
+                    results[record_id] = result
+                    done_rows.append((record_id, fp, attempts, result))
+            self.checkpoint.save(self.job_id, done_rows, failed_rows)
+            stats.embedded += len(done_rows)
+            stats.failed += len(failed_rows)
+
+            now = time.perf_counter()
+            if now - last_report >= self.progress_interval:
+                last_report = now
+                self._report(stats, len(pending), now - started)
+
+        stats.seconds = time.perf_counter() - started
+        logger.info(
+            "  ✓ Embedding job %s: %s embedded, %s resumed, %s failed, %s retries (%.1f items/s)",
+            self.job_id, stats.embedded, stats.resumed, stats.failed, stats.retries, stats.items_per_sec,
+        )
+        if stats.texts:
+            logger.info(
+                "  ✓ Deduplication: %s unique of %s texts (%.0f%% fewer embeddings) in %s requests",
+                stats.unique_texts, stats.texts, stats.dedup_savings * 100, stats.calls,
+            )
+        return results, stats
+
+    def _report(self, stats: EmbeddingJobStats, pending: int, elapsed: float) -> None:
+        processed = stats.embedded + stats.failed
+        rate = processed / elapsed if elapsed > 0 else 0.0
+        eta = format_eta((pending - processed) / rate) if rate > 0 else "?"
+        logger.info(
+            "  … %s/%s embedded (%s resumed, %s failed), %.1f items/s, ETA %s",
+            stats.resumed + stats.embedded, stats.total, stats.resumed, stats.failed, rate, eta,
+        )
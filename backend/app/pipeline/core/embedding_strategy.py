@@ -8,10 +8,23 @@ Combines:
 """
 
 from typing import Any
+from dataclasses import asdict
 from datetime import datetime
-import requests
 import os
 
+from app.core.log import get_logger
+from app.pipeline.core.embedding_jobs import EmbeddingCheckpoint, EmbeddingJob, fingerprint_texts
+
+logger = get_logger(__name__)
+
+# GitHub collection -> (event type, field identifying a record across runs)
+GITHUB_COLLECTIONS = {
+    "commits": ("commit", "sha"),
+    "pull_requests": ("pull_request", "number"),
+    "ci_runs": ("workflow_run", "id"),
+    "deployments": ("deployment", "id"),
+}
+
 
 class HybridEmbeddingStrategy:
     """
@@ -55,8 +68,10 @@ class HybridEmbeddingStrategy:
 
         elif event_type == "pull_request":
             title = event.get("title", "")
-            # Include commit messages for context
-            commits = event.get("commits", [])
+            # Include commit messages for context ("commits" holds short SHAs once transformed)
+            commits = event.get("commits_data") or [
+                c for c in event.get("commits", []) if isinstance(c, dict)
+            ]
             commit_context = " ".join([c.get("message", "") for c in commits]) if commits else ""
 
             event_text = title
@@ -86,15 +101,15 @@ class HybridEmbeddingStrategy:
             "contextual_text": contextual_text,
         }
 
-    def generate_embedding(self, text: str) -> list[float]:
+    def generate_embeddings(self, texts: list[str]) -> list[list[float]]:
         """
-        Generate dense embedding using watsonx.ai.
+        Generate dense embeddings for several texts in one watsonx.ai request.
 
         Args:
-            text: Text to embed
+            texts: Texts to embed
 
         Returns:
-            Dense embedding vector
+            Dense embedding vectors, in input order
         """
         if not self.watsonx_api_key:
             raise ValueError("watsonx.ai API key not configured")
@@ -107,9 +122,11 @@ class HybridEmbeddingStrategy:
         payload = {
             "model_id": self.embedding_model,
             "project_id": self.watsonx_project_id,
-            "inputs": [text],
+            "inputs": texts,
         }
 
+        import requests
+
         response = requests.post(
             f"{self.watsonx_url}/ml/v1/text/embeddings",
             headers=headers,
@@ -118,7 +135,19 @@ class HybridEmbeddingStrategy:
         response.raise_for_status()
 
         result = response.json()
-        return result["results"][0]["embedding"]
+        return [item["embedding"] for item in result["results"]]
+
+    def generate_embedding(self, text: str) -> list[float]:
+        """
+        Generate dense embedding using watsonx.ai.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Dense embedding vector
+        """
+        return self.generate_embeddings([text])[0]
 
     def extract_metadata(self, event: dict[str, Any]) -> dict[str, Any]:
         """
@@ -257,40 +286,62 @@ class HybridEmbeddingStrategy:
         # Normalize to 0-1
         return min(max(score, 0.0), 1.0)
 
-    def embed_event(self, event: dict[str, Any]) -> dict[str, Any]:
-        """
-        Embed a single event with both event-level and contextual embeddings.
-
-        Returns event with added embedding fields:
-        - event_embedding: Dense embedding of event text only
-        - contextual_embedding: Dense embedding with context
-        - text_for_bm25: Raw text for BM25 indexing
-        - metadata: Rich metadata for filtering and boosting
-        """
+    def fingerprint(self, event: dict[str, Any]) -> str:
+        """Hash of everything that determines an event's embeddings (texts and model)."""
         texts = self.prepare_event_text(event)
+        return fingerprint_texts(self.embedding_model, texts["event_text"], texts["contextual_text"])
 
-        # Generate dense embeddings
-        event_embedding = self.generate_embedding(texts["event_text"])
-        contextual_embedding = self.generate_embedding(texts["contextual_text"])
-
-        # Extract metadata
-        metadata = self.extract_metadata(event)
+    def embedding_texts(self, event: dict[str, Any]) -> dict[str, str]:
+        """Text behind each embedding field of an event."""
+        texts = self.prepare_event_text(event)
+        return {"event_embedding": texts["event_text"], "contextual_embedding": texts["contextual_text"]}
+
+    def generate_event_embeddings(self, event: dict[str, Any]) -> dict[str, list[float]]:
+        """Dense embeddings of an event's text and of its contextual text (one request)."""
+        texts = self.embedding_texts(event)
+        # Identical texts (e.g. deployments) are embedded once
+        unique = list(dict.fromkeys(texts.values()))
+        vectors = dict(zip(unique, self.generate_embeddings(unique)))
+        return {field: vectors[text] for field, text in texts.items()}
+
+    def attach_embeddings(self, event: dict[str, Any], embeddings: dict[str, list[float]]) -> dict[str, Any]:
+        """Add embeddings, their texts and search metadata to an event."""
+        texts = self.prepare_event_text(event)
 
         # Add embeddings and metadata to event
-        event["event_embedding"] = event_embedding
-        event["contextual_embedding"] = contextual_embedding
+        event["event_embedding"] = embeddings["event_embedding"]
+        event["contextual_embedding"] = embeddings["contextual_embedding"]
         event["event_text"] = texts["event_text"]
         event["contextual_text"] = texts["contextual_text"]
 
         # For BM25: store raw text that will be indexed
         event["text_for_bm25"] = texts["contextual_text"]
 
-        # Add metadata for filtering and boosting
-        event["search_metadata"] = metadata
+        # Add metadata for filtering and boosting (recomputed every run: it decays with age)
+        event["search_metadata"] = self.extract_metadata(event)
 
         return event
 
-    def embed_github_data(self, github_data: dict[str, Any]) -> dict[str, Any]:
+    def embed_event(self, event: dict[str, Any]) -> dict[str, Any]:
+        """
+        Embed a single event with both event-level and contextual embeddings.
+
+        Returns event with added embedding fields:
+        - event_embedding: Dense embedding of event text only
+        - contextual_embedding: Dense embedding with context
+        - text_for_bm25: Raw text for BM25 indexing
+        - metadata: Rich metadata for filtering and boosting
+        """
+        return self.attach_embeddings(event, self.generate_event_embeddings(event))
+
+    def embed_github_data(
+        self,
+        github_data: dict[str, Any],
+        checkpoint_path: str | None = None,
+        job_id: str = "github",
+        batch_size: int = 50,
+        max_retries: int = 3,
+    ) -> dict[str, Any]:
         """
         Embed all events in GitHub data.
 
@@ -299,75 +350,77 @@ class HybridEmbeddingStrategy:
         - Pull Requests (event-level + contextual with commits)
         - CI Runs (event-level + contextual)
         - Deployments (event-level + contextual)
+
+        Embeddings are generated by an ``EmbeddingJob``: each batch's
+        distinct texts go out in one request, and with a checkpoint path
+        each batch is persisted as it completes so a rerun only embeds
+        records that are new, changed or failed last time. Records that
+        still fail after ``max_retries`` are kept without embeddings.
+
+        Args:
+            github_data: Extracted (or transformed) GitHub data
+            checkpoint_path: SQLite checkpoint file (None = in memory, no resume)
+            job_id: Checkpoint namespace, e.g. "github:owner/repo"
+            batch_size: Records per embedding request and checkpoint commit
+            max_retries: Retries per request before giving up on its records for this run
         """
         embedded_data = github_data.copy()
 
-        print("Generating embeddings...")
+        logger.info("Generating embeddings...")
 
-        # Embed commits
-        if "commits" in embedded_data:
-            embedded_commits = []
-            for commit in embedded_data["commits"]:
-                try:
-                    embedded_commit = self.embed_event(
-                        {"type": "commit", "message": commit.get("message", ""), **commit}
-                    )
-                    embedded_commits.append(embedded_commit)
-                except Exception as e:
-                    print(f"  ⚠ Warning: Failed to embed commit {commit.get('sha', '')}: {e}")
-                    embedded_commits.append(commit)  # Keep original without embeddings
-
-            embedded_data["commits"] = embedded_commits
-            print(f"  ✓ Embedded {len(embedded_commits)} commits")
-
-        # Embed pull requests (with commit context)
-        if "pull_requests" in embedded_data:
-            embedded_prs = []
-            for pr in embedded_data["pull_requests"]:
-                try:
+        records: list[tuple[str, dict[str, Any]]] = []
+        seen: set[str] = set()
+        for collection, (event_type, id_field) in GITHUB_COLLECTIONS.items():
+            for index, record in enumerate(embedded_data.get(collection, [])):
+                if event_type == "commit":
+                    event = {"type": "commit", "message": record.get("message", ""), **record}
+                elif event_type == "pull_request":
                     # Get commit messages for this PR
-                    pr_commits = [
+                    record["commits_data"] = [
                         c for c in embedded_data.get("commits", [])
-                        if c.get("sha", "")[:12] in pr.get("commits", [])
+                        if c.get("sha", "")[:12] in record.get("commits", [])
                     ]
-                    pr["commits_data"] = pr_commits
-
-                    embedded_pr = self.embed_event({"type": "pull_request", **pr})
-                    embedded_prs.append(embedded_pr)
-                except Exception as e:
-                    print(f"  ⚠ Warning: Failed to embed PR #{pr.get('number', '')}: {e}")
-                    embedded_prs.append(pr)
-
-            embedded_data["pull_requests"] = embedded_prs
-            print(f"  ✓ Embedded {len(embedded_prs)} pull requests")
-
-        # Embed CI runs
-        if "ci_runs" in embedded_data:
-            embedded_ci = []
-            for ci_run in embedded_data["ci_runs"]:
-                try:
-                    embedded_run = self.embed_event({"type": "workflow_run", **ci_run})
-                    embedded_ci.append(embedded_run)
-                except Exception as e:
-                    print(f"  ⚠ Warning: Failed to embed CI run {ci_run.get('id', '')}: {e}")
-                    embedded_ci.append(ci_run)
-
-            embedded_data["ci_runs"] = embedded_ci
-            print(f"  ✓ Embedded {len(embedded_ci)} CI runs")
-
-        # Embed deployments
-        if "deployments" in embedded_data:
-            embedded_deploys = []
-            for deployment in embedded_data["deployments"]:
-                try:
-                    embedded_deploy = self.embed_event({"type": "deployment", **deployment})
-                    embedded_deploys.append(embedded_deploy)
-                except Exception as e:
-                    print(f"  ⚠ Warning: Failed to embed deployment {deployment.get('id', '')}: {e}")
-                    embedded_deploys.append(deployment)
-
-            embedded_data["deployments"] = embedded_deploys
-            print(f"  ✓ Embedded {len(embedded_deploys)} deployments")
+                    event = {"type": "pull_request", **record}
+                else:
+                    event = {"type": event_type, **record}
+
+                key = record.get(id_field)
+                record_id = f"{collection}:{key}" if key not in (None, "") else f"{collection}:#{index}"
+                if record_id in seen:
+                    record_id = f"{record_id}#{index}"
+                seen.add(record_id)
+                records.append((record_id, event))
+
+        checkpoint = EmbeddingCheckpoint(checkpoint_path or ":memory:")
+        job = EmbeddingJob(
+            self.embedding_texts,
+            self.generate_embeddings,
+            checkpoint,
+            job_id,
+            batch_size=batch_size,
+            max_retries=max_retries,
+        )
+        try:
+            results, stats = job.run(records, self.fingerprint)
+        finally:
+            checkpoint.close()
+
+        position = 0
+        for collection in GITHUB_COLLECTIONS:
+            if collection not in embedded_data:
+                continue
+            embedded_records = []
+            for record in embedded_data[collection]:
+                record_id, event = records[position]
+                position += 1
+                embeddings = results.get(record_id)
+                if embeddings is None:
+                    embedded_records.append(record)  # Keep original without embeddings
+                else:
+                    embedded_records.append(self.attach_embeddings(event, embeddings))
+
+            embedded_data[collection] = embedded_records
+            logger.info("  ✓ Embedded %s %s", len(embedded_records), collection.replace("_", " "))
 
         # Add embedding metadata
         embedded_data["embedding_metadata"] = {
@@ -376,6 +429,11 @@ class HybridEmbeddingStrategy:
             "dense_dimension": self.embedding_dimension,
             "sparse_method": "bm25",
             "generated_at": datetime.now().isoformat(),
+            "job": {
+                **asdict(stats),
+                "items_per_sec": round(stats.items_per_sec, 2),
+                "dedup_savings": round(stats.dedup_savings, 3),
+            },
         }
 
         return embedded_data
@@ -410,11 +468,11 @@ def create_astra_vector_collections(astra_db):
                     dimension=config["vector_dimension"],
                     metric=config["vector_metric"],
                 )
-                print(f"  ✓ Created vector collection: {collection_name}")
+                logger.info("  ✓ Created vector collection: %s", collection_name)
             else:
-                print(f"  ✓ Collection exists: {collection_name}")
+                logger.info("  ✓ Collection exists: %s", collection_name)
         except Exception as e:
-            print(f"  ✗ Error creating collection {collection_name}: {e}")
+            logger.error("  ✗ Error creating collection %s: %s", collection_name, e)
 
 
 def hybrid_search(
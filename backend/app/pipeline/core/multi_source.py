@@ -0,0 +1,229 @@
+"""Stage definitions for the unified multi-source pipeline."""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable
+
+from app.pipeline.core.orchestrator import Stage
+
+
+def _save(data: dict[str, Any], output_path: Path) -> None:
+    """Write a cleaned dataset to disk."""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "w") as f:
+        json.dump(data, f, indent=2, default=str)
+
+
+def _github_stages(config: dict[str, Any], output_dir: Path, embed: bool) -> tuple[list[Stage], str]:
+    """Extract → transform (→ embed) for a GitHub repository."""
+    owner, repo = config["repo"].split("/")
+
+    def extract(_: dict) -> dict:
+        from app.pipeline.extractors.github_extractor import GitHubExtractor
+
+        extractor = GitHubExtractor(github_token=config.get("token") or os.getenv("GITHUB_TOKEN"))
+        return extractor.extract_all(owner, repo, include_raw_events=False)
+
+    def transform(inputs: dict) -> dict:
+        from app.pipeline.core.transformer import transform_github_to_raw_events
+
+        data = inputs["extract_github"]
+        data["raw_events"] = [e.model_dump(mode="json") for e in transform_github_to_raw_events(data)]
+        _save(data, output_dir / f"github_cleaned_{repo}.json")
+        return data
+
+    stages = [
+        Stage("extract_github", extract),
+        Stage("transform_github", transform, ["extract_github"]),
+    ]
+    final = "transform_github"
+
+    if embed:
+        def embed_stage(inputs: dict) -> dict:
+            from app.pipeline.core.embedding_strategy import HybridEmbeddingStrategy
+
+            data = HybridEmbeddingStrategy().embed_github_data(
+                inputs["transform_github"],
+                checkpoint_path=config.get("embedding_checkpoint"),
+                job_id=f"github:{config['repo']}",
+            )
+            _save(data, output_dir / f"github_cleaned_{repo}.json")
+            return data
+
+        stages.append(Stage("embed_github", embed_stage, ["transform_github"]))
+        final = "embed_github"
+
+    return stages, final
+
+
+def _chat_stages(
+    source: str,
+    extract_fn: Callable[[dict], dict],
+    clean_fn: Callable[[dict], dict],
+    transform_fn: Callable[[dict], list],
+    output_path: Path,
+) -> tuple[list[Stage], str]:
+    """Extract → clean → transform for Slack, Jira or Teams."""
+
+    def clean(inputs: dict) -> dict:
+        return clean_fn(inputs[f"extract_{source}"])
+
+    def transform(inputs: dict) -> dict:
+        data = inputs[f"clean_{source}"]
+        data["raw_events"] = [e.model_dump(mode="json") for e in transform_fn(data)]
+        _save(data, output_path)
+        return data
+
+    stages = [
+        Stage(f"extract_{source}", extract_fn),
+        Stage(f"clean_{source}", clean, [f"extract_{source}"]),
+        Stage(f"transform_{source}", transform, [f"clean_{source}"]),
+    ]
+    return stages, f"transform_{source}"
+
+
+def build_stages(
+    sources: dict[str, dict[str, Any]],
+    output_dir: str = "data",
+    embed: bool = False,
+    upload: bool = False,
+) -> list[Stage]:
+    """
+    Build the pipeline DAG for the requested sources.
+
+    Args:
+        sources: Per-source config, e.g. ``{"github": {"repo": "owner/repo"},
+            "jira": {"project_key": "PAY"}, "slack": {"workspace": "acme"},
+            "teams": {"team_id": "..."}}``
+        output_dir: Directory for cleaned JSON output
+        embed: Generate embeddings for GitHub data
+        upload: Upload results to Astra DB once every source has finished
+
+    Returns:
+        Stages ready for :class:`PipelineRunner`
+    """
+    out = Path(output_dir)
+    stages: list[Stage] = []
+    finals: list[str] = []
+
+    if "github" in sources:
+        github_stages, final = _github_stages(sources["github"], out, embed)
+        stages += github_stages
+        finals.append(final)
+
+    if "slack" in sources:
+        slack_cfg = sources["slack"]
+
+        def extract_slack(_: dict) -> dict:
+            from app.pipeline.extractors.slack_extractor import SlackExtractor
+
+            extractor = SlackExtractor(
+                slack_token=slack_cfg.get("token") or os.getenv("SLACK_TOKEN"),
+                user_cache_path=str(out / ".cache" / f"slack_users_{slack_cfg['workspace']}.json"),
+            )
+            return extractor.extract_all(workspace_name=slack_cfg["workspace"])
+
+        def clean_slack(data: dict) -> dict:
+            from app.pipeline.cleaners.slack_cleaner import SlackCleaner
+
+            return SlackCleaner().clean_all(data, workers=slack_cfg.get("clean_workers", 1))
+
+        def transform_slack(data: dict) -> list:
+            from app.pipeline.core.transformer import transform_slack_to_raw_events
+
+            return transform_slack_to_raw_events(data)
+
+        slack_stages, final = _chat_stages(
+            "slack",
+            extract_slack,
+            clean_slack,
+            transform_slack,
+            out / f"slack_cleaned_{slack_cfg['workspace']}.json",
+        )
+        stages += slack_stages
+        finals.append(final)
+
+    if "jira" in sources:
+        jira_cfg = sources["jira"]
+
+        def extract_jira(_: dict) -> dict:
+            from app.pipeline.extractors.jira_extractor import JiraExtractor
+
+            extractor = JiraExtractor(
+                jira_url=jira_cfg.get("url") or os.getenv("JIRA_URL", ""),
+                jira_email=jira_cfg.get("email") or os.getenv("JIRA_EMAIL"),
+                jira_api_token=jira_cfg.get("token") or os.getenv("JIRA_API_TOKEN"),
+            )
+            return extractor.extract_all(
+                project_key=jira_cfg["project_key"], board_id=jira_cfg.get("board_id")
+            )
+
+        def clean_jira(data: dict) -> dict:
+            from app.pipeline.cleaners.jira_cleaner import JiraCleaner
+
+            return JiraCleaner().clean_all(data, workers=jira_cfg.get("clean_workers", 1))
+
+        def transform_jira(data: dict) -> list:
+            from app.pipeline.core.transformer import transform_jira_to_raw_events
+
+            return transform_jira_to_raw_events(data)
+
+        jira_stages, final = _chat_stages(
+            "jira",
+            extract_jira,
+            clean_jira,
+            transform_jira,
+            out / f"jira_cleaned_{jira_cfg['project_key'].lower()}.json",
+        )
+        stages += jira_stages
+        finals.append(final)
+
+    if "teams" in sources:
+        teams_cfg = sources["teams"]
+
+        def extract_teams(_: dict) -> dict:
+            from app.pipeline.extractors.teams_extractor import TeamsExtractor
+
+            extractor = TeamsExtractor(access_token=teams_cfg.get("token") or os.getenv("TEAMS_TOKEN"))
+            return extractor.extract_all(
+                team_id=teams_cfg["team_id"], include_meetings=teams_cfg.get("include_meetings", False)
+            )
+
+        def clean_teams(data: dict) -> dict:
+            from app.pipeline.cleaners.teams_cleaner import TeamsCleaner
+
+            return TeamsCleaner().clean_all(data, workers=teams_cfg.get("clean_workers", 1))
+
+        def transform_teams(data: dict) -> list:
+            from app.pipeline.core.transformer import transform_teams_to_raw_events
+
+            return transform_teams_to_raw_events(data)
+
+        teams_stages, final = _chat_stages(
+            "teams",
+            extract_teams,
+            clean_teams,
+            transform_teams,
+            out / f"teams_cleaned_{teams_cfg['team_id'][:8]}.json",
+        )
+        stages += teams_stages
+        finals.append(final)
+
+    if upload and finals:
+        def upload_stage(inputs: dict) -> dict:
+            from app.pipeline.core.astra_uploader import AstraDBUploader
+
+            uploader = AstraDBUploader()
+            counts: dict[str, int] = {}
+            for stage_name, data in inputs.items():
+                if stage_name.endswith("_github"):
+                    counts.update(uploader.upload_github_data(data))
+                else:
+                    source = stage_name.removeprefix("transform_")
+                    counts[source] = uploader.upload_raw_events(data.get("raw_events", []), repo_id=source)
+            return {"uploaded": [{"collection": k, "count": v} for k, v in counts.items()]}
+
+        stages.append(Stage("upload", upload_stage, finals))
+
+    return stages
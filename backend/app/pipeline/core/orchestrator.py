@@ -0,0 +1,294 @@
+"""
+Stage-DAG orchestrator for multi-source pipeline runs.
+
+Stages (extract, clean, transform, embed, upload) are declared with their
+dependencies and executed on a thread pool as soon as their inputs are ready,
+so independent sources run concurrently. Each stage is timed, can be
+checkpointed to disk and resumed, and its output is released from memory as
+soon as every downstream stage has consumed it. Checkpoints only outlive an
+interrupted or failed run: once every stage completes they are cleared, so
+the next run starts fresh.
+"""
+
+import hashlib
+import json
+import shutil
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+from app.core.log import get_logger
+from app.core.metrics import PIPELINE_STAGE_RECORDS, PIPELINE_STAGE_RUNS, PIPELINE_STAGE_SECONDS
+
+logger = get_logger(__name__)
+
+# A stage function receives the outputs of its dependencies keyed by stage name
+StageFn = Callable[[dict[str, Any]], Any]
+
+
+@dataclass
+class Stage:
+    """A single pipeline step and the stages it depends on."""
+
+    name: str
+    fn: StageFn
+    depends_on: list[str] = field(default_factory=list)
+
+
+@dataclass
+class StageResult:
+    """Outcome of running (or resuming) a stage."""
+
+    name: str
+    status: str  # "done", "resumed", "failed" or "skipped"
+    duration_seconds: float = 0.0
+    records: int = 0
+    error: str | None = None
+
+
+def count_records(output: Any) -> int:
+    """Count records in a stage output (list length, or sum of list values in a dict)."""
+    if isinstance(output, list):
+        return len(output)
+    if isinstance(output, dict):
+        return sum(len(v) for v in output.values() if isinstance(v, list))
+    return 0
+
+
+class PipelineRunner:
+    """Execute a DAG of stages on a worker pool with checkpoints."""
+
+    def __init__(
+        self,
+        stages: list[Stage],
+        max_workers: int = 4,
+        checkpoint_dir: str | None = None,
+        run_config: dict[str, Any] | None = None,
+    ):
+        """Initialize the runner.
+
+        Args:
+            stages: Stages to run; names must be unique
+            max_workers: Size of the worker pool
+            checkpoint_dir: Directory for per-stage checkpoints (disabled if None)
+            run_config: Run parameters; checkpoints from a run with a different
+                config are discarded instead of resumed
+        """
+        self.stages = {stage.name: stage for stage in stages}
+        if len(self.stages) != len(stages):
+            raise ValueError("Stage names must be unique")
+        self.max_workers = max_workers
+        self.checkpoint_dir = Path(checkpoint_dir) if checkpoint_dir else None
+        self.run_signature = hashlib.sha256(
+            json.dumps(run_config or {}, sort_keys=True, default=str).encode()
+        ).hexdigest()[:16]
+
+        self._validate()
+
+        # Downstream consumers per stage, used to free outputs early
+        self._consumers: dict[str, set[str]] = {name: set() for name in self.stages}
+        for stage in stages:
+            for dep in stage.depends_on:
+                self._consumers[dep].add(stage.name)
+
+    def _validate(self) -> None:
+        """Reject unknown dependencies and cycles."""
+        for stage in self.stages.values():
+            for dep in stage.depends_on:
+                if dep not in self.stages:
+                    raise ValueError(f"Stage '{stage.name}' depends on unknown stage '{dep}'")
+
+        visiting: set[str] = set()
+        visited: set[str] = set()
+
+        def visit(name: str) -> None:
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(f"Pipeline has a dependency cycle through '{name}'")
+            visiting.add(name)
+            for dep in self.stages[name].depends_on:
+                visit(dep)
+            visiting.discard(name)
+            visited.add(name)
+
+        for name in self.stages:
+            visit(name)
+
+    # -- checkpoints ---------------------------------------------------------
+
+    def _manifest_path(self) -> Path:
+        assert self.checkpoint_dir is not None
+        return self.checkpoint_dir / "manifest.json"
+
+    def _load_manifest(self) -> dict[str, Any]:
+        """Load the checkpoint manifest, discarding it if the run config changed."""
+        if not self.checkpoint_dir:
+            return {"signature": self.run_signature, "completed": {}}
+        path = self._manifest_path()
+        if path.exists():
+            manifest = json.loads(path.read_text())
+            if manifest.get("signature") == self.run_signature:
+                return manifest
+            logger.warning("⚠ Run configuration changed; discarding previous checkpoints")
+            self.clear_checkpoints()
+        return {"signature": self.run_signature, "completed": {}}
+
+    def _save_checkpoint(self, manifest: dict[str, Any], result: StageResult, output: Any) -> None:
+        """Persist a stage output and record it in the manifest."""
+        if not self.checkpoint_dir:
+            return
+        self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+        stage_file = self.checkpoint_dir / f"{result.name}.json"
+        tmp_file = stage_file.with_suffix(".json.tmp")
+        with open(tmp_file, "w") as f:
+            json.dump(output, f, default=str)
+        tmp_file.replace(stage_file)
+
+        manifest["completed"][result.name] = {
+            "records": result.records,
+            "duration_seconds": result.duration_seconds,
+        }
+        tmp_manifest = self._manifest_path().with_suffix(".json.tmp")
+        tmp_manifest.write_text(json.dumps(manifest, indent=2))
+        tmp_manifest.replace(self._manifest_path())
+
+    def _load_checkpoint(self, name: str) -> Any:
+        """Read a checkpointed stage output back from disk."""
+        assert self.checkpoint_dir is not None
+        with open(self.checkpoint_dir / f"{name}.json") as f:
+            return json.load(f)
+
+    def clear_checkpoints(self) -> None:
+        """Delete all checkpoints so the next run starts fresh."""
+        if self.checkpoint_dir and self.checkpoint_dir.exists():
+            shutil.rmtree(self.checkpoint_dir)
+
+    # -- execution -----------------------------------------------------------
+
+    def _run_stage(self, stage: Stage, inputs: dict[str, Any]) -> tuple[Any, float]:
+        """Run a stage function and time it."""
+        started = time.perf_counter()
+        output = stage.fn(inputs)
+        return output, time.perf_counter() - started
+
+    def run(self) -> dict[str, StageResult]:
+        """Run all stages, resuming from checkpoints where possible.
+
+        Checkpoints are cleared when every stage completes.
+
+        Returns:
+            Stage results keyed by stage name, in completion order
+        """
+        manifest = self._load_manifest()
+        results: dict[str, StageResult] = {}
+        outputs: dict[str, Any] = {}
+        # Consumers that still need each stage's output
+        pending_consumers = {name: set(c) for name, c in self._consumers.items()}
+        resumable = set(manifest["completed"]) if self.checkpoint_dir else set()
+
+        def release(dep: str, consumer: str) -> None:
+            """Drop an output from memory once all its consumers have started."""
+            pending_consumers[dep].discard(consumer)
+            if not pending_consumers[dep]:
+                outputs.pop(dep, None)
+
+        def gather_inputs(stage: Stage) -> dict[str, Any]:
+            inputs = {}
+            for dep in stage.depends_on:
+                if dep not in outputs and dep in resumable:
+                    outputs[dep] = self._load_checkpoint(dep)
+                inputs[dep] = outputs.get(dep)
+                release(dep, stage.name)
+            return inputs
+
+        remaining = dict(self.stages)
+        running: dict[Future, Stage] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="stage") as pool:
+            while remaining or running:
+                # Schedule every stage whose dependencies are settled
+                for name, stage in list(remaining.items()):
+                    dep_results = [results.get(dep) for dep in stage.depends_on]
+                    if any(r is None for r in dep_results):
+                        continue
+                    del remaining[name]
+
+                    failed_deps = [r.name for r in dep_results if r.status in ("failed", "skipped")]
+                    if failed_deps:
+                        results[name] = StageResult(
+                            name=name,
+                            status="skipped",
+                            error=f"upstream failed: {', '.join(failed_deps)}",
+                        )
+                        for dep in stage.depends_on:
+                            release(dep, name)
+                        PIPELINE_STAGE_RUNS.inc(name, "skipped")
+                        logger.info("  ⏭ %s skipped (%s)", name, results[name].error)
+                        continue
+
+                    if name in resumable:
+                        info = manifest["completed"][name]
+                        results[name] = StageResult(
+                            name=name, status="resumed", records=info.get("records", 0)
+                        )
+                        for dep in stage.depends_on:
+                            release(dep, name)
+                        PIPELINE_STAGE_RUNS.inc(name, "resumed")
+                        logger.info("  ↺ %s resumed from checkpoint", name)
+                        continue
+
+                    running[pool.submit(self._run_stage, stage, gather_inputs(stage))] = stage
+
+                if not running:
+                    continue
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage = running.pop(future)
+                    try:
+                        output, duration = future.result()
+                    except Exception as e:
+                        results[stage.name] = StageResult(name=stage.name, status="failed", error=str(e))
+                        PIPELINE_STAGE_RUNS.inc(stage.name, "failed")
+                        logger.error("  ✗ %s failed: %s", stage.name, e)
+                        continue
+
+                    result = StageResult(
+                        name=stage.name,
+                        status="done",
+                        duration_seconds=round(duration, 3),
+                        records=count_records(output),
+                    )
+                    results[stage.name] = result
+                    PIPELINE_STAGE_RUNS.inc(stage.name, "done")
+                    PIPELINE_STAGE_SECONDS.observe(duration, stage.name)
+                    PIPELINE_STAGE_RECORDS.inc(stage.name, amount=result.records)
+                    self._save_checkpoint(manifest, result, output)
+
+                    if pending_consumers[stage.name]:
+                        if self.checkpoint_dir:
+                            # Reloaded from disk on demand; keeps peak memory bounded
+                            resumable.add(stage.name)
+                        else:
+                            outputs[stage.name] = output
+                    logger.info("  ✓ %s (%d records, %.2fs)", stage.name, result.records, result.duration_seconds)
+
+        if all(result.status in ("done", "resumed") for result in results.values()):
+            # Nothing left to resume; a re-run must sync again, not replay this one
+            self.clear_checkpoints()
+
+        return results
+
+
+def print_stage_summary(results: dict[str, StageResult]) -> None:
+    """Print a per-stage timing table."""
+    print("\nStage summary:")
+    print(f"  {'stage':<24} {'status':<8} {'records':>8} {'seconds':>9}")
+    for result in results.values():
+        print(
+            f"  {result.name:<24} {result.status:<8} {result.records:>8} "
+            f"{result.duration_seconds:>9.2f}"
+        )
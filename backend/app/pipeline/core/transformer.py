@@ -1,9 +1,20 @@
 """Transform extracted data into RawEvent format for FlowSight ingestion."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any
 
+from app.core.log import get_logger
 from app.models.events import RawEvent
+from app.pipeline.cleaners.text_scan import extract_references, scan_slack_text
+from app.services.reference_index import (
+    commit_ref,
+    issue_ref,
+    pr_ref,
+    refs_from_cleaned,
+    refs_from_linked_issues,
+)
+
+logger = get_logger(__name__)
 
 
 def transform_slack_to_raw_events(slack_data: dict[str, Any]) -> list[RawEvent]:
@@ -11,11 +22,17 @@ def transform_slack_to_raw_events(slack_data: dict[str, Any]) -> list[RawEvent]:
     events: list[RawEvent] = []
 
     for message in slack_data.get("messages", []):
+        # Cleaned messages carry references; raw/demo exports only have the text
+        references = message.get("references")
+        if references is None:
+            references = extract_references(message.get("text", ""))
+
         events.append(
             RawEvent(
                 source="slack",
                 type="message",
-                id=message["ts"],
+                # Demo exports have no Slack ts; channel + timestamp identifies those
+                id=message.get("ts") or f"{message.get('channel', '')}:{message['timestamp']}",
                 timestamp=datetime.fromisoformat(message["timestamp"].replace("Z", "+00:00")),
                 author=message.get("username"),
                 branch=None,
@@ -23,6 +40,7 @@ def transform_slack_to_raw_events(slack_data: dict[str, Any]) -> list[RawEvent]:
                 key=None,
                 assignee=None,
                 conclusion=None,
+                references=refs_from_cleaned(references) or None,
             )
         )
 
@@ -30,8 +48,12 @@ def transform_slack_to_raw_events(slack_data: dict[str, Any]) -> list[RawEvent]:
 
 
 def transform_jira_to_raw_events(jira_data: dict[str, Any]) -> list[RawEvent]:
-    """Transform Jira data into RawEvent format."""
+    """Transform Jira data into RawEvent format (issues plus status intervals)."""
     events: list[RawEvent] = []
+    generated_at = jira_data.get("metadata", {}).get("generated_at")
+    extracted_at = datetime.fromisoformat(generated_at) if generated_at else datetime.now(timezone.utc)
+    if extracted_at.tzinfo is None:
+        extracted_at = extracted_at.astimezone()
 
     for issue in jira_data.get("issues", []):
         events.append(
@@ -46,9 +68,31 @@ def transform_jira_to_raw_events(jira_data: dict[str, Any]) -> list[RawEvent]:
                 key=issue["key"],
                 assignee=issue.get("assignee"),
                 conclusion=None,
+                references=refs_from_cleaned(issue.get("references")) or None,
             )
         )
 
+        # One event per status interval, carrying its time in status
+        for position, interval in enumerate(issue.get("status_history", [])):
+            start = datetime.fromisoformat(interval["start"].replace("Z", "+00:00"))
+            end = datetime.fromisoformat(interval["end"].replace("Z", "+00:00")) if interval["end"] else None
+            events.append(
+                RawEvent(
+                    source="jira",
+                    type="status_interval",
+                    id=f"{issue['key']}:{position}",
+                    timestamp=start,
+                    author=None,
+                    branch=None,
+                    status=interval["status"],
+                    key=issue["key"],
+                    assignee=issue.get("assignee"),
+                    # Open (current) intervals end at extraction time
+                    conclusion="closed" if end else "open",
+                    duration_hours=round(((end or extracted_at) - start).total_seconds() / 3600, 2),
+                )
+            )
+
     return events
 
 
@@ -70,6 +114,7 @@ def transform_teams_to_raw_events(teams_data: dict[str, Any]) -> list[RawEvent]:
                 key=None,
                 assignee=None,
                 conclusion=None,
+                references=refs_from_cleaned(message.get("references")) or None,
             )
         )
 
@@ -134,6 +179,10 @@ def transform_github_to_raw_events(github_data: dict[str, Any]) -> list[RawEvent
         requested_reviewers = pr.get("requested_reviewers", [])
         assignee = requested_reviewers[0] if requested_reviewers else None
 
+        # Exact links: the PR's commits and the issues named in its body
+        references = [commit_ref(sha) for sha in pr.get("commits", [])]
+        references += refs_from_linked_issues(pr.get("linked_issues"))
+
         events.append(
             RawEvent(
                 source="github",
@@ -146,6 +195,7 @@ def transform_github_to_raw_events(github_data: dict[str, Any]) -> list[RawEvent
                 key=f"PR-{pr['number']}",  # Use PR-number as key
                 assignee=assignee,
                 conclusion=None,
+                references=references or None,
             )
         )
 
@@ -169,6 +219,7 @@ def transform_github_to_raw_events(github_data: dict[str, Any]) -> list[RawEvent
                 key=None,
                 assignee=None,
                 conclusion=conclusion,
+                references=[pr_ref(ci_run["pr_number"])] if ci_run.get("pr_number") else None,
             )
         )
 
@@ -182,7 +233,7 @@ def transform_github_to_raw_events(github_data: dict[str, Any]) -> list[RawEvent
                 type="deployment",
                 id=deployment["id"],
                 timestamp=datetime.fromisoformat(
-                    deployment["created_at"].replace("Z", "+00:00")
+                    (deployment.get("created_at") or deployment["deployed_at"]).replace("Z", "+00:00")
                 ),
                 branch=None,
                 author=deployment.get("deployed_by"),
@@ -196,6 +247,170 @@ def transform_github_to_raw_events(github_data: dict[str, Any]) -> list[RawEvent
     return events
 
 
+def _parse_webhook_timestamp(value: Any) -> datetime:
+    """Parse a webhook timestamp (ISO string, epoch seconds/millis, or Slack ts)."""
+    if isinstance(value, (int, float)):
+        # Jira sends epoch milliseconds
+        seconds = value / 1000 if value > 10**11 else value
+        return datetime.fromtimestamp(seconds, tz=timezone.utc)
+    if isinstance(value, str) and value:
+        try:
+            return datetime.fromtimestamp(float(value), tz=timezone.utc)
+        except ValueError:
+            return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return datetime.now(timezone.utc)
+
+
+def transform_github_webhook(event_name: str, payload: dict[str, Any]) -> list[RawEvent]:
+    """
+    Transform a GitHub webhook delivery into RawEvent format.
+
+    Supports push, pull_request, workflow_run and deployment_status deliveries;
+    other event types are ignored.
+
+    Args:
+        event_name: Value of the X-GitHub-Event header
+        payload: Parsed webhook body
+
+    Returns:
+        List of RawEvent objects (empty for unsupported deliveries)
+    """
+    events: list[RawEvent] = []
+
+    if event_name == "push":
+        branch = payload.get("ref", "").removeprefix("refs/heads/") or None
+        for commit in payload.get("commits", []):
+            author = commit.get("author") or {}
+            events.append(
+                RawEvent(
+                    source="git",
+                    type="commit",
+                    id=commit["id"][:12],
+                    timestamp=_parse_webhook_timestamp(commit.get("timestamp")),
+                    branch=branch,
+                    author=author.get("username") or author.get("name"),
+                    status="committed",
+                )
+            )
+
+    elif event_name == "pull_request":
+        pr = payload.get("pull_request", {})
+        if pr.get("merged"):
+            status = "merged"
+        elif pr.get("draft"):
+            status = "draft"
+        else:
+            status = pr.get("state", "open")
+        reviewers = pr.get("requested_reviewers") or []
+        references = refs_from_cleaned(
+            extract_references(f"{pr.get('title') or ''}\n{pr.get('body') or ''}")
+        )
+        events.append(
+            RawEvent(
+                source="github",
+                type="pull_request",
+                id=str(pr.get("number", payload.get("number"))),
+                timestamp=_parse_webhook_timestamp(pr.get("created_at")),
+                branch=(pr.get("head") or {}).get("ref"),
+                author=(pr.get("user") or {}).get("login"),
+                status=status,
+                key=f"PR-{pr.get('number', payload.get('number'))}",
+                assignee=reviewers[0].get("login") if reviewers else None,
+                references=references or None,
+            )
+        )
+
+    elif event_name == "workflow_run":
+        run = payload.get("workflow_run", {})
+        status = run.get("conclusion") or run.get("status") or "pending"
+        references = [pr_ref(pr["number"]) for pr in run.get("pull_requests") or []]
+        if run.get("head_sha"):
+            references.append(commit_ref(run["head_sha"]))
+        events.append(
+            RawEvent(
+                source="ci",
+                type="workflow_run",
+                id=f"run-{run.get('id')}",
+                timestamp=_parse_webhook_timestamp(run.get("created_at")),
+                branch=run.get("head_branch"),
+                author=(run.get("actor") or {}).get("login"),
+                status=status,
+                conclusion=run.get("conclusion"),
+                references=references or None,
+            )
+        )
+
+    elif event_name == "deployment_status":
+        deployment = payload.get("deployment", {})
+        status = (payload.get("deployment_status") or {}).get("state", "pending")
+        events.append(
+            RawEvent(
+                source="github",
+                type="deployment",
+                id=f"deploy-{deployment.get('id')}",
+                timestamp=_parse_webhook_timestamp(deployment.get("created_at")),
+                author=(deployment.get("creator") or {}).get("login"),
+                status=status,
+                conclusion=status if status in ["success", "failure"] else None,
+            )
+        )
+
+    return events
+
+
+def transform_jira_webhook(payload: dict[str, Any]) -> list[RawEvent]:
+    """Transform a Jira issue webhook (jira:issue_created/updated) into RawEvent format."""
+    issue = payload.get("issue")
+    if not issue or not payload.get("webhookEvent", "").startswith("jira:issue"):
+        return []
+
+    fields = issue.get("fields", {})
+
+    def _user(user: dict | None) -> str | None:
+        if not user:
+            return None
+        return user.get("emailAddress") or user.get("displayName")
+
+    return [
+        RawEvent(
+            source="jira",
+            type="issue",
+            id=issue["key"],
+            timestamp=_parse_webhook_timestamp(fields.get("created") or payload.get("timestamp")),
+            author=_user(fields.get("reporter")),
+            status=(fields.get("status") or {}).get("name"),
+            key=issue["key"],
+            assignee=_user(fields.get("assignee")),
+            references=[
+                ref for ref in refs_from_cleaned(extract_references(fields.get("summary") or ""))
+                if ref != issue_ref(issue["key"])
+            ] or None,
+        )
+    ]
+
+
+def transform_slack_webhook(payload: dict[str, Any]) -> list[RawEvent]:
+    """Transform a Slack Events API callback into RawEvent format."""
+    event = payload.get("event", {})
+    if payload.get("type") != "event_callback" or event.get("type") != "message":
+        return []
+
+    # Skip edits, deletions, joins and bot chatter
+    if event.get("subtype"):
+        return []
+
+    return [
+        RawEvent(
+            source="slack",
+            type="message",
+            id=event["ts"],
+            timestamp=_parse_webhook_timestamp(event["ts"]),
+            author=event.get("user"),
+            references=refs_from_cleaned(scan_slack_text(event.get("text", ""))[2]) or None,
+        )
+    ]
+
+
 def save_raw_events(events: list[RawEvent], output_path: str) -> None:
     """
     Save RawEvent list to JSON file.
@@ -218,4 +433,4 @@ def save_raw_events(events: list[RawEvent], output_path: str) -> None:
     with open(output_file, "w") as f:
         json.dump(events_data, f, indent=2, default=str)
 
-    print(f"✓ Saved {len(events)} raw events to {output_path}")
+    logger.info("✓ Saved %s raw events to %s", len(events), output_path)
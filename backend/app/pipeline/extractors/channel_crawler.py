@@ -0,0 +1,314 @@
+"""Concurrent, rate-limited channel crawling for chat extractors.
+
+Slack and Teams both expose messages per channel, so a workspace crawl is
+a set of independent channel walks. ``ChannelCrawler`` runs them on a
+bounded thread pool, and every request goes through ``throttled_get``,
+which spaces calls with a shared :class:`RateLimiter` (Slack publishes
+per-method tier limits) and backs off on HTTP 429/503 using Retry-After
+(how both Slack and Microsoft Graph signal throttling).
+
+With a spool directory, each channel's messages are streamed to
+``<spool_dir>/<channel_id>.jsonl`` as pages arrive, so memory holds at
+most one page per in-flight channel. A completed file gets a sidecar
+manifest (``<channel_id>.meta.json``) recording the crawl parameters and
+the newest message position. On the next run a file is reused only if
+its parameters match, and is first extended with the messages posted
+since (``fetch_newer``), so an interrupted crawl resumes and a rerun
+picks up new messages without refetching history.
+"""
+
+import json
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator
+
+from app.core.log import get_logger
+
+if TYPE_CHECKING:
+    import requests
+
+logger = get_logger(__name__)
+
+# HTTP statuses that mean "slow down and retry"
+THROTTLE_STATUSES = {429, 503}
+
+
+class RateLimiter:
+    """Thread-safe limiter spacing calls evenly at ``per_minute`` requests per minute."""
+
+    def __init__(self, per_minute: float | None):
+        self.interval = 60.0 / per_minute if per_minute else 0.0
+        self._next_at = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until the next request slot."""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_at - now
+            self._next_at = max(now, self._next_at) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Push every caller back after the server asked us to wait."""
+        with self._lock:
+            self._next_at = max(self._next_at, time.monotonic() + seconds)
+
+
+def throttled_get(
+    url: str,
+    headers: dict[str, str],
+    params: dict[str, Any] | None = None,
+    limiter: RateLimiter | None = None,
+    max_retries: int = 5,
+) -> "requests.Response":
+    """
+    GET with rate limiting and Retry-After aware retries.
+
+    Args:
+        url: Request URL
+        headers: Request headers
+        params: Query parameters
+        limiter: Shared limiter for the API (None = no client-side limit)
+        max_retries: Retries on throttling responses before giving up
+
+    Returns:
+        The successful response (``raise_for_status`` already applied)
+    """
+    import requests
+
+    for attempt in range(max_retries + 1):
+        if limiter:
+            limiter.acquire()
+        response = requests.get(url, headers=headers, params=params or {})
+        if response.status_code not in THROTTLE_STATUSES or attempt == max_retries:
+            response.raise_for_status()
+            return response
+
+        retry_after = response.headers.get("Retry-After")
+        delay = float(retry_after) if retry_after and retry_after.isdigit() else 2.0 ** attempt
+        if limiter:
+            limiter.pause(delay)
+        time.sleep(delay)
+
+    raise RuntimeError("unreachable")
+
+
+@dataclass
+class ChannelResult:
+    """Outcome of crawling one channel."""
+
+    channel_id: str
+    count: int = 0
+    path: Path | None = None
+    messages: list[dict[str, Any]] | None = None
+    resumed: bool = False
+    error: str | None = None
+
+
+def _spool_name(channel_id: str) -> str:
+    """Filesystem-safe file stem for a channel ID (Teams IDs contain ':' and '@')."""
+    return re.sub(r"[^\w.-]", "_", channel_id)
+
+
+class ChannelCrawler:
+    """Crawl many channels concurrently, optionally spooling results to disk."""
+
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        spool_dir: str | None = None,
+        params: dict[str, Any] | None = None,
+        position_key: str | None = None,
+        max_messages: int | None = None,
+    ):
+        """Initialize the crawler.
+
+        Args:
+            max_concurrency: Channels crawled at once (per workspace / team)
+            spool_dir: Directory for per-channel JSONL files (None = keep in memory)
+            params: Crawl parameters; a spooled file is reused only if they match
+            position_key: Message field ordering messages in time (e.g. Slack "ts"),
+                recorded so a reused file can be extended with newer messages
+            max_messages: Messages kept per channel (None = full history)
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.spool_dir = Path(spool_dir) if spool_dir else None
+        self.params = {**(params or {}), "max_messages": max_messages}
+        self.position_key = position_key
+        self.max_messages = max_messages
+
+    def _read_manifest(self, manifest_path: Path) -> dict[str, Any] | None:
+        """The manifest of a reusable spool file, or None if it must be recrawled."""
+        try:
+            manifest = json.loads(manifest_path.read_text())
+        except (OSError, ValueError):
+            return None
+        if manifest.get("params") != self.params:
+            return None
+        return manifest
+
+    def _write_spool(
+        self,
+        channel_id: str,
+        messages: Iterable[dict[str, Any]],
+        previous: Path | None = None,
+        newest: Any = None,
+    ) -> tuple[int, Any]:
+        """
+        Write ``messages`` (then the lines of ``previous``) to the channel's file.
+
+        The file is written to a temp path and renamed, and the manifest is
+        written after it, so only complete channels are ever reused.
+
+        Returns:
+            Messages written and the newest position seen
+        """
+        stem = self.spool_dir / _spool_name(channel_id)
+        path, tmp_path = stem.with_suffix(".jsonl"), stem.with_suffix(".jsonl.tmp")
+        count = 0
+        with open(tmp_path, "w") as f:
+            for message in messages:
+                if self.max_messages is not None and count >= self.max_messages:
+                    break
+                f.write(json.dumps(message, default=str))
+                f.write("\n")
+                count += 1
+                position = message.get(self.position_key) if self.position_key else None
+                if position is not None and (newest is None or position > newest):
+                    newest = position
+            if previous is not None:
+                with open(previous) as old:
+                    for line in old:
+                        if self.max_messages is not None and count >= self.max_messages:
+                            break
+                        f.write(line)
+                        count += 1
+        tmp_path.replace(path)
+
+        manifest = {
+            "channel_id": channel_id,
+            "params": self.params,
+            "newest": newest,
+            "count": count,
+            "crawled_at": time.time(),
+        }
+        manifest_tmp = stem.with_suffix(".meta.json.tmp")
+        manifest_tmp.write_text(json.dumps(manifest, default=str))
+        manifest_tmp.replace(stem.with_suffix(".meta.json"))
+        return count, newest
+
+    def _crawl_one(
+        self,
+        channel_id: str,
+        fetch: Callable[[str], Iterable[dict[str, Any]]],
+        fetch_newer: Callable[[str, Any], Iterable[dict[str, Any]]] | None,
+    ) -> ChannelResult:
+        if not self.spool_dir:
+            messages = list(fetch(channel_id))
+            return ChannelResult(channel_id, count=len(messages), messages=messages)
+
+        stem = self.spool_dir / _spool_name(channel_id)
+        path = stem.with_suffix(".jsonl")
+        manifest = self._read_manifest(stem.with_suffix(".meta.json")) if path.exists() else None
+        if manifest is None:
+            count, _ = self._write_spool(channel_id, fetch(channel_id))
+            return ChannelResult(channel_id, count=count, path=path)
+
+        newest = manifest.get("newest")
+        if fetch_newer is None or newest is None:
+            return ChannelResult(channel_id, count=manifest["count"], path=path, resumed=True)
+
+        # Prepend what was posted since the last crawl (newest first, like the file)
+        count, _ = self._write_spool(channel_id, fetch_newer(channel_id, newest), previous=path, newest=newest)
+        return ChannelResult(channel_id, count=count, path=path, resumed=True)
+
+    def crawl(
+        self,
+        channel_ids: list[str],
+        fetch: Callable[[str], Iterable[dict[str, Any]]],
+        fetch_newer: Callable[[str, Any], Iterable[dict[str, Any]]] | None = None,
+    ) -> list[ChannelResult]:
+        """
+        Crawl channels with at most ``max_concurrency`` in flight.
+
+        Args:
+            channel_ids: Channels to crawl
+            fetch: Function yielding one channel's messages, newest first (pages fetched lazily)
+            fetch_newer: Function yielding a channel's messages newer than a recorded
+                position, newest first; without it a matching spool file is reused as is
+
+        Returns:
+            One result per channel, in ``channel_ids`` order
+        """
+        if self.spool_dir:
+            self.spool_dir.mkdir(parents=True, exist_ok=True)
+
+        results: dict[str, ChannelResult] = {}
+        with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="crawl") as pool:
+            futures = {pool.submit(self._crawl_one, cid, fetch, fetch_newer): cid for cid in channel_ids}
+            for future in as_completed(futures):
+                channel_id = futures[future]
+                try:
+                    results[channel_id] = future.result()
+                except Exception as e:
+                    results[channel_id] = ChannelResult(channel_id, error=str(e))
+                    logger.warning("  ⚠ Warning: Failed to extract from channel %s: %s", channel_id, e)
+
+        return [results[cid] for cid in channel_ids]
+
+
+def write_json_stream(
+    path: str | Path,
+    head: dict[str, Any],
+    key: str,
+    items: Iterable[dict[str, Any]],
+    tail: Callable[[int], dict[str, Any]],
+) -> int:
+    """
+    Write ``{**head, key: [*items], **tail(count)}`` as JSON without holding ``items``.
+
+    Items are written one per line as they are produced; ``tail`` receives
+    the item count, for totals known only at the end. The file is written
+    to a temp path and renamed, so readers never see a partial dataset.
+
+    Returns:
+        Number of items written
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    count = 0
+    with open(tmp_path, "w") as f:
+        f.write("{\n")
+        for name, value in head.items():
+            f.write(f"  {json.dumps(name)}: {json.dumps(value, default=str)},\n")
+        f.write(f"  {json.dumps(key)}: [")
+        for item in items:
+            f.write("\n    " if count == 0 else ",\n    ")
+            f.write(json.dumps(item, default=str))
+            count += 1
+        f.write("\n  ]" if count else "]")
+        for name, value in tail(count).items():
+            f.write(f",\n  {json.dumps(name)}: {json.dumps(value, default=str)}")
+        f.write("\n}\n")
+    tmp_path.replace(path)
+    return count
+
+
+def iter_channel_messages(results: list[ChannelResult]) -> Iterator[dict[str, Any]]:
+    """Yield messages from crawl results, reading spooled channels lazily."""
+    for result in results:
+        if result.messages is not None:
+            yield from result.messages
+        elif result.path is not None:
+            with open(result.path) as f:
+                for line in f:
+                    yield json.loads(line)
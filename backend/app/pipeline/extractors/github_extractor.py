@@ -5,7 +5,9 @@ from datetime import datetime
 from typing import Any
 from pathlib import Path
 
-import requests
+from app.core.log import get_logger
+
+logger = get_logger(__name__)
 
 
 class GitHubExtractor:
@@ -27,6 +29,8 @@ class GitHubExtractor:
 
     def _get(self, endpoint: str, params: dict[str, Any] | None = None) -> Any:
         """Make GET request to GitHub API."""
+        import requests
+
         url = f"{self.base_url}{endpoint}"
         response = requests.get(url, headers=self.headers, params=params or {})
         response.raise_for_status()
@@ -298,23 +302,23 @@ class GitHubExtractor:
         Returns:
             Complete dataset in FlowSight format
         """
-        print(f"Extracting data from {owner}/{repo}...")
+        logger.info("Extracting data from %s/%s...", owner, repo)
 
         # Extract all data
         repository = self.extract_repository_info(owner, repo)
-        print(f"✓ Repository info extracted")
+        logger.info("✓ Repository info extracted")
 
         commits = self.extract_commits(owner, repo)
-        print(f"✓ {len(commits)} commits extracted")
+        logger.info("✓ %s commits extracted", len(commits))
 
         pull_requests = self.extract_pull_requests(owner, repo)
-        print(f"✓ {len(pull_requests)} pull requests extracted")
+        logger.info("✓ %s pull requests extracted", len(pull_requests))
 
         ci_runs = self.extract_workflow_runs(owner, repo)
-        print(f"✓ {len(ci_runs)} CI runs extracted")
+        logger.info("✓ %s CI runs extracted", len(ci_runs))
 
         deployments = self.extract_deployments(owner, repo)
-        print(f"✓ {len(deployments)} deployments extracted")
+        logger.info("✓ %s deployments extracted", len(deployments))
 
         # Build final dataset
         dataset = {
@@ -337,7 +341,7 @@ class GitHubExtractor:
 
             raw_events = transform_github_to_raw_events(dataset)
             dataset["raw_events"] = [event.model_dump(mode="json") for event in raw_events]
-            print(f"✓ {len(raw_events)} events normalized to RawEvent format")
+            logger.info("✓ %s events normalized to RawEvent format", len(raw_events))
 
         # Save to file if path provided
         if output_path:
@@ -345,6 +349,6 @@ class GitHubExtractor:
             output_file.parent.mkdir(parents=True, exist_ok=True)
             with open(output_file, "w") as f:
                 json.dump(dataset, f, indent=2)
-            print(f"✓ Data saved to {output_path}")
+            logger.info("✓ Data saved to %s", output_path)
 
         return dataset
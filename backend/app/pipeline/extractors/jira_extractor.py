@@ -1,12 +1,14 @@
 """Jira data extraction pipeline."""
 
 import json
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any
 from pathlib import Path
 
-import requests
-from requests.auth import HTTPBasicAuth
+from app.core.log import get_logger
+from app.pipeline.extractors.jira_history import build_status_intervals, time_in_status
+
+logger = get_logger(__name__)
 
 
 class JiraExtractor:
@@ -26,11 +28,14 @@ class JiraExtractor:
             jira_api_token: API token for authentication
         """
         self.base_url = jira_url.rstrip("/")
-        self.auth = HTTPBasicAuth(jira_email, jira_api_token) if jira_email and jira_api_token else None
+        # requests treats a (user, password) tuple as HTTP basic auth
+        self.auth = (jira_email, jira_api_token) if jira_email and jira_api_token else None
         self.headers = {"Accept": "application/json"}
 
     def _get(self, endpoint: str, params: dict[str, Any] | None = None) -> Any:
         """Make GET request to Jira API."""
+        import requests
+
         url = f"{self.base_url}/rest/api/3/{endpoint}"
         response = requests.get(
             url, headers=self.headers, auth=self.auth, params=params or {}
@@ -70,24 +75,67 @@ class JiraExtractor:
 
         return sprints
 
+    def _full_changelog(self, issue_key: str) -> list[dict[str, Any]]:
+        """Fetch every changelog history for one issue (when search truncated it)."""
+        histories: list[dict[str, Any]] = []
+        start_at = 0
+        while True:
+            page = self._get(f"issue/{issue_key}/changelog", params={"startAt": start_at, "maxResults": 100})
+            values = page.get("values", [])
+            histories.extend(values)
+            start_at += len(values)
+            if page.get("isLast", True) or not values:
+                return histories
+
+    def _search_issues(
+        self, jql: str, limit: int | None, page_size: int, expand_changelog: bool
+    ) -> list[dict[str, Any]]:
+        """Run a paginated JQL search, optionally expanding changelogs in bulk."""
+        params: dict[str, Any] = {
+            "jql": jql,
+            "fields": "summary,status,assignee,reporter,created,updated,issuetype,priority,labels,timetracking,customfield_10016",  # customfield_10016 is often story points
+        }
+        if expand_changelog:
+            params["expand"] = "changelog"
+
+        results: list[dict[str, Any]] = []
+        start_at = 0
+        while limit is None or len(results) < limit:
+            max_results = page_size if limit is None else min(page_size, limit - len(results))
+            page = self._get("search", params={**params, "startAt": start_at, "maxResults": max_results})
+            issues = page.get("issues", [])
+            results.extend(issues)
+            start_at += len(issues)
+            if not issues or start_at >= page.get("total", 0):
+                break
+
+        return results
+
     def extract_issues(
-        self, project_key: str, limit: int = 100, jql: str | None = None
+        self,
+        project_key: str,
+        limit: int | None = 100,
+        jql: str | None = None,
+        include_history: bool = True,
+        page_size: int = 100,
     ) -> list[dict[str, Any]]:
-        """Extract issues from a project."""
+        """Extract issues from a project.
+
+        Args:
+            project_key: Jira project key
+            limit: Maximum number of issues (None = all matching issues)
+            jql: Optional JQL overriding the default project query
+            include_history: Expand changelogs in the search itself and derive
+                ``status_history`` / ``time_in_status`` (no per-issue calls
+                unless an issue has more history than the search returns)
+            page_size: Issues per search page
+        """
         if not jql:
             jql = f"project = {project_key} ORDER BY created DESC"
 
-        search_results = self._get(
-            "search",
-            params={
-                "jql": jql,
-                "maxResults": limit,
-                "fields": "summary,status,assignee,reporter,created,updated,issuetype,priority,labels,timetracking,customfield_10016",  # customfield_10016 is often story points
-            }
-        )
-
+        now = datetime.now(timezone.utc)
         issues = []
-        for issue_data in search_results.get("issues", []):
+        for issue_data in self._search_issues(jql, limit, page_size, include_history):
             fields = issue_data["fields"]
 
             # Extract assignee
@@ -127,6 +175,15 @@ class JiraExtractor:
                 "time_tracking": time_tracking if time_tracking else None,
             }
 
+            if include_history:
+                changelog = issue_data.get("changelog", {})
+                histories = changelog.get("histories", [])
+                if changelog.get("total", 0) > len(histories):
+                    histories = self._full_changelog(issue_data["key"])
+                intervals = build_status_intervals(fields["created"], issue["status"], histories)
+                issue["status_history"] = intervals
+                issue["time_in_status"] = time_in_status(intervals, now)
+
             issues.append(issue)
 
         return issues
@@ -136,6 +193,8 @@ class JiraExtractor:
         project_key: str,
         board_id: str | None = None,
         output_path: str | None = None,
+        max_issues: int | None = 100,
+        include_history: bool = True,
     ) -> dict[str, Any]:
         """Extract all Jira data and save to file.
 
@@ -143,27 +202,29 @@ class JiraExtractor:
             project_key: Jira project key (e.g., "PROJ")
             board_id: Optional board ID for sprint data
             output_path: Optional path to save JSON output
+            max_issues: Maximum number of issues (None = all)
+            include_history: Include status history and time in status
 
         Returns:
             Complete dataset in FlowSight format
         """
-        print(f"Extracting data from Jira project {project_key}...")
+        logger.info("Extracting data from Jira project %s...", project_key)
 
         # Extract all data
         project = self.extract_project_info(project_key)
-        print(f"✓ Project info extracted: {project['name']}")
+        logger.info("✓ Project info extracted: %s", project['name'])
 
         # Extract sprints if board_id provided
         sprints = []
         if board_id:
             try:
                 sprints = self.extract_sprints(board_id)
-                print(f"✓ {len(sprints)} sprints extracted")
+                logger.info("✓ %s sprints extracted", len(sprints))
             except Exception as e:
-                print(f"⚠ Warning: Could not extract sprints: {e}")
+                logger.warning("⚠ Warning: Could not extract sprints: %s", e)
 
-        issues = self.extract_issues(project_key)
-        print(f"✓ {len(issues)} issues extracted")
+        issues = self.extract_issues(project_key, limit=max_issues, include_history=include_history)
+        logger.info("✓ %s issues extracted", len(issues))
 
         # Build final dataset
         dataset = {
@@ -183,6 +244,6 @@ class JiraExtractor:
             output_file.parent.mkdir(parents=True, exist_ok=True)
             with open(output_file, "w") as f:
                 json.dump(dataset, f, indent=2)
-            print(f"✓ Data saved to {output_path}")
+            logger.info("✓ Data saved to %s", output_path)
 
         return dataset
@@ -0,0 +1,77 @@
+"""Status history and time-in-status for Jira issues.
+
+Jira returns transitions as changelog histories; this module folds them
+into a compact list of status intervals per issue::
+
+    [{"status": "To Do", "start": "...", "end": "..."},
+     {"status": "In Progress", "start": "...", "end": None}]
+
+The last interval is open (``end`` is None) and represents the current
+status. Time in status is summed per status over those intervals.
+"""
+
+from datetime import datetime, timezone
+from typing import Any
+
+
+def _parse(timestamp: str) -> datetime:
+    """Parse a Jira timestamp ("2025-01-10T09:30:00.000+0000" or ISO 8601)."""
+    return datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+
+
+def status_transitions(histories: list[dict[str, Any]]) -> list[tuple[str, str | None, str | None]]:
+    """
+    Extract status transitions from changelog histories.
+
+    Returns:
+        ``(timestamp, from_status, to_status)`` tuples in chronological order
+    """
+    transitions = []
+    for history in histories:
+        for item in history.get("items", []):
+            if item.get("field") == "status":
+                transitions.append((history["created"], item.get("fromString"), item.get("toString")))
+    transitions.sort(key=lambda t: _parse(t[0]))
+    return transitions
+
+
+def build_status_intervals(
+    created: str, current_status: str, histories: list[dict[str, Any]]
+) -> list[dict[str, Any]]:
+    """
+    Fold an issue's changelog into consecutive status intervals.
+
+    Args:
+        created: Issue creation timestamp
+        current_status: Current status name (used when there are no transitions)
+        histories: ``changelog.histories`` from the Jira API
+
+    Returns:
+        Intervals ``{"status", "start", "end"}``; the last one is open
+    """
+    transitions = status_transitions(histories)
+    if not transitions:
+        return [{"status": current_status, "start": created, "end": None}]
+
+    intervals = [{"status": transitions[0][1] or current_status, "start": created, "end": None}]
+    for timestamp, _, to_status in transitions:
+        intervals[-1]["end"] = timestamp
+        intervals.append({"status": to_status or current_status, "start": timestamp, "end": None})
+    return intervals
+
+
+def time_in_status(intervals: list[dict[str, Any]], now: datetime | None = None) -> dict[str, float]:
+    """
+    Total hours spent in each status (the open interval counts up to ``now``).
+
+    Returns:
+        Status name -> hours, in first-entered order
+    """
+    now = now or datetime.now(timezone.utc)
+    totals: dict[str, float] = {}
+    for interval in intervals:
+        start = _parse(interval["start"])
+        end = _parse(interval["end"]) if interval["end"] else now
+        hours = max((end - start).total_seconds(), 0) / 3600
+        totals[interval["status"]] = totals.get(interval["status"], 0) + hours
+    return {status: round(hours, 2) for status, hours in totals.items()}
@@ -1,33 +1,67 @@
 """Slack data extraction pipeline."""
 
-import json
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any
-from pathlib import Path
-
-import requests
+from typing import Any, Iterator
+
+from app.core.log import get_logger
+from app.pipeline.extractors.channel_crawler import (
+    ChannelCrawler,
+    RateLimiter,
+    iter_channel_messages,
+    throttled_get,
+    write_json_stream,
+)
+from app.pipeline.extractors.slack_users import SlackUserDirectory
+
+logger = get_logger(__name__)
+
+# Slack Web API rate-limit tiers (requests per minute, per method, per workspace)
+SLACK_TIER_LIMITS = {2: 20, 3: 50, 4: 100}
+SLACK_METHOD_TIERS = {
+    "team.info": 3,
+    "conversations.list": 2,
+    "conversations.history": 3,
+    "conversations.replies": 3,
+    "users.list": 2,
+    "users.info": 4,
+}
 
 
 class SlackExtractor:
     """Extract data from Slack API and format for FlowSight."""
 
-    def __init__(self, slack_token: str | None = None):
+    def __init__(
+        self,
+        slack_token: str | None = None,
+        user_cache_path: str | None = None,
+        user_cache_ttl: int = 24 * 3600,
+    ):
         """Initialize Slack extractor.
 
         Args:
             slack_token: Slack Bot User OAuth Token
+            user_cache_path: Optional file persisting the user directory across runs
+            user_cache_ttl: Seconds before a persisted user directory is refetched
         """
         self.base_url = "https://slack.com/api"
         self.headers = {
             "Authorization": f"Bearer {slack_token}" if slack_token else "",
             "Content-Type": "application/json",
         }
+        self.users = SlackUserDirectory(self._get, cache_path=user_cache_path, ttl_seconds=user_cache_ttl)
+        # Thread replies added by the last iter_all_messages run
+        self.replies_hydrated = 0
+        # One limiter per method, shared by all crawler threads
+        self.limiters = {
+            method: RateLimiter(SLACK_TIER_LIMITS[tier]) for method, tier in SLACK_METHOD_TIERS.items()
+        }
 
     def _get(self, endpoint: str, params: dict[str, Any] | None = None) -> Any:
-        """Make GET request to Slack API."""
+        """Make GET request to Slack API (rate limited per method tier)."""
         url = f"{self.base_url}/{endpoint}"
-        response = requests.get(url, headers=self.headers, params=params or {})
-        response.raise_for_status()
+        response = throttled_get(url, self.headers, params, limiter=self.limiters.get(endpoint))
         data = response.json()
 
         if not data.get("ok"):
@@ -44,47 +78,62 @@ class SlackExtractor:
             "domain": team_info["team"]["domain"],
         }
 
-    def extract_channels(self, limit: int = 100) -> list[dict[str, Any]]:
-        """Extract channels from workspace."""
-        channels_data = self._get(
-            "conversations.list",
-            params={"exclude_archived": "true", "limit": limit, "types": "public_channel,private_channel"}
-        )
+    def extract_channels(self, page_size: int = 200) -> list[dict[str, Any]]:
+        """Extract every channel in the workspace, following ``next_cursor``.
 
+        Args:
+            page_size: conversations.list page size (Slack recommends <= 200)
+        """
         channels = []
-        for channel in channels_data.get("channels", []):
-            channels.append({
-                "id": channel["id"],
-                "name": f"#{channel['name']}",
-                "purpose": channel.get("purpose", {}).get("value", ""),
-                "is_private": channel.get("is_private", False),
-                "num_members": channel.get("num_members", 0),
-            })
+        cursor = None
+        while True:
+            params: dict[str, Any] = {
+                "exclude_archived": "true",
+                "limit": page_size,
+                "types": "public_channel,private_channel",
+            }
+            if cursor:
+                params["cursor"] = cursor
+            page = self._get("conversations.list", params=params)
+
+            for channel in page.get("channels", []):
+                channels.append({
+                    "id": channel["id"],
+                    "name": f"#{channel['name']}",
+                    "purpose": channel.get("purpose", {}).get("value", ""),
+                    "is_private": channel.get("is_private", False),
+                    "num_members": channel.get("num_members", 0),
+                })
 
-        return channels
+            # conversations.list has no has_more flag; an empty cursor ends the walk
+            cursor = page.get("response_metadata", {}).get("next_cursor")
+            if not cursor:
+                return channels
+
+    def prefetch_users(self) -> None:
+        """Load the user directory in bulk before extracting messages."""
+        try:
+            count = self.users.prefetch()
+            logger.info("✓ %s users in directory", count)
+        except Exception as e:
+            # e.g. missing users:read scope; unknown IDs are looked up individually
+            logger.warning("  ⚠ Warning: users.list prefetch failed, falling back to per-user lookups: %s", e)
+
+    def _format_messages(self, raw_messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Convert a page of API messages to FlowSight format."""
+        raw_messages = [
+            msg for msg in raw_messages
+            # Skip bot messages and system messages
+            if msg.get("subtype") not in ["bot_message", "channel_join", "channel_leave"]
+        ]
 
-    def extract_messages(
-        self, channel_id: str, limit: int = 100
-    ) -> list[dict[str, Any]]:
-        """Extract messages from a channel."""
-        messages_data = self._get(
-            "conversations.history",
-            params={"channel": channel_id, "limit": limit}
-        )
+        # Resolve every author on the page at once (cached, one lookup per unknown user)
+        usernames = self.users.resolve_many(msg.get("user", "unknown") for msg in raw_messages)
 
         messages = []
-        for msg in messages_data.get("messages", []):
-            # Skip bot messages and system messages
-            if msg.get("subtype") in ["bot_message", "channel_join", "channel_leave"]:
-                continue
-
-            # Get user info
+        for msg in raw_messages:
             user_id = msg.get("user", "unknown")
-            try:
-                user_info = self._get("users.info", params={"user": user_id})
-                username = user_info["user"]["real_name"]
-            except:
-                username = user_id
+            username = usernames[user_id]
 
             # Get reactions
             reactions = []
@@ -95,13 +144,9 @@ class SlackExtractor:
                     "users": reaction.get("users", [])
                 })
 
-            # Extract mentions
+            # Extract mentions (looks for <@USER_ID>)
             text = msg.get("text", "")
-            mentions = []
-            # Simple mention extraction (looks for <@USER_ID>)
-            import re
-            user_mentions = re.findall(r"<@(\w+)>", text)
-            mentions.extend(user_mentions)
+            mentions = re.findall(r"<@(\w+)>", text)
 
             message = {
                 "ts": msg["ts"],
@@ -110,6 +155,7 @@ class SlackExtractor:
                 "text": text,
                 "timestamp": datetime.fromtimestamp(float(msg["ts"])).isoformat() + "Z",
                 "thread_ts": msg.get("thread_ts"),
+                "reply_count": msg.get("reply_count", 0),
                 "reactions": reactions if reactions else None,
                 "mentions": mentions if mentions else None,
             }
@@ -118,72 +164,268 @@ class SlackExtractor:
 
         return messages
 
-    def extract_all_messages(
-        self, channel_ids: list[str] | None = None, messages_per_channel: int = 50
+    def iter_messages(
+        self,
+        channel_id: str,
+        max_messages: int | None = None,
+        page_size: int = 200,
+        oldest: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield a channel's messages page by page, newest first.
+
+        Args:
+            channel_id: Slack channel ID
+            max_messages: Stop after this many messages (None = full history)
+            page_size: conversations.history page size (Slack recommends <= 200)
+            oldest: Only messages after this ``ts`` (exclusive)
+        """
+        cursor = None
+        yielded = 0
+        while True:
+            limit = page_size if max_messages is None else min(page_size, max_messages - yielded)
+            params: dict[str, Any] = {"channel": channel_id, "limit": limit}
+            if oldest:
+                params["oldest"] = oldest
+            if cursor:
+                params["cursor"] = cursor
+            page = self._get("conversations.history", params=params)
+
+            for message in self._format_messages(page.get("messages", [])):
+                yield message
+                yielded += 1
+                if max_messages is not None and yielded >= max_messages:
+                    return
+
+            cursor = page.get("response_metadata", {}).get("next_cursor")
+            if not page.get("has_more") or not cursor:
+                return
+
+    def extract_messages(
+        self, channel_id: str, limit: int = 100
     ) -> list[dict[str, Any]]:
-        """Extract messages from multiple channels."""
+        """Extract up to ``limit`` recent messages from a channel."""
+        return list(self.iter_messages(channel_id, max_messages=limit, page_size=limit))
+
+    def iter_thread_replies(
+        self, channel_id: str, thread_ts: str, page_size: int = 200
+    ) -> Iterator[dict[str, Any]]:
+        """Yield every reply in a thread (the parent message is skipped)."""
+        cursor = None
+        while True:
+            params: dict[str, Any] = {"channel": channel_id, "ts": thread_ts, "limit": page_size}
+            if cursor:
+                params["cursor"] = cursor
+            page = self._get("conversations.replies", params=params)
+
+            for message in self._format_messages(page.get("messages", [])):
+                if message["ts"] != thread_ts:
+                    message["channel_id"] = channel_id
+                    yield message
+
+            cursor = page.get("response_metadata", {}).get("next_cursor")
+            if not page.get("has_more") or not cursor:
+                return
+
+    def hydrate_threads(self, messages: list[dict[str, Any]], concurrency: int = 4) -> int:
+        """Fetch thread replies and insert them after their thread, in place.
+
+        Each distinct thread (a root with replies, or a broadcast reply whose
+        root is outside the extracted window) is fetched once, so API cost
+        scales with threads rather than messages. Replies already present
+        are not duplicated.
+
+        Args:
+            messages: Extracted messages (with ``channel_id``); modified in place
+            concurrency: Threads fetched at once; the method tier limit still applies
+
+        Returns:
+            Number of replies added
+        """
+        seen = {(msg.get("channel_id"), msg["ts"]) for msg in messages}
+        threads: dict[tuple[str, str], None] = {}
+        for msg in messages:
+            thread_ts = msg.get("thread_ts")
+            if not thread_ts:
+                continue
+            if thread_ts == msg["ts"] and not msg.get("reply_count"):
+                continue
+            threads[(msg.get("channel_id"), thread_ts)] = None
+
+        if not threads:
+            return 0
+
+        def fetch(key: tuple[str, str]) -> list[dict[str, Any]]:
+            try:
+                return list(self.iter_thread_replies(*key))
+            except Exception as e:
+                logger.warning("  ⚠ Warning: Failed to fetch thread %s in %s: %s", key[1], key[0], e)
+                return []
+
+        with ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix="thread") as pool:
+            replies_by_thread = dict(zip(threads, pool.map(fetch, threads)))
+
+        # Rebuild the list with each thread's new replies after its first message
+        hydrated: list[dict[str, Any]] = []
+        added = 0
+        for msg in messages:
+            hydrated.append(msg)
+            key = (msg.get("channel_id"), msg.get("thread_ts"))
+            for reply in replies_by_thread.pop(key, []):
+                reply_key = (reply["channel_id"], reply["ts"])
+                if reply_key not in seen:
+                    seen.add(reply_key)
+                    hydrated.append(reply)
+                    added += 1
+
+        messages[:] = hydrated
+        return added
+
+    def iter_all_messages(
+        self,
+        channel_ids: list[str] | None = None,
+        messages_per_channel: int | None = 50,
+        max_channels: int | None = None,
+        concurrency: int = 4,
+        spool_dir: str | None = None,
+        include_threads: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield messages from multiple channels, crawled concurrently.
+
+        Channels are yielded one at a time, each followed through its thread
+        replies, so with a spool directory memory holds one channel rather
+        than the workspace. ``replies_hydrated`` counts the replies added.
+
+        Args:
+            channel_ids: Channels to crawl (default: every channel in the workspace)
+            messages_per_channel: Messages per channel (None = full history)
+            max_channels: Optional cap on the number of channels
+            concurrency: Channels crawled at once; method tier limits still apply
+            spool_dir: Stream each channel to ``<spool_dir>/<channel>.jsonl``
+                (a rerun with the same settings only fetches newer messages)
+            include_threads: Fetch thread replies via conversations.replies
+        """
         if not channel_ids:
             # Get all channels
             channels = self.extract_channels()
             channel_ids = [ch["id"] for ch in channels]
+        if max_channels:
+            channel_ids = channel_ids[:max_channels]
 
-        all_messages = []
-        for channel_id in channel_ids[:10]:  # Limit to 10 channels to avoid rate limits
-            try:
-                messages = self.extract_messages(channel_id, limit=messages_per_channel)
+        def fetch(channel_id: str, oldest: str | None = None) -> Iterator[dict[str, Any]]:
+            for msg in self.iter_messages(channel_id, max_messages=messages_per_channel, oldest=oldest):
                 # Add channel info to each message
-                for msg in messages:
-                    msg["channel_id"] = channel_id
-                all_messages.extend(messages)
-            except Exception as e:
-                print(f"  ⚠ Warning: Failed to extract from channel {channel_id}: {e}")
+                msg["channel_id"] = channel_id
+                yield msg
+
+        crawler = ChannelCrawler(
+            max_concurrency=concurrency,
+            spool_dir=spool_dir,
+            params={"source": "slack"},
+            position_key="ts",
+            max_messages=messages_per_channel,
+        )
+        results = crawler.crawl(channel_ids, fetch, fetch_newer=fetch)
+
+        self.replies_hydrated = 0
+        for result in results:
+            messages = list(iter_channel_messages([result]))
+            if include_threads and messages:
+                self.replies_hydrated += self.hydrate_threads(messages, concurrency=concurrency)
+            yield from messages
 
-        return all_messages
+    def extract_all_messages(
+        self,
+        channel_ids: list[str] | None = None,
+        messages_per_channel: int | None = 50,
+        max_channels: int | None = None,
+        concurrency: int = 4,
+        spool_dir: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Extract messages from multiple channels into one list (see ``iter_all_messages``)."""
+        return list(
+            self.iter_all_messages(
+                channel_ids,
+                messages_per_channel=messages_per_channel,
+                max_channels=max_channels,
+                concurrency=concurrency,
+                spool_dir=spool_dir,
+            )
+        )
 
     def extract_all(
-        self, output_path: str | None = None, workspace_name: str | None = None
+        self,
+        output_path: str | None = None,
+        workspace_name: str | None = None,
+        messages_per_channel: int | None = 50,
+        max_channels: int | None = None,
+        concurrency: int = 4,
+        spool_dir: str | None = None,
+        include_threads: bool = True,
     ) -> dict[str, Any]:
         """Extract all Slack data and save to file.
 
+        With ``output_path``, messages are streamed to the file channel by
+        channel instead of being collected, and the returned dataset has no
+        ``messages`` (read them back from the file when needed).
+
         Args:
             output_path: Optional path to save JSON output
             workspace_name: Optional workspace name for identification
+            messages_per_channel: Messages per channel (None = full history)
+            max_channels: Optional cap on the number of channels crawled
+            concurrency: Channels crawled at once
+            spool_dir: Optional directory for per-channel JSONL output (a rerun with
+                the same settings only fetches newer messages)
+            include_threads: Fetch thread replies via conversations.replies
 
         Returns:
-            Complete dataset in FlowSight format
+            Dataset in FlowSight format
         """
-        print(f"Extracting data from Slack workspace...")
+        logger.info("Extracting data from Slack workspace...")
 
         # Extract all data
         workspace = self.extract_workspace_info()
-        print(f"✓ Workspace info extracted: {workspace['name']}")
+        logger.info("✓ Workspace info extracted: %s", workspace['name'])
 
         channels = self.extract_channels()
-        print(f"✓ {len(channels)} channels extracted")
+        logger.info("✓ %s channels extracted", len(channels))
+
+        # Resolve users in bulk (or from the persisted directory)
+        self.prefetch_users()
 
         # Extract messages from channels
-        channel_ids = [ch["id"] for ch in channels]
-        messages = self.extract_all_messages(channel_ids, messages_per_channel=50)
-        print(f"✓ {len(messages)} messages extracted")
-
-        # Build final dataset
-        dataset = {
-            "workspace": workspace["name"],
-            "channels": channels,
-            "messages": messages,
-            "metadata": {
+        messages = self.iter_all_messages(
+            [ch["id"] for ch in channels],
+            messages_per_channel=messages_per_channel,
+            max_channels=max_channels,
+            concurrency=concurrency,
+            spool_dir=spool_dir,
+            include_threads=include_threads,
+        )
+        dataset: dict[str, Any] = {"workspace": workspace["name"], "channels": channels}
+
+        def metadata(total_messages: int) -> dict[str, Any]:
+            return {
                 "generated_at": datetime.now().isoformat(),
                 "total_channels": len(channels),
-                "total_messages": len(messages),
-            },
-        }
+                "total_messages": total_messages,
+            }
 
-        # Save to file if path provided
         if output_path:
-            output_file = Path(output_path)
-            output_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_file, "w") as f:
-                json.dump(dataset, f, indent=2)
-            print(f"✓ Data saved to {output_path}")
+            total = write_json_stream(
+                output_path, dataset, "messages", messages, lambda n: {"metadata": metadata(n)}
+            )
+        else:
+            dataset["messages"] = list(messages)
+            total = len(dataset["messages"])
+        dataset["metadata"] = metadata(total)
+
+        logger.info("✓ %s messages extracted", total)
+        if include_threads:
+            logger.info("✓ %s thread replies hydrated", self.replies_hydrated)
+        logger.info("✓ %s user API calls", self.users.api_calls)
+        self.users.save()
+        if output_path:
+            logger.info("✓ Data saved to %s", output_path)
 
         return dataset
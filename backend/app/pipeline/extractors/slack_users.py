@@ -0,0 +1,132 @@
+"""Slack user directory with bulk prefetch and a persisted TTL cache."""
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+# Signature of SlackExtractor._get
+SlackGet = Callable[[str, dict[str, Any] | None], Any]
+
+
+def _display_name(user: dict[str, Any]) -> str:
+    """Pick the best human-readable name for a Slack user object."""
+    profile = user.get("profile", {})
+    return user.get("real_name") or profile.get("real_name") or user.get("name") or user["id"]
+
+
+class SlackUserDirectory:
+    """Resolve Slack user IDs to display names with as few API calls as possible.
+
+    The directory is filled once per run from paginated ``users.list`` and
+    can be persisted to disk, so later runs within the TTL make no user
+    calls at all. IDs missing from the listing (deleted users, users from
+    shared channels) are looked up with ``users.info`` at most once each.
+    """
+
+    def __init__(
+        self,
+        get: SlackGet,
+        cache_path: str | None = None,
+        ttl_seconds: int = 24 * 3600,
+        page_size: int = 200,
+    ):
+        """Initialize the directory.
+
+        Args:
+            get: Function performing a Slack API GET (``SlackExtractor._get``)
+            cache_path: Optional JSON file used to persist names across runs
+            ttl_seconds: Age after which a persisted directory is refetched
+            page_size: ``users.list`` page size (Slack allows up to 1000)
+        """
+        self._get = get
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.ttl_seconds = ttl_seconds
+        self.page_size = page_size
+
+        self.names: dict[str, str] = {}
+        self.fetched_at = 0.0
+        self.prefetched = False
+        self.api_calls = 0
+        # IDs whose lookup failed this run; not retried
+        self._missing: set[str] = set()
+        # Channel crawler threads resolve concurrently
+        self._lock = threading.Lock()
+
+        self._load()
+
+    def _load(self) -> None:
+        """Load a persisted directory if it is still fresh."""
+        if not self.cache_path or not self.cache_path.exists():
+            return
+        try:
+            cached = json.loads(self.cache_path.read_text())
+        except (OSError, json.JSONDecodeError):
+            return
+        if time.time() - cached.get("fetched_at", 0) < self.ttl_seconds:
+            self.names = cached.get("users", {})
+            self.fetched_at = cached["fetched_at"]
+            self.prefetched = True
+
+    def save(self) -> None:
+        """Persist the directory (no-op without a cache path)."""
+        if not self.cache_path or not self.names:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps({"fetched_at": self.fetched_at, "users": self.names}))
+        tmp_path.replace(self.cache_path)
+
+    def prefetch(self) -> int:
+        """Fill the directory from ``users.list`` (once per run, unless cached).
+
+        Returns:
+            Number of users known after the prefetch
+        """
+        if self.prefetched:
+            return len(self.names)
+
+        cursor = None
+        while True:
+            params: dict[str, Any] = {"limit": self.page_size}
+            if cursor:
+                params["cursor"] = cursor
+            page = self._get("users.list", params)
+            self.api_calls += 1
+            for user in page.get("members", []):
+                self.names[user["id"]] = _display_name(user)
+            cursor = page.get("response_metadata", {}).get("next_cursor")
+            if not cursor:
+                break
+
+        self.fetched_at = time.time()
+        self.prefetched = True
+        return len(self.names)
+
+    def resolve_many(self, user_ids: Iterable[str]) -> dict[str, str]:
+        """Resolve a batch of IDs, looking up each unknown ID only once.
+
+        Returns:
+            Mapping of every requested ID to its name (the ID itself if unknown)
+        """
+        unique_ids = set(user_ids)
+        with self._lock:
+            unknown = [
+                uid for uid in unique_ids
+                if uid not in self.names and uid not in self._missing and uid != "unknown"
+            ]
+
+            for user_id in unknown:
+                try:
+                    self.api_calls += 1
+                    user = self._get("users.info", {"user": user_id})["user"]
+                    self.names[user_id] = _display_name(user)
+                except Exception:
+                    self._missing.add(user_id)
+
+        return {uid: self.names.get(uid, uid) for uid in unique_ids}
+
+    def resolve(self, user_id: str) -> str:
+        """Resolve a single user ID to a display name."""
+        return self.resolve_many([user_id])[user_id]
@@ -1,33 +1,49 @@
 """Microsoft Teams data extraction pipeline."""
 
-import json
 from datetime import datetime
-from typing import Any
-from pathlib import Path
+from typing import Any, Iterator
 
-import requests
+from app.core.log import get_logger
+from app.pipeline.extractors.channel_crawler import (
+    ChannelCrawler,
+    RateLimiter,
+    iter_channel_messages,
+    throttled_get,
+    write_json_stream,
+)
+
+logger = get_logger(__name__)
+
+# Client-side ceiling for Graph calls per team; Graph signals anything
+# beyond its own limits with 429 + Retry-After, which throttled_get honors
+GRAPH_REQUESTS_PER_MINUTE = 240
 
 
 class TeamsExtractor:
     """Extract data from Microsoft Teams API (Graph API) and format for FlowSight."""
 
-    def __init__(self, access_token: str | None = None):
+    def __init__(
+        self,
+        access_token: str | None = None,
+        requests_per_minute: int | None = GRAPH_REQUESTS_PER_MINUTE,
+    ):
         """Initialize Teams extractor.
 
         Args:
             access_token: Microsoft Graph API access token
+            requests_per_minute: Client-side request ceiling (None = rely on Retry-After only)
         """
         self.base_url = "https://graph.microsoft.com/v1.0"
         self.headers = {
             "Authorization": f"Bearer {access_token}" if access_token else "",
             "Content-Type": "application/json",
         }
+        self.limiter = RateLimiter(requests_per_minute)
 
     def _get(self, endpoint: str, params: dict[str, Any] | None = None) -> Any:
-        """Make GET request to Microsoft Graph API."""
-        url = f"{self.base_url}/{endpoint}"
-        response = requests.get(url, headers=self.headers, params=params or {})
-        response.raise_for_status()
+        """Make GET request to Microsoft Graph API (endpoint or absolute nextLink URL)."""
+        url = endpoint if endpoint.startswith("https://") else f"{self.base_url}/{endpoint}"
+        response = throttled_get(url, self.headers, params, limiter=self.limiter)
         return response.json()
 
     def extract_team_info(self, team_id: str) -> dict[str, Any]:
@@ -40,50 +56,69 @@ class TeamsExtractor:
         }
 
     def extract_channels(self, team_id: str) -> list[dict[str, Any]]:
-        """Extract channels from a team."""
-        channels_data = self._get(f"teams/{team_id}/channels")
-
+        """Extract every channel of a team, following ``@odata.nextLink``."""
         channels = []
-        for channel in channels_data.get("value", []):
-            channels.append({
-                "id": channel["id"],
-                "name": channel["displayName"],
-                "description": channel.get("description", ""),
-                "membership_type": channel.get("membershipType", "standard"),
-            })
+        endpoint: str | None = f"teams/{team_id}/channels"
+        while endpoint:
+            page = self._get(endpoint)
+            for channel in page.get("value", []):
+                channels.append({
+                    "id": channel["id"],
+                    "name": channel["displayName"],
+                    "description": channel.get("description", ""),
+                    "membership_type": channel.get("membershipType", "standard"),
+                })
+            endpoint = page.get("@odata.nextLink")
 
         return channels
 
-    def extract_messages(
-        self, team_id: str, channel_id: str, limit: int = 50
-    ) -> list[dict[str, Any]]:
-        """Extract messages from a channel."""
-        messages_data = self._get(
-            f"teams/{team_id}/channels/{channel_id}/messages",
-            params={"$top": limit}
-        )
+    def _format_message(self, msg: dict[str, Any]) -> dict[str, Any]:
+        """Convert a Graph chatMessage to FlowSight format."""
+        return {
+            "id": msg["id"],
+            "from": ((msg.get("from") or {}).get("user") or {}).get("displayName", "Unknown"),
+            "created_datetime": msg["createdDateTime"],
+            "body": msg.get("body", {}).get("content", ""),
+            "importance": msg.get("importance", "normal"),
+            "mentions": [
+                mention.get("mentioned", {}).get("user", {}).get("displayName")
+                for mention in msg.get("mentions", [])
+            ],
+        }
 
-        messages = []
-        for msg in messages_data.get("value", []):
-            # Skip deleted messages
-            if msg.get("deletedDateTime"):
-                continue
-
-            message = {
-                "id": msg["id"],
-                "from": msg.get("from", {}).get("user", {}).get("displayName", "Unknown"),
-                "created_datetime": msg["createdDateTime"],
-                "body": msg.get("body", {}).get("content", ""),
-                "importance": msg.get("importance", "normal"),
-                "mentions": [
-                    mention.get("mentioned", {}).get("user", {}).get("displayName")
-                    for mention in msg.get("mentions", [])
-                ],
-            }
+    def iter_messages(
+        self, team_id: str, channel_id: str, max_messages: int | None = None, page_size: int = 50
+    ) -> Iterator[dict[str, Any]]:
+        """Yield a channel's messages page by page, following ``@odata.nextLink``.
 
-            messages.append(message)
+        Args:
+            team_id: Microsoft Teams team ID
+            channel_id: Channel ID
+            max_messages: Stop after this many messages (None = full history)
+            page_size: Graph ``$top`` (the channel messages API allows up to 50)
+        """
+        endpoint = f"teams/{team_id}/channels/{channel_id}/messages"
+        params: dict[str, Any] | None = {"$top": page_size}
+        yielded = 0
+        while endpoint:
+            page = self._get(endpoint, params=params)
+            for msg in page.get("value", []):
+                # Skip deleted messages
+                if msg.get("deletedDateTime"):
+                    continue
+                yield self._format_message(msg)
+                yielded += 1
+                if max_messages is not None and yielded >= max_messages:
+                    return
+            # nextLink already carries the query string
+            endpoint = page.get("@odata.nextLink")
+            params = None
 
-        return messages
+    def extract_messages(
+        self, team_id: str, channel_id: str, limit: int = 50
+    ) -> list[dict[str, Any]]:
+        """Extract up to ``limit`` recent messages from a channel."""
+        return list(self.iter_messages(team_id, channel_id, max_messages=limit, page_size=min(limit, 50)))
 
     def extract_meetings(
         self, team_id: str | None = None, limit: int = 20
@@ -123,7 +158,7 @@ class TeamsExtractor:
             return meetings
 
         except Exception as e:
-            print(f"⚠ Warning: Could not extract meetings: {e}")
+            logger.warning("⚠ Warning: Could not extract meetings: %s", e)
             return []
 
     def extract_all(
@@ -131,65 +166,90 @@ class TeamsExtractor:
         team_id: str,
         output_path: str | None = None,
         include_meetings: bool = False,
+        messages_per_channel: int | None = 50,
+        max_channels: int | None = None,
+        concurrency: int = 4,
+        spool_dir: str | None = None,
     ) -> dict[str, Any]:
         """Extract all Teams data and save to file.
 
+        With ``output_path``, messages are streamed to the file channel by
+        channel instead of being collected, and the returned dataset has no
+        ``messages`` (read them back from the file when needed).
+
         Args:
             team_id: Microsoft Teams team ID
             output_path: Optional path to save JSON output
             include_meetings: Whether to include calendar meetings
+            messages_per_channel: Messages per channel (None = full history)
+            max_channels: Optional cap on the number of channels crawled
+            concurrency: Channels crawled at once
+            spool_dir: Optional directory for per-channel JSONL output (a rerun with
+                the same settings only fetches newer messages)
 
         Returns:
-            Complete dataset in FlowSight format
+            Dataset in FlowSight format
         """
-        print(f"Extracting data from Microsoft Teams...")
+        logger.info("Extracting data from Microsoft Teams...")
 
         # Extract all data
         team = self.extract_team_info(team_id)
-        print(f"✓ Team info extracted: {team['name']}")
+        logger.info("✓ Team info extracted: %s", team['name'])
 
         channels = self.extract_channels(team_id)
-        print(f"✓ {len(channels)} channels extracted")
-
-        # Extract messages from channels
-        messages = []
-        for channel in channels[:5]:  # Limit to 5 channels to avoid rate limits
-            try:
-                channel_messages = self.extract_messages(team_id, channel["id"])
-                for msg in channel_messages:
-                    msg["channel_name"] = channel["name"]
-                messages.extend(channel_messages)
-            except Exception as e:
-                print(f"  ⚠ Warning: Failed to extract from channel {channel['name']}: {e}")
-
-        print(f"✓ {len(messages)} messages extracted")
+        logger.info("✓ %s channels extracted", len(channels))
+
+        # Extract messages from channels concurrently
+        crawl_channels = channels[:max_channels] if max_channels else channels
+        channel_names = {channel["id"]: channel["name"] for channel in crawl_channels}
+
+        def fetch(channel_id: str, newer_than: str | None = None) -> Iterator[dict[str, Any]]:
+            for msg in self.iter_messages(team_id, channel_id, max_messages=messages_per_channel):
+                # Messages arrive newest first; stop at the last crawl's newest
+                if newer_than is not None and msg["created_datetime"] <= newer_than:
+                    return
+                msg["channel_name"] = channel_names[channel_id]
+                yield msg
+
+        crawler = ChannelCrawler(
+            max_concurrency=concurrency,
+            spool_dir=spool_dir,
+            params={"source": "teams", "team_id": team_id},
+            position_key="created_datetime",
+            max_messages=messages_per_channel,
+        )
+        results = crawler.crawl(list(channel_names), fetch, fetch_newer=fetch)
+        messages = iter_channel_messages(results)
 
         # Extract meetings if requested
         meetings = []
         if include_meetings:
             meetings = self.extract_meetings(team_id)
-            print(f"✓ {len(meetings)} meetings extracted")
-
-        # Build final dataset
-        dataset = {
-            "team": team,
-            "channels": channels,
-            "messages": messages,
-            "meetings": meetings,
-            "metadata": {
-                "generated_at": datetime.now().isoformat(),
-                "total_channels": len(channels),
-                "total_messages": len(messages),
-                "total_meetings": len(meetings),
-            },
-        }
+            logger.info("✓ %s meetings extracted", len(meetings))
+
+        dataset: dict[str, Any] = {"team": team, "channels": channels}
+
+        def tail(total_messages: int) -> dict[str, Any]:
+            return {
+                "meetings": meetings,
+                "metadata": {
+                    "generated_at": datetime.now().isoformat(),
+                    "total_channels": len(channels),
+                    "total_messages": total_messages,
+                    "total_meetings": len(meetings),
+                },
+            }
 
-        # Save to file if path provided
         if output_path:
-            output_file = Path(output_path)
-            output_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_file, "w") as f:
-                json.dump(dataset, f, indent=2)
-            print(f"✓ Data saved to {output_path}")
+            # Stream spooled channels straight to the output
+            total = write_json_stream(output_path, dataset, "messages", messages, tail)
+        else:
+            dataset["messages"] = list(messages)
+            total = len(dataset["messages"])
+        dataset.update(tail(total))
+
+        logger.info("✓ %s messages extracted", total)
+        if output_path:
+            logger.info("✓ Data saved to %s", output_path)
 
         return dataset
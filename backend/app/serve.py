@@ -0,0 +1,90 @@
+"""Production server: multiple uvicorn workers sharing state through SQLite.
+
+Usage:
+    python -m app.serve                       # one worker per available CPU
+    python -m app.serve --workers 4 --port 8080
+
+Workers default to ``WEB_CONCURRENCY``, or the CPUs this container may use
+(cgroup quota, then CPU affinity). uvloop and httptools are used when
+installed (``uvicorn[standard]``). With more than one worker and no
+``SHARED_STATE_PATH``, a SQLite file under ``/dev/shm`` is created for the
+run so the workers share the IAM token and rendered mock bodies (see
+``app.core.shared_state``); it is removed on exit.
+"""
+
+import argparse
+import importlib.util
+import math
+import os
+import tempfile
+from pathlib import Path
+
+from app.core.settings import settings
+
+
+def available_cpus() -> int:
+    """CPUs this process may use: the cgroup v2 CPU quota if set, else the affinity mask."""
+    try:
+        quota, period = Path("/sys/fs/cgroup/cpu.max").read_text().split()
+        if quota != "max":
+            return max(math.ceil(int(quota) / int(period)), 1)
+    except (OSError, ValueError):
+        pass
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _shared_state_file() -> Path:
+    """A per-run SQLite path, memory-backed where /dev/shm exists."""
+    directory = Path("/dev/shm") if Path("/dev/shm").is_dir() else Path(tempfile.gettempdir())
+    return directory / f"flowsight-state-{os.getpid()}.db"
+
+
+def main():
+    """Start uvicorn with N workers."""
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Run the FlowSight API with multiple workers")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument(
+        "--workers", type=int, default=settings.web_concurrency, help="Worker processes (0 = one per CPU)"
+    )
+    parser.add_argument("--log-level", default="info")
+    args = parser.parse_args()
+
+    workers = args.workers or available_cpus()
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+
+    state_file = None
+    if workers > 1 and not settings.shared_state_path:
+        # Workers are spawned fresh and read their settings from the environment
+        state_file = _shared_state_file()
+        os.environ["SHARED_STATE_PATH"] = str(state_file)
+
+    print(
+        f"Serving on {args.host}:{args.port} with {workers} worker(s), loop={loop}, http={http}, "
+        f"shared state={os.environ.get('SHARED_STATE_PATH') or settings.shared_state_path or 'per-process'}"
+    )
+    try:
+        uvicorn.run(
+            "app.main:app",
+            host=args.host,
+            port=args.port,
+            workers=workers,
+            loop=loop,
+            http=http,
+            log_level=args.log_level,
+            proxy_headers=True,
+            forwarded_allow_ips="*",
+        )
+    finally:
+        if state_file is not None:
+            for suffix in ("", "-wal", "-shm"):
+                Path(f"{state_file}{suffix}").unlink(missing_ok=True)
+
+
+if __name__ == "__main__":
+    main()
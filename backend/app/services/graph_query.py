@@ -0,0 +1,111 @@
+"""Paginated, field-projected reads of the workflow graph.
+
+Large graphs are served as pages of nodes in ``(created_at, id)`` order,
+read from the warehouse's node indexes with keyset pagination: the cursor
+names the last node of the previous page, so every page costs the same
+regardless of how deep the client has paged. Each page carries the edges
+leaving its nodes, so walking all pages yields every edge exactly once.
+"""
+
+import base64
+from datetime import datetime
+from typing import Any
+
+import orjson
+
+from app.services.warehouse import EventWarehouse
+
+GRAPH_PAGE_SIZE = 100
+MAX_GRAPH_PAGE_SIZE = 1000
+
+# Node fields a client may project; "id" is always returned
+NODE_FIELDS = ("id", "type", "status", "created_at", "metadata")
+
+
+def encode_cursor(created_at: float, node_id: str) -> str:
+    """Opaque cursor for the position after ``(created_at, node_id)``."""
+    return base64.urlsafe_b64encode(orjson.dumps([created_at, node_id])).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[float, str]:
+    """Inverse of :func:`encode_cursor` (raises ValueError on a malformed cursor)."""
+    try:
+        created_at, node_id = orjson.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        return float(created_at), str(node_id)
+    except (orjson.JSONDecodeError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+
+def parse_fields(fields: str | None) -> tuple[str, ...] | None:
+    """
+    Parse a comma-separated projection such as ``"status,created_at"``.
+
+    Returns:
+        Fields to return (always including "id"), or None for every field
+    """
+    if not fields:
+        return None
+    requested = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in requested if f not in NODE_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown node fields: {', '.join(unknown)} (allowed: {', '.join(NODE_FIELDS)})")
+    return ("id",) + tuple(f for f in requested if f != "id")
+
+
+def graph_page(
+    store: EventWarehouse,
+    type: list[str] | None = None,
+    status: list[str] | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    cursor: str | None = None,
+    limit: int = GRAPH_PAGE_SIZE,
+    fields: str | None = None,
+    include_edges: bool = True,
+) -> dict[str, Any]:
+    """
+    Read one page of the workflow graph.
+
+    Args:
+        store: Warehouse holding the graph
+        type: Node types to include (any of)
+        status: Node statuses to include (any of)
+        since: Inclusive lower bound on node ``created_at``
+        until: Exclusive upper bound on node ``created_at``
+        cursor: ``next_cursor`` from the previous page
+        limit: Nodes per page (capped at ``MAX_GRAPH_PAGE_SIZE``)
+        fields: Comma-separated node fields to return (default: all)
+        include_edges: Return the edges leaving this page's nodes
+
+    Returns:
+        ``{"workflow_graph": {"nodes", "edges"}, "next_cursor"}``; ``next_cursor``
+        is None on the last page
+
+    Raises:
+        ValueError: On a malformed cursor or unknown field
+    """
+    projection = parse_fields(fields)
+    after = decode_cursor(cursor) if cursor else None
+    limit = max(1, min(limit, MAX_GRAPH_PAGE_SIZE))
+
+    # Fetch one extra row to learn whether another page follows
+    rows = store.page_nodes(
+        type=type, status=status, since=since, until=until, after=after, limit=limit + 1
+    )
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    nodes = []
+    for _, _, body in rows:
+        node = orjson.loads(body)
+        nodes.append({f: node.get(f) for f in projection} if projection else node)
+
+    edges = []
+    if include_edges and rows:
+        edges = [
+            {"from": edge.from_node, "to": edge.to_node, "type": edge.type}
+            for edge in store.edges_from([node_id for _, node_id, _ in rows])
+        ]
+
+    next_cursor = encode_cursor(rows[-1][0], rows[-1][1]) if has_more else None
+    return {"workflow_graph": {"nodes": nodes, "edges": edges}, "next_cursor": next_cursor}
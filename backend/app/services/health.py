@@ -0,0 +1,191 @@
+"""Background dependency health monitor behind the readiness probe.
+
+Probes must be cheap and must not turn into upstream traffic: a probe that
+fetches an IAM token or calls Orchestrate adds load proportional to the
+probe rate times the replica count, and its latency spikes with the
+upstream's. Instead, ``HealthMonitor`` checks the dependencies on its own
+schedule and probes read the cached result.
+
+Checks (each skipped when the dependency isn't configured):
+
+    iam          a valid IAM token can be obtained (the cached one counts)
+    orchestrate  the watsonx Orchestrate host answers HTTP (any status < 500)
+    astra        the Astra DB endpoint answers HTTP, when uploads are enabled
+
+A dependency only turns the service unready after
+``health_failure_threshold`` consecutive failed checks, so one slow check
+doesn't flap readiness. With several workers, one of them (holding a
+lease in the shared state store) runs the checks each interval and the
+others read its snapshot.
+"""
+
+import asyncio
+import os
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable
+
+import orjson
+
+from app.core.log import get_logger
+from app.core.metrics import HEALTH_CHECK_SECONDS
+from app.core.settings import settings
+from app.core.shared_state import shared_store
+from app.services.watsonx_client import watsonx_client
+
+logger = get_logger(__name__)
+
+SNAPSHOT_KEY = "health:snapshot"
+LEASE_KEY = "health:lease"
+
+STATUS_OK = "ok"
+STATUS_FAILING = "failing"
+STATUS_SKIPPED = "skipped"
+
+# A check returns detail for the snapshot, or None when the dependency isn't configured
+Check = Callable[[], Awaitable[dict[str, Any] | None]]
+
+
+@dataclass
+class CheckResult:
+    """Latest outcome of one dependency check."""
+
+    status: str
+    checked_at: float
+    latency_ms: float | None = None
+    consecutive_failures: int = 0
+    error: str | None = None
+    detail: dict[str, Any] | None = None
+
+
+async def check_iam() -> dict[str, Any] | None:
+    if settings.stub_mode or not watsonx_client.api_key:
+        return None
+    await watsonx_client._get_access_token()
+    return {"token_expires_in": int(watsonx_client._token_expires_at - time.time())}
+
+
+async def check_orchestrate() -> dict[str, Any] | None:
+    if settings.stub_mode or not watsonx_client.base_url:
+        return None
+    status = await watsonx_client.ping(timeout=settings.health_check_timeout)
+    if status >= 500:
+        raise RuntimeError(f"HTTP {status}")
+    return {"http_status": status}
+
+
+async def check_astra() -> dict[str, Any] | None:
+    endpoint = os.getenv("ASTRA_DB_ENDPOINT")
+    if not settings.ingest_upload_to_astra or not endpoint:
+        return None
+    response = await watsonx_client._client().get(endpoint, timeout=settings.health_check_timeout)
+    if response.status_code >= 500:
+        raise RuntimeError(f"HTTP {response.status_code}")
+    return {"http_status": response.status_code}
+
+
+CHECKS: dict[str, Check] = {"iam": check_iam, "orchestrate": check_orchestrate, "astra": check_astra}
+
+
+class HealthMonitor:
+    """Runs dependency checks periodically and serves the cached result."""
+
+    def __init__(self, checks: dict[str, Check], interval: float = 30.0, failure_threshold: int = 3):
+        self.checks = checks
+        self.interval = interval
+        self.failure_threshold = failure_threshold
+        self.results: dict[str, CheckResult] = {}
+        self.updated_at: float | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def ready(self) -> bool:
+        """Whether every configured dependency is healthy enough to take traffic."""
+        if self.updated_at is None:
+            return False
+        return all(r.consecutive_failures < self.failure_threshold for r in self.results.values())
+
+    def snapshot(self) -> dict[str, Any]:
+        """The cached state, as served by the readiness probe."""
+        return {
+            "status": "ready" if self.ready else ("starting" if self.updated_at is None else "unready"),
+            "checked_at": self.updated_at,
+            "checks": {name: asdict(result) for name, result in self.results.items()},
+        }
+
+    async def start(self) -> None:
+        """Start the background check loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="health-monitor")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception:
+                logger.exception("Health check round failed")
+            await asyncio.sleep(self.interval)
+
+    async def refresh(self) -> None:
+        """Run the checks if this worker holds the lease, else adopt the shared snapshot."""
+        lease = str(os.getpid()).encode()
+        # Expires just before the next round so the next holder can be anyone
+        if await asyncio.to_thread(shared_store.add, LEASE_KEY, lease, self.interval * 0.9):
+            await self.run_checks()
+            payload = {name: asdict(result) for name, result in self.results.items()}
+            await asyncio.to_thread(
+                shared_store.set, SNAPSHOT_KEY, orjson.dumps(payload), self.interval * 3
+            )
+        else:
+            raw = await asyncio.to_thread(shared_store.get, SNAPSHOT_KEY)
+            if raw is None:
+                # No holder has published yet (or it died): check ourselves
+                await self.run_checks()
+            else:
+                self.results = {name: CheckResult(**result) for name, result in orjson.loads(raw).items()}
+        self.updated_at = time.time()
+
+    async def run_checks(self) -> None:
+        """Run every check concurrently, each bounded by the check timeout."""
+        names = list(self.checks)
+        outcomes = await asyncio.gather(*(self._check(name) for name in names))
+        self.results = dict(zip(names, outcomes))
+
+    async def _check(self, name: str) -> CheckResult:
+        previous = self.results.get(name)
+        started = time.perf_counter()
+        try:
+            detail = await asyncio.wait_for(self.checks[name](), timeout=settings.health_check_timeout)
+        except Exception as e:
+            elapsed = time.perf_counter() - started
+            HEALTH_CHECK_SECONDS.observe(elapsed, name, STATUS_FAILING)
+            failures = (previous.consecutive_failures if previous else 0) + 1
+            error = f"{type(e).__name__}: {e}" if str(e) else type(e).__name__
+            if failures == self.failure_threshold:
+                logger.warning("Dependency %s is failing (%s checks): %s", name, failures, error)
+            return CheckResult(
+                status=STATUS_FAILING,
+                checked_at=time.time(),
+                latency_ms=round(elapsed * 1000, 1),
+                consecutive_failures=failures,
+                error=error,
+            )
+        elapsed = time.perf_counter() - started
+        if detail is None:
+            return CheckResult(status=STATUS_SKIPPED, checked_at=time.time())
+        HEALTH_CHECK_SECONDS.observe(elapsed, name, STATUS_OK)
+        if previous and previous.consecutive_failures >= self.failure_threshold:
+            logger.info("Dependency %s recovered", name)
+        return CheckResult(
+            status=STATUS_OK, checked_at=time.time(), latency_ms=round(elapsed * 1000, 1), detail=detail
+        )
+
+
+# Singleton instance
+health_monitor = HealthMonitor(CHECKS, settings.health_check_interval, settings.health_failure_threshold)
@@ -0,0 +1,223 @@
+"""In-process work queue for incremental (webhook) ingestion.
+
+Webhook receivers only enqueue the raw delivery and return immediately.
+Worker tasks drain the queue in micro-batches and run each batch through
+transform → normalize → upload, so ingestion latency is bounded by
+``ingest_batch_timeout`` instead of a polling interval.
+"""
+
+import asyncio
+import inspect
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable
+
+from app.core.log import get_logger
+from app.core.settings import settings
+from app.models.events import RawEvent
+from app.models.graph import WorkflowGraph
+from app.services.normalizer import normalize_events_to_graph
+
+logger = get_logger(__name__)
+
+# A sink receives each processed batch (events plus the graph built from them)
+IngestSink = Callable[[list[RawEvent], WorkflowGraph], Awaitable[None] | None]
+
+
+@dataclass
+class WebhookDelivery:
+    """A single webhook delivery waiting to be processed."""
+
+    source: str  # "github", "jira" or "slack"
+    event_name: str  # e.g. X-GitHub-Event header, Jira webhookEvent
+    payload: dict[str, Any]
+    received_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+def _transform_delivery(delivery: WebhookDelivery) -> list[RawEvent]:
+    """Dispatch a delivery to the matching webhook transformer."""
+    from app.pipeline.core.transformer import (
+        transform_github_webhook,
+        transform_jira_webhook,
+        transform_slack_webhook,
+    )
+
+    if delivery.source == "github":
+        return transform_github_webhook(delivery.event_name, delivery.payload)
+    if delivery.source == "jira":
+        return transform_jira_webhook(delivery.payload)
+    if delivery.source == "slack":
+        return transform_slack_webhook(delivery.payload)
+    return []
+
+
+class IngestQueue:
+    """Bounded asyncio queue with micro-batching worker tasks."""
+
+    def __init__(
+        self,
+        maxsize: int = 10000,
+        workers: int = 2,
+        batch_size: int = 50,
+        batch_timeout: float = 1.0,
+        recent_limit: int = 1000,
+    ):
+        self.maxsize = maxsize
+        self.num_workers = workers
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
+        self._queue: asyncio.Queue[WebhookDelivery] | None = None
+        self._workers: list[asyncio.Task] = []
+        self._sinks: list[IngestSink] = []
+
+        # Most recent ingested events, newest last
+        self.recent_events: deque[RawEvent] = deque(maxlen=recent_limit)
+        self.stats = {
+            "accepted": 0,
+            "rejected": 0,
+            "batches": 0,
+            "deliveries": 0,
+            "events": 0,
+            "failed_batches": 0,
+        }
+
+    @property
+    def running(self) -> bool:
+        """Whether worker tasks are accepting deliveries."""
+        return self._queue is not None
+
+    @property
+    def depth(self) -> int:
+        """Number of deliveries waiting to be processed."""
+        return self._queue.qsize() if self._queue else 0
+
+    def add_sink(self, sink: IngestSink) -> None:
+        """Register a callable that receives every processed batch."""
+        self._sinks.append(sink)
+
+    async def start(self) -> None:
+        """Create the queue and spawn worker tasks."""
+        if self._queue is not None:
+            return
+        self._queue = asyncio.Queue(maxsize=self.maxsize)
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"ingest-worker-{i}")
+            for i in range(self.num_workers)
+        ]
+
+    async def stop(self, drain_timeout: float = 10.0) -> None:
+        """Drain outstanding deliveries (best effort) and stop workers."""
+        if self._queue is None:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=drain_timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Ingest queue stopped with %d deliveries pending", self._queue.qsize())
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+
+    def submit(self, delivery: WebhookDelivery) -> bool:
+        """Enqueue a delivery without blocking. Returns False if the queue is full."""
+        if self._queue is None:
+            self.stats["rejected"] += 1
+            return False
+        try:
+            self._queue.put_nowait(delivery)
+        except asyncio.QueueFull:
+            self.stats["rejected"] += 1
+            return False
+        self.stats["accepted"] += 1
+        return True
+
+    async def _next_batch(self) -> list[WebhookDelivery]:
+        """Wait for one delivery, then collect more until size or time limit."""
+        assert self._queue is not None
+        loop = asyncio.get_running_loop()
+
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.batch_timeout
+        while len(batch) < self.batch_size:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _worker(self) -> None:
+        """Worker loop: pull micro-batches and process them."""
+        assert self._queue is not None
+        while True:
+            batch = await self._next_batch()
+            try:
+                await self._process(batch)
+            except Exception as e:
+                self.stats["failed_batches"] += 1
+                logger.exception("Ingest batch of %d deliveries failed: %s", len(batch), e)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _process(self, batch: list[WebhookDelivery]) -> None:
+        """Transform → normalize → upload a batch of deliveries."""
+        events: list[RawEvent] = []
+        for delivery in batch:
+            try:
+                events.extend(_transform_delivery(delivery))
+            except (KeyError, TypeError, ValueError) as e:
+                logger.warning("Skipping malformed %s delivery: %s", delivery.source, e)
+
+        self.stats["batches"] += 1
+        self.stats["deliveries"] += len(batch)
+        if not events:
+            return
+
+        graph = normalize_events_to_graph(events)
+        self.recent_events.extend(events)
+        self.stats["events"] += len(events)
+
+        for sink in self._sinks:
+            result = sink(events, graph)
+            if inspect.isawaitable(result):
+                await result
+
+
+def astra_sink() -> IngestSink:
+    """Build a sink that upserts each batch into Astra DB's workflow_events collection."""
+    from app.pipeline.core.astra_uploader import AstraDBUploader
+
+    uploader = AstraDBUploader()
+
+    async def upload(events: list[RawEvent], graph: WorkflowGraph) -> None:
+        docs = [event.model_dump(mode="json") for event in events]
+        # astrapy is synchronous; keep it off the event loop
+        await asyncio.to_thread(uploader.upload_raw_events, docs)
+
+    return upload
+
+
+def warehouse_sink() -> IngestSink:
+    """Build a sink that stores each batch in the local event warehouse."""
+    from app.services.warehouse import warehouse
+
+    async def store(events: list[RawEvent], graph: WorkflowGraph) -> None:
+        # The batch's graph is not stored: add_events patches the warehouse
+        # graph for just these events, in the same transaction
+        await asyncio.to_thread(warehouse.add_events, events)
+
+    return store
+
+
+# Singleton instance
+ingest_queue = IngestQueue(
+    maxsize=settings.ingest_queue_size,
+    workers=settings.ingest_workers,
+    batch_size=settings.ingest_batch_size,
+    batch_timeout=settings.ingest_batch_timeout,
+)
@@ -1,9 +1,20 @@
 """Service to normalize raw events into a workflow graph."""
 
-from datetime import datetime
+from typing import Callable
 
+from app.core.tracing import traced
 from app.models.events import RawEvent
 from app.models.graph import Edge, Node, WorkflowGraph
+from app.services.reference_index import (
+    COMMIT_PREFIX,
+    ISSUE_PREFIX,
+    PR_PREFIX,
+    ReferenceIndex,
+    event_ref,
+)
+
+# Event types that become nodes in the workflow graph
+GRAPH_NODE_TYPES = {"commit", "pull_request", "ci_run", "issue", "deployment"}
 
 
 def _generate_node_id(event: RawEvent) -> str:
@@ -30,89 +41,127 @@ def _map_status(event: RawEvent) -> str:
     return event.status or "unknown"
 
 
+def build_node(event: RawEvent) -> Node | None:
+    """The graph node for an artifact event (None for messages, meetings etc.)."""
+    node_type = _normalize_type(event.type)
+    if node_type not in GRAPH_NODE_TYPES:
+        return None
+    return Node(
+        id=_generate_node_id(event),
+        type=node_type,
+        status=_map_status(event),
+        created_at=event.timestamp,
+        metadata={
+            "source": event.source,
+            "author": event.author,
+            "assignee": event.assignee,
+            "branch": event.branch,
+        },
+    )
+
+
+def event_edges(event: RawEvent, resolve: Callable[[str], str | None]) -> list[tuple[str, str, str]]:
+    """
+    Edges an event's references produce, as ``(from_node, to_node, type)``.
+
+    Args:
+        event: Event whose ``references`` are followed
+        resolve: Node ID for a reference key, or None if that artifact has no node
+    """
+    if not event.references:
+        return []
+
+    pr_nodes: list[str] = []
+    issue_nodes: list[str] = []
+    commit_nodes: list[str] = []
+    for key in event.references:
+        node_id = resolve(key)
+        if not node_id:
+            continue
+        if key.startswith(PR_PREFIX):
+            pr_nodes.append(node_id)
+        elif key.startswith(ISSUE_PREFIX):
+            issue_nodes.append(node_id)
+        elif key.startswith(COMMIT_PREFIX):
+            commit_nodes.append(node_id)
+
+    own_ref = event_ref(event)
+    own_node = resolve(own_ref) if own_ref else None
+
+    edges: dict[tuple[str, str, str], None] = {}
+
+    def link(from_node: str | None, to_node: str | None, edge_type: str) -> None:
+        if from_node and to_node and from_node != to_node:
+            edges[(from_node, to_node, edge_type)] = None
+
+    if event.type == "pull_request":
+        for commit in commit_nodes:
+            link(commit, own_node, "triggers")
+        for issue in issue_nodes:
+            link(issue, own_node, "depends_on")
+    elif event.type == "workflow_run":
+        # CI runs are identified by id rather than a reference key
+        ci_node = _generate_node_id(event)
+        for pr in pr_nodes:
+            link(pr, ci_node, "triggers")
+        if not pr_nodes:
+            for commit in commit_nodes:
+                link(commit, ci_node, "triggers")
+    elif event.type == "issue":
+        for pr in pr_nodes:
+            link(own_node, pr, "depends_on")
+    elif _normalize_type(event.type) not in GRAPH_NODE_TYPES:
+        # A message naming both an issue and a PR links them exactly
+        for issue in issue_nodes:
+            for pr in pr_nodes:
+                link(issue, pr, "depends_on")
+
+    return list(edges)
+
+
+@traced("normalize_events_to_graph")
 def normalize_events_to_graph(events: list[RawEvent]) -> WorkflowGraph:
     """
     Convert raw events into a workflow graph.
 
     This function:
-    1. Creates nodes from each event
-    2. Infers edges based on event relationships (triggers, depends_on, blocks)
+    1. Creates nodes from each artifact event and indexes them by reference key
+    2. Emits edges from explicit references (see ``reference_index``):
+       commit -> PR and PR -> CI run (triggers), issue -> PR (depends_on),
+       including issue/PR pairs joined by a chat message that names both
+
+    Both passes are linear in the number of events and references.
     """
     nodes: list[Node] = []
-    edges: list[Edge] = []
-
-    # Index events by type for relationship inference
-    commits: list[RawEvent] = []
-    prs: list[RawEvent] = []
-    ci_runs: list[RawEvent] = []
-    issues: list[RawEvent] = []
+    index = ReferenceIndex()
+    # Node and its own reference key, for attaching referrers afterwards
+    node_refs: list[tuple[Node, str | None]] = []
 
     for event in events:
-        # Create node
-        node = Node(
-            id=_generate_node_id(event),
-            type=_normalize_type(event.type),
-            status=_map_status(event),
-            created_at=event.timestamp,
-            metadata={
-                "source": event.source,
-                "author": event.author,
-                "assignee": event.assignee,
-                "branch": event.branch,
-            },
-        )
+        index.add_references(event)
+
+        # Messages, meetings etc. carry no workflow node of their own
+        node = build_node(event)
+        if node is None:
+            continue
         nodes.append(node)
+        index.add_node(event, node.id)
+        node_refs.append((node, event_ref(event)))
 
-        # Categorize for edge inference
-        if event.type == "commit":
-            commits.append(event)
-        elif event.type == "pull_request":
-            prs.append(event)
-        elif event.type == "workflow_run":
-            ci_runs.append(event)
-        elif event.type == "issue":
-            issues.append(event)
-
-    # Infer edges: commits -> PRs (triggers)
-    for commit in commits:
-        for pr in prs:
-            # Simple heuristic: commits on same branch trigger PRs
-            if commit.branch and commit.timestamp < pr.timestamp:
-                edges.append(
-                    Edge(
-                        from_node=_generate_node_id(commit),
-                        to_node=_generate_node_id(pr),
-                        type="triggers",
-                    )
-                )
-                break  # One commit triggers one PR for simplicity
-
-    # Infer edges: PRs -> CI runs (triggers)
-    for pr in prs:
-        for ci in ci_runs:
-            if pr.timestamp < ci.timestamp:
-                edges.append(
-                    Edge(
-                        from_node=_generate_node_id(pr),
-                        to_node=_generate_node_id(ci),
-                        type="triggers",
-                    )
-                )
-                break
-
-    # Infer edges: Issues -> PRs (depends_on)
-    for issue in issues:
-        for pr in prs:
-            # Heuristic: issues created before PRs may be dependencies
-            if issue.timestamp < pr.timestamp:
-                edges.append(
-                    Edge(
-                        from_node=_generate_node_id(issue),
-                        to_node=_generate_node_id(pr),
-                        type="depends_on",
-                    )
-                )
-                break
+    edges: list[Edge] = []
+    seen: set[tuple[str, str, str]] = set()
+    for event in events:
+        for edge_key in event_edges(event, index.resolve):
+            if edge_key not in seen:
+                seen.add(edge_key)
+                edges.append(Edge(from_node=edge_key[0], to_node=edge_key[1], type=edge_key[2]))
+
+    # Surface which messages / issues / PRs point at each artifact
+    for node, key in node_refs:
+        if key:
+            referrers = index.referrers(key)
+            if referrers:
+                node.metadata["referenced_by"] = referrers
 
     return WorkflowGraph(nodes=nodes, edges=edges)
 
@@ -0,0 +1,89 @@
+"""Cross-source reference index joining chat, Jira and GitHub events.
+
+Every event can carry ``references``: typed keys naming the artifacts it
+points at, such as ``pr:145`` for a pull request, ``issue:PAY-102`` for a
+Jira issue or ``commit:a1b2c3d4e5f6`` for a commit. The index maps each
+key to the graph node it names and to the events that reference it, so
+edges between sources are exact hash lookups instead of guesses.
+"""
+
+from collections import defaultdict
+from typing import Iterable
+
+from app.models.events import RawEvent
+
+PR_PREFIX = "pr:"
+ISSUE_PREFIX = "issue:"
+COMMIT_PREFIX = "commit:"
+
+
+def pr_ref(number: int | str) -> str:
+    """Reference key for a pull request number (``"#145"`` and ``"145"`` both work)."""
+    return f"{PR_PREFIX}{str(number).lstrip('#')}"
+
+
+def issue_ref(key: str) -> str:
+    """Reference key for a Jira issue key."""
+    return f"{ISSUE_PREFIX}{key}"
+
+
+def commit_ref(sha: str) -> str:
+    """Reference key for a commit (12-character short SHA, as extracted)."""
+    return f"{COMMIT_PREFIX}{sha[:12]}"
+
+
+def refs_from_cleaned(references: Iterable[dict[str, str]] | None) -> list[str]:
+    """Convert cleaner ``{"type", "id"}`` references to unique reference keys."""
+    keys: dict[str, None] = {}
+    for reference in references or []:
+        if reference["type"] == "pull_request":
+            keys[pr_ref(reference["id"])] = None
+        elif reference["type"] == "issue":
+            keys[issue_ref(reference["id"])] = None
+    return list(keys)
+
+
+def refs_from_linked_issues(linked_issues: Iterable[str] | None) -> list[str]:
+    """Convert GitHub ``linked_issues`` (``"#12"`` / ``"PAY-102"``) to reference keys."""
+    return [pr_ref(ref) if ref.startswith("#") else issue_ref(ref) for ref in linked_issues or []]
+
+
+def event_ref(event: RawEvent) -> str | None:
+    """The reference key naming an event itself, if it is a referenceable artifact."""
+    if event.type == "pull_request":
+        return pr_ref(event.id)
+    if event.type == "issue":
+        return issue_ref(event.key or event.id)
+    if event.type == "commit":
+        return commit_ref(event.id)
+    return None
+
+
+class ReferenceIndex:
+    """Hash index from reference keys to graph nodes and referencing events."""
+
+    def __init__(self):
+        # Reference key -> node ID of the artifact it names
+        self.nodes: dict[str, str] = {}
+        # Reference key -> "<source>:<id>" of every event that references it
+        self.referenced_by: dict[str, list[str]] = defaultdict(list)
+
+    def add_node(self, event: RawEvent, node_id: str) -> None:
+        """Register the graph node for an artifact event."""
+        key = event_ref(event)
+        if key:
+            self.nodes[key] = node_id
+
+    def add_references(self, event: RawEvent) -> None:
+        """Record that ``event`` references each of its reference keys."""
+        source_id = f"{event.source}:{event.id}"
+        for key in event.references or ():
+            self.referenced_by[key].append(source_id)
+
+    def resolve(self, key: str) -> str | None:
+        """Node ID named by a reference key, if that artifact is in the graph."""
+        return self.nodes.get(key)
+
+    def referrers(self, key: str) -> list[str]:
+        """Events (``"<source>:<id>"``) that reference ``key``."""
+        return self.referenced_by.get(key, [])
@@ -0,0 +1,853 @@
+"""Embedded SQLite warehouse for pipeline events and the workflow graph.
+
+Pipeline output lands in flat JSON files under ``data/``; answering a small
+question from them means re-parsing a whole file. The warehouse bulk-loads
+those files once into indexed tables:
+
+- ``events``: one row per RawEvent, indexed by (source, type, timestamp),
+  (repo, timestamp), (type, timestamp) and Jira/PR key
+- ``event_refs``: reference key -> referencing event (``pr:145`` etc.)
+- ``event_nodes``: graph node ID and own reference key of each artifact event
+- ``nodes`` / ``edges``: the normalized workflow graph
+- ``edge_origins``: which event produced each edge
+
+Each row keeps the event / node serialized as JSON next to its indexed
+columns, so lookups return ready-made models without re-normalizing.
+
+Writes bump a generation counter, which gives readers a cheap "has
+anything changed" check. While the graph is current, small writes (such
+as webhook micro-batches) update it in the same transaction: only the
+nodes the batch touches are re-rendered, and only the edges of events
+whose references now resolve differently are recomputed. Bulk loads, and
+writes over a graph stored with ``replace_graph``, leave it stale instead,
+and the first graph query re-normalizes every stored event once.
+"""
+
+import json
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable
+
+from app.core.log import get_logger
+from app.core.metrics import cache_lookup
+from app.core.settings import settings
+from app.models.events import RawEvent
+from app.models.graph import Edge, Node, WorkflowGraph
+
+logger = get_logger(__name__)
+
+# Larger writes leave the graph for one lazy rebuild rather than patching it
+INCREMENTAL_BATCH_LIMIT = 1000
+
+# Primary key of an event row: (source, type, id, repo)
+EventKey = tuple[str, str, str, str]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    source TEXT NOT NULL,
+    type TEXT NOT NULL,
+    id TEXT NOT NULL,
+    repo TEXT NOT NULL DEFAULT '',
+    ts REAL NOT NULL,
+    status TEXT,
+    author TEXT,
+    key TEXT,
+    body TEXT NOT NULL,
+    PRIMARY KEY (source, type, id, repo)
+);
+CREATE INDEX IF NOT EXISTS events_source_type_ts ON events (source, type, ts);
+CREATE INDEX IF NOT EXISTS events_type_ts ON events (type, ts);
+CREATE INDEX IF NOT EXISTS events_repo_ts ON events (repo, ts);
+CREATE INDEX IF NOT EXISTS events_key ON events (key) WHERE key IS NOT NULL;
+
+CREATE TABLE IF NOT EXISTS event_refs (
+    ref TEXT NOT NULL,
+    source TEXT NOT NULL,
+    type TEXT NOT NULL,
+    id TEXT NOT NULL,
+    repo TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (ref, source, type, id, repo)
+) WITHOUT ROWID;
+
+-- Winner per node ID / reference key is the newest event (ts, then rowid), as in a rebuild
+CREATE TABLE IF NOT EXISTS event_nodes (
+    source TEXT NOT NULL,
+    type TEXT NOT NULL,
+    id TEXT NOT NULL,
+    repo TEXT NOT NULL DEFAULT '',
+    ref TEXT,
+    node_id TEXT NOT NULL,
+    ts REAL NOT NULL,
+    PRIMARY KEY (source, type, id, repo)
+);
+CREATE INDEX IF NOT EXISTS event_nodes_ref ON event_nodes (ref, ts) WHERE ref IS NOT NULL;
+CREATE INDEX IF NOT EXISTS event_nodes_node ON event_nodes (node_id, ts);
+
+CREATE TABLE IF NOT EXISTS nodes (
+    id TEXT PRIMARY KEY,
+    type TEXT NOT NULL,
+    status TEXT NOT NULL,
+    repo TEXT NOT NULL DEFAULT '',
+    created_at REAL NOT NULL,
+    body TEXT NOT NULL
+);
+-- (created_at, id) suffixes serve keyset pagination in page order
+CREATE INDEX IF NOT EXISTS nodes_type_status_created ON nodes (type, status, created_at, id);
+CREATE INDEX IF NOT EXISTS nodes_type_created ON nodes (type, created_at, id);
+CREATE INDEX IF NOT EXISTS nodes_status_created ON nodes (status, created_at, id);
+CREATE INDEX IF NOT EXISTS nodes_repo_created ON nodes (repo, created_at, id);
+CREATE INDEX IF NOT EXISTS nodes_created ON nodes (created_at, id);
+
+CREATE TABLE IF NOT EXISTS edges (
+    from_node TEXT NOT NULL,
+    to_node TEXT NOT NULL,
+    type TEXT NOT NULL,
+    PRIMARY KEY (from_node, to_node, type)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS edges_to ON edges (to_node);
+
+CREATE TABLE IF NOT EXISTS edge_origins (
+    source TEXT NOT NULL,
+    type TEXT NOT NULL,
+    id TEXT NOT NULL,
+    repo TEXT NOT NULL DEFAULT '',
+    from_node TEXT NOT NULL,
+    to_node TEXT NOT NULL,
+    edge_type TEXT NOT NULL,
+    PRIMARY KEY (source, type, id, repo, from_node, to_node, edge_type)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS edge_origins_edge ON edge_origins (from_node, to_node, edge_type);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def _epoch(value: datetime) -> float:
+    """Seconds since the epoch (naive datetimes are taken as UTC)."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _event_node_row(event: RawEvent, repo: str) -> tuple | None:
+    """``event_nodes`` row for an artifact event, or None if it has no graph node."""
+    from app.services.normalizer import GRAPH_NODE_TYPES, _generate_node_id, _normalize_type
+    from app.services.reference_index import event_ref
+
+    if _normalize_type(event.type) not in GRAPH_NODE_TYPES:
+        return None
+    return (
+        event.source,
+        event.type,
+        event.id,
+        repo,
+        event_ref(event),
+        _generate_node_id(event),
+        _epoch(event.timestamp),
+    )
+
+
+def dataset_source(data: dict[str, Any]) -> str | None:
+    """Guess which source a pipeline JSON dataset came from."""
+    if "commits" in data or "pull_requests" in data or "repository" in data:
+        return "github"
+    if "issues" in data or "project" in data:
+        return "jira"
+    if "workspace" in data:
+        return "slack"
+    if "team" in data or "meetings" in data:
+        return "teams"
+    return None
+
+
+def dataset_repo(source: str, data: dict[str, Any]) -> str:
+    """Repository-like partition key for a dataset (repo, project, workspace or team)."""
+    if source == "github":
+        repository = data.get("repository") or {}
+        if repository.get("full_name"):
+            return repository["full_name"]
+        if repository.get("org") and repository.get("name"):
+            return f"{repository['org']}/{repository['name']}"
+        return repository.get("name", "")
+    if source == "jira":
+        project = data.get("project") or {}
+        return project.get("key", "") if isinstance(project, dict) else str(project)
+    if source == "slack":
+        return str(data.get("workspace") or "")
+    if source == "teams":
+        team = data.get("team") or {}
+        if isinstance(team, dict):
+            return team.get("display_name") or team.get("name") or team.get("id", "")
+        return str(team)
+    return ""
+
+
+def events_from_dataset(data: dict[str, Any]) -> list[tuple[str, list[RawEvent]]]:
+    """
+    Turn one pipeline JSON document into ``(repo, events)`` groups.
+
+    Handles per-source files (``github_data.json``, ``*_cleaned_*.json``)
+    and the combined demo file, whose sources sit under ``data_sources``.
+    Files that already carry ``raw_events`` are loaded as-is.
+    """
+    from app.pipeline.core.transformer import (
+        transform_github_to_raw_events,
+        transform_jira_to_raw_events,
+        transform_slack_to_raw_events,
+        transform_teams_to_raw_events,
+    )
+
+    if "data_sources" in data:
+        groups = []
+        for dataset in data["data_sources"].values():
+            groups.extend(events_from_dataset(dataset))
+        return groups
+
+    source = dataset_source(data)
+    if source is None and "raw_events" not in data:
+        return []
+    repo = dataset_repo(source, data) if source else ""
+
+    if "raw_events" in data:
+        return [(repo, [RawEvent.model_validate(e) for e in data["raw_events"]])]
+
+    transforms = {
+        "github": transform_github_to_raw_events,
+        "jira": transform_jira_to_raw_events,
+        "slack": transform_slack_to_raw_events,
+        "teams": transform_teams_to_raw_events,
+    }
+    return [(repo, transforms[source](data))]
+
+
+class EventWarehouse:
+    """Indexed local store for raw events and the workflow graph built from them."""
+
+    def __init__(self, path: str = ":memory:"):
+        """Initialize the warehouse (the database is opened on first use).
+
+        Args:
+            path: SQLite database file, or ":memory:" for a throwaway store
+        """
+        self.path = path
+        self._conn: sqlite3.Connection | None = None
+        # One connection shared by the event loop and worker threads
+        self._lock = threading.RLock()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """The open connection, creating the database and schema if needed."""
+        if self._conn is None:
+            with self._lock:
+                if self._conn is None:
+                    if self.path != ":memory:":
+                        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+                    conn = sqlite3.connect(self.path, check_same_thread=False)
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.execute("PRAGMA synchronous=NORMAL")
+                    conn.execute("PRAGMA temp_store=MEMORY")
+                    conn.executescript(SCHEMA)
+                    self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Close the connection (reopened on next use)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _get_meta(self, key: str, default: str = "0") -> str:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def _set_meta(self, key: str, value: Any) -> None:
+        self.conn.execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, str(value)),
+        )
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped by every write; unchanged generation means unchanged data."""
+        with self._lock:
+            return int(self._get_meta("generation"))
+
+    def add_events(self, events: Iterable[RawEvent], repo: str = "") -> int:
+        """
+        Insert or replace events in a single transaction.
+
+        Args:
+            events: Events to store (same source/type/id/repo replaces)
+            repo: Partition key (repository, Jira project, workspace, team)
+
+        Returns:
+            Number of distinct events written
+        """
+        # Last write wins within the batch: an event sent twice (say created,
+        # then updated) is stored once, without the earlier version's rows
+        batch: dict[EventKey, RawEvent] = {}
+        for event in events:
+            batch[(event.source, event.type, event.id, repo)] = event
+
+        event_rows = []
+        ref_rows = []
+        node_rows = []
+        for event in batch.values():
+            event_rows.append((
+                event.source,
+                event.type,
+                event.id,
+                repo,
+                _epoch(event.timestamp),
+                event.status,
+                event.author,
+                event.key,
+                event.model_dump_json(),
+            ))
+            for ref in event.references or ():
+                ref_rows.append((ref, event.source, event.type, event.id, repo))
+            node_row = _event_node_row(event, repo)
+            if node_row:
+                node_rows.append(node_row)
+
+        if not batch:
+            return 0
+
+        with self._lock, self.conn:
+            incremental = (
+                len(batch) <= INCREMENTAL_BATCH_LIMIT
+                and self._graph_current()
+                and self._get_meta("graph_source", "") == "events"
+            )
+            if incremental:
+                before = self._graph_keys_before(batch)
+
+            # A replaced event's references are replaced too, not merged
+            self.conn.executemany(
+                "DELETE FROM event_refs WHERE source = ? AND type = ? AND id = ? AND repo = ?",
+                list(batch),
+            )
+            self.conn.executemany(
+                "DELETE FROM event_nodes WHERE source = ? AND type = ? AND id = ? AND repo = ?",
+                list(batch),
+            )
+            self.conn.executemany("INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", event_rows)
+            self.conn.executemany("INSERT OR IGNORE INTO event_refs VALUES (?, ?, ?, ?, ?)", ref_rows)
+            self.conn.executemany("INSERT OR REPLACE INTO event_nodes VALUES (?, ?, ?, ?, ?, ?, ?)", node_rows)
+
+            generation = int(self._get_meta("generation")) + 1
+            self._set_meta("generation", generation)
+            if incremental:
+                self._update_graph(batch, *before)
+                self._set_meta("graph_generation", generation)
+        return len(batch)
+
+    def _graph_current(self) -> bool:
+        return self._get_meta("graph_generation", "-1") == self._get_meta("generation")
+
+    def _resolve(self, ref: str) -> str | None:
+        """Node ID a reference key resolves to (the newest event owning it)."""
+        row = self.conn.execute(
+            "SELECT n.node_id FROM event_nodes n JOIN events e "
+            "ON e.source = n.source AND e.type = n.type AND e.id = n.id AND e.repo = n.repo "
+            "WHERE n.ref = ? ORDER BY n.ts DESC, e.rowid DESC LIMIT 1",
+            (ref,),
+        ).fetchone()
+        return row[0] if row else None
+
+    def _graph_keys_before(self, batch: dict[EventKey, RawEvent]) -> tuple[set[str], set[str], dict[str, str | None]]:
+        """
+        Graph state a batch is about to overwrite.
+
+        Returns:
+            Node IDs and reference keys of the replaced events, and what those
+            keys and the batch's own reference keys resolved to
+        """
+        from app.services.reference_index import event_ref
+
+        node_ids: set[str] = set()
+        refs: set[str] = set()
+        own_refs = {event_ref(event) for event in batch.values()} - {None}
+        for key in batch:
+            row = self.conn.execute(
+                "SELECT ref, node_id FROM event_nodes WHERE source = ? AND type = ? AND id = ? AND repo = ?", key
+            ).fetchone()
+            if row:
+                if row[0]:
+                    refs.add(row[0])
+                node_ids.add(row[1])
+            refs.update(
+                ref for (ref,) in self.conn.execute(
+                    "SELECT ref FROM event_refs WHERE source = ? AND type = ? AND id = ? AND repo = ?", key
+                )
+            )
+        return node_ids, refs, {ref: self._resolve(ref) for ref in refs | own_refs}
+
+    def _update_graph(
+        self,
+        batch: dict[EventKey, RawEvent],
+        old_node_ids: set[str],
+        old_refs: set[str],
+        resolved_before: dict[str, str | None],
+    ) -> None:
+        """Patch nodes and edges for a batch just written (inside its transaction)."""
+        from app.services.normalizer import event_edges
+        from app.services.reference_index import event_ref
+
+        conn = self.conn
+        resolved: dict[str, str | None] = {}
+
+        def resolve(ref: str) -> str | None:
+            if ref not in resolved:
+                resolved[ref] = self._resolve(ref)
+            return resolved[ref]
+
+        # Own reference keys whose node changed: everything citing them is re-linked
+        own_refs = {event_ref(event) for event in batch.values()} - {None}
+        changed = {ref for ref, node_id in resolved_before.items() if resolve(ref) != node_id}
+
+        # Nodes: re-render those the batch replaced, created, or added referrers to
+        touched_refs = old_refs | own_refs
+        for event in batch.values():
+            touched_refs.update(event.references or ())
+        node_ids = set(old_node_ids)
+        for key in batch:
+            row = conn.execute(
+                "SELECT node_id FROM event_nodes WHERE source = ? AND type = ? AND id = ? AND repo = ?", key
+            ).fetchone()
+            if row:
+                node_ids.add(row[0])
+        for ref in touched_refs:
+            node_ids.update(
+                node_id for (node_id,) in conn.execute("SELECT node_id FROM event_nodes WHERE ref = ?", (ref,))
+            )
+        for node_id in node_ids:
+            self._refresh_node(node_id)
+
+        # Edges: recompute per affected event, keeping each edge while any event produces it
+        affected = set(batch)
+        for ref in changed:
+            for table in ("event_refs", "event_nodes"):
+                affected.update(conn.execute(f"SELECT source, type, id, repo FROM {table} WHERE ref = ?", (ref,)))
+
+        removed: set[tuple[str, str, str]] = set()
+        for key in affected:
+            removed.update(conn.execute(
+                "SELECT from_node, to_node, edge_type FROM edge_origins "
+                "WHERE source = ? AND type = ? AND id = ? AND repo = ?",
+                key,
+            ))
+            conn.execute(
+                "DELETE FROM edge_origins WHERE source = ? AND type = ? AND id = ? AND repo = ?", key
+            )
+            row = conn.execute(
+                "SELECT body FROM events WHERE source = ? AND type = ? AND id = ? AND repo = ?", key
+            ).fetchone()
+            event = batch.get(key) or (RawEvent.model_validate_json(row[0]) if row else None)
+            if event is None:
+                continue
+            edges = event_edges(event, resolve)
+            conn.executemany("INSERT INTO edge_origins VALUES (?, ?, ?, ?, ?, ?, ?)", [key + edge for edge in edges])
+            conn.executemany("INSERT OR IGNORE INTO edges VALUES (?, ?, ?)", edges)
+
+        for edge in removed:
+            if not conn.execute(
+                "SELECT 1 FROM edge_origins WHERE from_node = ? AND to_node = ? AND edge_type = ?", edge
+            ).fetchone():
+                conn.execute("DELETE FROM edges WHERE from_node = ? AND to_node = ? AND type = ?", edge)
+
+    def _refresh_node(self, node_id: str) -> None:
+        """Re-render one node from its newest event, with its current referrers."""
+        from app.services.normalizer import build_node
+
+        row = self.conn.execute(
+            "SELECT n.repo, n.ref, e.body FROM event_nodes n JOIN events e "
+            "ON e.source = n.source AND e.type = n.type AND e.id = n.id AND e.repo = n.repo "
+            "WHERE n.node_id = ? ORDER BY n.ts DESC, e.rowid DESC LIMIT 1",
+            (node_id,),
+        ).fetchone()
+        if row is None:
+            self.conn.execute("DELETE FROM nodes WHERE id = ?", (node_id,))
+            return
+
+        repo, ref, body = row
+        node = build_node(RawEvent.model_validate_json(body))
+        if ref:
+            referrers = [
+                f"{source}:{id_}"
+                for source, id_ in self.conn.execute(
+                    "SELECT e.source, e.id FROM event_refs r JOIN events e "
+                    "ON e.source = r.source AND e.type = r.type AND e.id = r.id AND e.repo = r.repo "
+                    "WHERE r.ref = ? ORDER BY e.ts, e.rowid",
+                    (ref,),
+                )
+            ]
+            if referrers:
+                node.metadata["referenced_by"] = referrers
+        self.conn.execute(
+            "INSERT OR REPLACE INTO nodes VALUES (?, ?, ?, ?, ?, ?)",
+            (node.id, node.type, node.status, repo, _epoch(node.created_at), node.model_dump_json()),
+        )
+
+    def load_json(self, path: str | Path) -> int:
+        """
+        Bulk-load one pipeline JSON file.
+
+        Returns:
+            Number of events written
+        """
+        with open(path) as f:
+            data = json.load(f)
+        return sum(self.add_events(events, repo) for repo, events in events_from_dataset(data))
+
+    def load_directory(self, directory: str | Path, pattern: str = "*.json") -> dict[str, int]:
+        """
+        Bulk-load every matching JSON file in a directory.
+
+        Files that are not pipeline datasets are skipped with a warning.
+
+        Returns:
+            File name -> events written
+        """
+        loaded: dict[str, int] = {}
+        for path in sorted(Path(directory).glob(pattern)):
+            try:
+                loaded[path.name] = self.load_json(path)
+            except (KeyError, TypeError, ValueError) as e:
+                logger.warning("  ⚠ Skipping %s: %s", path.name, e)
+        return loaded
+
+    def clear(self) -> None:
+        """Delete all events and the graph."""
+        with self._lock, self.conn:
+            for table in ("events", "event_refs", "event_nodes", "nodes", "edges", "edge_origins"):
+                self.conn.execute(f"DELETE FROM {table}")
+            generation = int(self._get_meta("generation")) + 1
+            self._set_meta("generation", generation)
+            # An empty graph is the graph of no events
+            self._set_meta("graph_generation", generation)
+            self._set_meta("graph_source", "events")
+
+    def _write_graph(
+        self,
+        graph: WorkflowGraph,
+        node_repos: dict[str, str],
+        origins: list[tuple] | None = None,
+    ) -> None:
+        """
+        Replace the nodes / edges tables and mark the graph current.
+
+        Args:
+            graph: Graph to store
+            node_repos: Node ID -> partition key
+            origins: ``edge_origins`` rows if the graph was built from the
+                stored events (None disables incremental updates)
+        """
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM nodes")
+            self.conn.execute("DELETE FROM edges")
+            self.conn.execute("DELETE FROM edge_origins")
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO nodes VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        node.id,
+                        node.type,
+                        node.status,
+                        node_repos.get(node.id, ""),
+                        _epoch(node.created_at),
+                        node.model_dump_json(),
+                    )
+                    for node in graph.nodes
+                ],
+            )
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO edges VALUES (?, ?, ?)",
+                [(edge.from_node, edge.to_node, edge.type) for edge in graph.edges],
+            )
+            self.conn.executemany("INSERT OR IGNORE INTO edge_origins VALUES (?, ?, ?, ?, ?, ?, ?)", origins or ())
+            self._set_meta("graph_generation", self._get_meta("generation"))
+            self._set_meta("graph_source", "events" if origins is not None else "replaced")
+
+    def replace_graph(self, graph: WorkflowGraph, repo: str = "") -> None:
+        """Store a prebuilt graph as-is (it is not derived from stored events)."""
+        self._write_graph(graph, {node.id: repo for node in graph.nodes})
+
+    def rebuild_graph(self) -> WorkflowGraph:
+        """Normalize every stored event into the nodes / edges tables."""
+        from app.services.normalizer import event_edges, normalize_events_to_graph
+        from app.services.reference_index import ReferenceIndex
+
+        with self._lock:
+            # rowid breaks timestamp ties the same way incremental updates do
+            rows = self.conn.execute("SELECT repo, body FROM events ORDER BY ts, rowid").fetchall()
+            events = [RawEvent.model_validate_json(body) for _, body in rows]
+            graph = normalize_events_to_graph(events)
+
+            node_rows = []
+            node_repos: dict[str, str] = {}
+            index = ReferenceIndex()
+            for (repo, _), event in zip(rows, events):
+                node_row = _event_node_row(event, repo)
+                if node_row:
+                    node_rows.append(node_row)
+                    node_repos[node_row[5]] = repo
+                    index.add_node(event, node_row[5])
+            origins = [
+                (event.source, event.type, event.id, repo) + edge
+                for (repo, _), event in zip(rows, events)
+                for edge in event_edges(event, index.resolve)
+            ]
+
+            # Kept by add_events too; rewritten here for stores created before it
+            with self.conn:
+                self.conn.execute("DELETE FROM event_nodes")
+                self.conn.executemany("INSERT OR REPLACE INTO event_nodes VALUES (?, ?, ?, ?, ?, ?, ?)", node_rows)
+            self._write_graph(graph, node_repos, origins)
+        return graph
+
+    def _ensure_graph(self) -> None:
+        """Rebuild the graph if events changed since it was last built."""
+        current = self._graph_current()
+        cache_lookup("warehouse_graph", hit=current)
+        if not current:
+            self.rebuild_graph()
+
+    def query_events(
+        self,
+        source: str | None = None,
+        type: str | None = None,
+        repo: str | None = None,
+        key: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        limit: int | None = None,
+        newest_first: bool = False,
+    ) -> list[RawEvent]:
+        """
+        Events matching every given filter, ordered by timestamp.
+
+        Args:
+            source: Event source ("github", "jira", ...)
+            type: Event type ("pull_request", "message", ...)
+            repo: Partition key the events were loaded under
+            key: Jira issue / PR key
+            since: Inclusive lower bound on the timestamp
+            until: Exclusive upper bound on the timestamp
+            limit: Maximum number of events
+            newest_first: Order by descending timestamp
+
+        Returns:
+            Matching events
+        """
+        clauses, params = [], []
+        for column, value in (("source", source), ("type", type), ("repo", repo), ("key", key)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if since is not None:
+            clauses.append("ts >= ?")
+            params.append(_epoch(since))
+        if until is not None:
+            clauses.append("ts < ?")
+            params.append(_epoch(until))
+
+        sql = "SELECT body FROM events"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY ts DESC" if newest_first else " ORDER BY ts"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        return [RawEvent.model_validate_json(body) for (body,) in rows]
+
+    def events_referencing(self, ref: str) -> list[RawEvent]:
+        """Events whose ``references`` include ``ref`` (e.g. ``"pr:145"``)."""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT e.body FROM event_refs r JOIN events e "
+                "ON e.source = r.source AND e.type = r.type AND e.id = r.id AND e.repo = r.repo "
+                "WHERE r.ref = ? ORDER BY e.ts",
+                (ref,),
+            ).fetchall()
+        return [RawEvent.model_validate_json(body) for (body,) in rows]
+
+    def get_node(self, node_id: str) -> Node | None:
+        """Look up one graph node by ID."""
+        with self._lock:
+            self._ensure_graph()
+            row = self.conn.execute("SELECT body FROM nodes WHERE id = ?", (node_id,)).fetchone()
+        return Node.model_validate_json(row[0]) if row else None
+
+    @staticmethod
+    def _node_filters(
+        type: str | list[str] | None,
+        status: str | list[str] | None,
+        repo: str | None,
+        since: datetime | None,
+        until: datetime | None,
+    ) -> tuple[list[str], list[Any]]:
+        """WHERE clauses and parameters for node queries (lists match any value)."""
+        clauses, params = [], []
+        for column, value in (("type", type), ("status", status), ("repo", repo)):
+            if isinstance(value, list):
+                clauses.append(f"{column} IN ({', '.join('?' * len(value))})")
+                params.extend(value)
+            elif value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if since is not None:
+            clauses.append("created_at >= ?")
+            params.append(_epoch(since))
+        if until is not None:
+            clauses.append("created_at < ?")
+            params.append(_epoch(until))
+        return clauses, params
+
+    def query_nodes(
+        self,
+        type: str | list[str] | None = None,
+        status: str | list[str] | None = None,
+        repo: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        limit: int | None = None,
+    ) -> list[Node]:
+        """Graph nodes matching every given filter, ordered by creation time."""
+        clauses, params = self._node_filters(type, status, repo, since, until)
+
+        sql = "SELECT body FROM nodes"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY created_at"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            self._ensure_graph()
+            rows = self.conn.execute(sql, params).fetchall()
+        return [Node.model_validate_json(body) for (body,) in rows]
+
+    def page_nodes(
+        self,
+        type: str | list[str] | None = None,
+        status: str | list[str] | None = None,
+        repo: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        after: tuple[float, str] | None = None,
+        limit: int = 100,
+    ) -> list[tuple[float, str, str]]:
+        """
+        One page of nodes in ``(created_at, id)`` order, for keyset pagination.
+
+        Args:
+            type: Node type(s) to include
+            status: Node status(es) to include
+            repo: Partition the nodes were loaded under
+            since: Inclusive lower bound on ``created_at``
+            until: Exclusive upper bound on ``created_at``
+            after: ``(created_at epoch, id)`` of the last node of the previous page
+            limit: Page size
+
+        Returns:
+            ``(created_at epoch, id, node JSON)`` rows
+        """
+        clauses, params = self._node_filters(type, status, repo, since, until)
+        if after is not None:
+            clauses.append("(created_at, id) > (?, ?)")
+            params.extend(after)
+
+        sql = "SELECT created_at, id, body FROM nodes"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY created_at, id LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            self._ensure_graph()
+            return self.conn.execute(sql, params).fetchall()
+
+    def edges_from(self, node_ids: list[str]) -> list[Edge]:
+        """Edges leaving any of ``node_ids``."""
+        edges: list[Edge] = []
+        with self._lock:
+            self._ensure_graph()
+            # Stay well under SQLite's bound-parameter limit
+            for start in range(0, len(node_ids), 500):
+                chunk = node_ids[start:start + 500]
+                rows = self.conn.execute(
+                    "SELECT from_node, to_node, type FROM edges "
+                    f"WHERE from_node IN ({', '.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                edges.extend(Edge(from_node=f, to_node=t, type=edge_type) for f, t, edge_type in rows)
+        return edges
+
+    def edges_for(self, node_id: str) -> list[Edge]:
+        """Edges into or out of a node."""
+        with self._lock:
+            self._ensure_graph()
+            rows = self.conn.execute(
+                "SELECT from_node, to_node, type FROM edges WHERE from_node = ? "
+                "UNION SELECT from_node, to_node, type FROM edges WHERE to_node = ?",
+                (node_id, node_id),
+            ).fetchall()
+        return [Edge(from_node=f, to_node=t, type=edge_type) for f, t, edge_type in rows]
+
+    def get_graph(self, repo: str | None = None) -> WorkflowGraph:
+        """
+        The stored workflow graph.
+
+        Args:
+            repo: Only nodes loaded under this partition, and edges between them
+        """
+        nodes = self.query_nodes(repo=repo)
+        with self._lock:
+            if repo is None:
+                rows = self.conn.execute("SELECT from_node, to_node, type FROM edges").fetchall()
+            else:
+                rows = self.conn.execute(
+                    "SELECT e.from_node, e.to_node, e.type FROM edges e "
+                    "JOIN nodes a ON a.id = e.from_node JOIN nodes b ON b.id = e.to_node "
+                    "WHERE a.repo = ? AND b.repo = ?",
+                    (repo, repo),
+                ).fetchall()
+        edges = [Edge(from_node=f, to_node=t, type=edge_type) for f, t, edge_type in rows]
+        return WorkflowGraph(nodes=nodes, edges=edges)
+
+    def repos(self) -> list[str]:
+        """Distinct partition keys with stored events."""
+        with self._lock:
+            rows = self.conn.execute("SELECT DISTINCT repo FROM events ORDER BY repo").fetchall()
+        return [repo for (repo,) in rows]
+
+    def stats(self) -> dict[str, Any]:
+        """Row counts per table and events per source/type."""
+        with self._lock:
+            self._ensure_graph()
+            by_type = self.conn.execute(
+                "SELECT source, type, COUNT(*) FROM events GROUP BY source, type ORDER BY source, type"
+            ).fetchall()
+            return {
+                "events": sum(count for _, _, count in by_type),
+                "events_by_type": {f"{source}/{type_}": count for source, type_, count in by_type},
+                "nodes": self.conn.execute("SELECT COUNT(*) FROM nodes").fetchone()[0],
+                "edges": self.conn.execute("SELECT COUNT(*) FROM edges").fetchone()[0],
+                "generation": int(self._get_meta("generation")),
+            }
+
+
+# Singleton instance (the database file is created on first use)
+warehouse = EventWarehouse(settings.warehouse_path)
@@ -1,9 +1,38 @@
-"""Client for IBM watsonx Orchestrate API."""
+"""Client for IBM watsonx Orchestrate API.
 
-import httpx
-from typing import AsyncGenerator
+httpx is imported on first use and one pooled ``AsyncClient`` is shared by
+all calls, so importing the app (and stub mode) never pays for it.
+``warmup()`` creates the pool and fetches an IAM token ahead of traffic.
 
+The IAM token is kept in the shared state store, and a lease there lets a
+single worker refresh it while the others wait for the result, so running
+N workers doesn't mean N token fetches.
+"""
+
+import asyncio
+import os
+import time
+from typing import TYPE_CHECKING, AsyncGenerator
+
+import orjson
+
+from app.core.log import get_logger, log_payload
+from app.core.metrics import IAM_TOKEN_REFRESHES, WATSONX_REQUEST_SECONDS, cache_lookup
 from app.core.settings import settings
+from app.core.shared_state import shared_store
+from app.core.tracing import SPAN_KIND_CLIENT, current_span, current_traceparent, span, traced
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = get_logger(__name__)
+
+IAM_TOKEN_KEY = "watsonx:iam_token"
+IAM_LEASE_KEY = "watsonx:iam_refresh"
+# Refresh this many seconds before the token expires
+IAM_REFRESH_MARGIN = 300
+# Longer than the IAM request timeout, so a crashed refresher's lease lapses
+IAM_LEASE_SECONDS = 35.0
 
 
 class WatsonxClientError(Exception):
@@ -24,24 +53,122 @@ class WatsonxClient:
         self.instance_id = settings.watsonx_instance_id
         self.agent_id = settings.watsonx_agent_id
         self.agent_env_id = settings.watsonx_agent_env_id
+        self.iam_url = settings.watsonx_iam_url
         self._access_token: str | None = None
         self._token_expires_at: float = 0
+        # One token refresh per process at a time
+        self._token_lock = asyncio.Lock()
+        self._http: "httpx.AsyncClient | None" = None
+
+    def _client(self) -> "httpx.AsyncClient":
+        """The shared pooled HTTP client, created on first use."""
+        if self._http is None or self._http.is_closed:
+            import httpx
+
+            self._http = httpx.AsyncClient(
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=settings.watsonx_max_connections,
+                    max_keepalive_connections=settings.watsonx_max_keepalive,
+                ),
+            )
+        return self._http
 
+    async def warmup(self) -> None:
+        """Create the connection pool and fetch an IAM token before serving traffic.
+
+        Failures are logged, not raised: the token is fetched again on the
+        first request.
+        """
+        self._client()
+        if not self.api_key:
+            return
+        start = time.perf_counter()
+        try:
+            await self._get_access_token()
+        except Exception as e:
+            logger.warning("watsonx warmup failed, continuing: %s", e)
+            return
+        logger.info("watsonx warmup done in %.0fms", (time.perf_counter() - start) * 1000)
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and its pooled connections."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    def _token_valid(self) -> bool:
+        return bool(self._access_token and time.time() < self._token_expires_at - IAM_REFRESH_MARGIN)
+
+    @traced("iam_token")
     async def _get_access_token(self) -> str:
         """Get IAM access token from API key.
 
-        IAM tokens are valid for ~60 minutes. We cache the token and refresh
-        when it expires.
+        IAM tokens are valid for ~60 minutes. The token is cached in this
+        process and in the shared state store, and refreshed when it expires.
         """
-        import time
-
-        # Check if we have a valid cached token (with 5 min buffer)
-        if self._access_token and time.time() < (self._token_expires_at - 300):
+        cached = self._token_valid()
+        cache_lookup("iam_token", hit=cached)
+        current_span().set_attribute("cache.hit", cached)
+        if cached:
             return self._access_token
 
-        async with httpx.AsyncClient() as client:
+        async with self._token_lock:
+            # Another request may have refreshed it while we waited
+            if self._token_valid() or await self._load_shared_token():
+                return self._access_token
+            return await self._refresh_shared_token()
+
+    async def _load_shared_token(self) -> bool:
+        """Adopt a token another worker stored; False if there is none."""
+        raw = await asyncio.to_thread(shared_store.get, IAM_TOKEN_KEY)
+        if raw is None:
+            return False
+        data = orjson.loads(raw)
+        self._access_token, self._token_expires_at = data["access_token"], data["expires_at"]
+        return self._token_valid()
+
+    async def _refresh_shared_token(self) -> str:
+        """Fetch a token under the shared lease, or wait for the worker holding it."""
+        lease = str(os.getpid()).encode()
+        while not await asyncio.to_thread(shared_store.add, IAM_LEASE_KEY, lease, IAM_LEASE_SECONDS):
+            await asyncio.sleep(0.05)
+            if await self._load_shared_token():
+                return self._access_token
+        try:
+            token, expires_in = await self._fetch_token()
+            self._access_token = token
+            self._token_expires_at = time.time() + expires_in
+            await asyncio.to_thread(
+                shared_store.set,
+                IAM_TOKEN_KEY,
+                orjson.dumps({"access_token": token, "expires_at": self._token_expires_at}),
+                max(expires_in - IAM_REFRESH_MARGIN, 1),
+            )
+            return token
+        finally:
+            await asyncio.to_thread(shared_store.delete, IAM_LEASE_KEY, lease)
+
+    async def _invalidate_token(self, token: str) -> None:
+        """Drop a token upstream rejected, here and (if still current) for the other workers."""
+        self._access_token = None
+        raw = await asyncio.to_thread(shared_store.get, IAM_TOKEN_KEY)
+        if raw is not None and orjson.loads(raw)["access_token"] == token:
+            await asyncio.to_thread(shared_store.delete, IAM_TOKEN_KEY, raw)
+
+    async def _fetch_token(self) -> tuple[str, int]:
+        """Exchange the API key for a new IAM token.
+
+        Returns:
+            The access token and its lifetime in seconds
+        """
+        import httpx
+
+        client = self._client()
+        start = time.perf_counter()
+        try:
             response = await client.post(
-                "https://iam.cloud.ibm.com/identity/token",
+                self.iam_url,
                 headers={"Content-Type": "application/x-www-form-urlencoded"},
                 data={
                     "grant_type": "urn:ibm:params:oauth:grant-type:apikey",
@@ -49,18 +176,56 @@ class WatsonxClient:
                 },
                 timeout=30.0,
             )
+        except httpx.HTTPError:
+            WATSONX_REQUEST_SECONDS.observe(time.perf_counter() - start, "iam_token", "error")
+            IAM_TOKEN_REFRESHES.inc("failure")
+            raise
+        WATSONX_REQUEST_SECONDS.observe(time.perf_counter() - start, "iam_token", str(response.status_code))
+
+        if response.status_code != 200:
+            IAM_TOKEN_REFRESHES.inc("failure")
+            logger.warning("IAM token refresh failed with status %s", response.status_code)
+            raise WatsonxClientError(
+                f"Failed to get IAM token: {response.text}",
+                status_code=response.status_code,
+            )
 
-            if response.status_code != 200:
-                raise WatsonxClientError(
-                    f"Failed to get IAM token: {response.text}",
-                    status_code=response.status_code,
-                )
-
-            data = response.json()
-            self._access_token = data["access_token"]
-            # Token expires in ~3600 seconds, store expiration time
-            self._token_expires_at = time.time() + data.get("expires_in", 3600)
-            return self._access_token
+        IAM_TOKEN_REFRESHES.inc("success")
+        data = response.json()
+        # Token expires in ~3600 seconds
+        expires_in = data.get("expires_in", 3600)
+        logger.debug("IAM access token refreshed (expires in %ss)", expires_in)
+        return data["access_token"], expires_in
+
+    async def ping(self, timeout: float = 5.0) -> int:
+        """GET the Orchestrate host and return the HTTP status (reachability only)."""
+        start = time.perf_counter()
+        status = "error"
+        try:
+            response = await self._client().get(self.base_url, timeout=timeout)
+            status = str(response.status_code)
+            return response.status_code
+        finally:
+            WATSONX_REQUEST_SECONDS.observe(time.perf_counter() - start, "ping", status)
+
+    @staticmethod
+    async def _timed_post(
+        client: "httpx.AsyncClient", operation: str, url: str, **kwargs
+    ) -> "httpx.Response":
+        """POST in a ``watsonx_<operation>`` span and record upstream latency and status."""
+        start = time.perf_counter()
+        status = "error"
+        attributes = {"http.method": "POST", "http.url": url}
+        with span(f"watsonx_{operation}", kind=SPAN_KIND_CLIENT, **attributes) as post_span:
+            # Propagate the trace to watsonx
+            kwargs["headers"] = {**kwargs.get("headers", {}), "traceparent": post_span.traceparent()}
+            try:
+                response = await client.post(url, **kwargs)
+                status = str(response.status_code)
+                post_span.set_attribute("http.status_code", response.status_code)
+                return response
+            finally:
+                WATSONX_REQUEST_SECONDS.observe(time.perf_counter() - start, operation, status)
 
     def _build_chat_url(self, agent_id: str | None = None) -> str:
         """Build the Chat Completions API URL.
@@ -72,7 +237,7 @@ class WatsonxClient:
 
         # Try: {base}/v1/orchestrate/{agent_id}/chat/completions
         url = f"{base}/v1/orchestrate/{agent}/chat/completions"
-        print(f"[DEBUG] watsonx URL: {url}")
+        logger.debug("watsonx URL: %s", url)
         return url
 
     async def chat(
@@ -121,7 +286,9 @@ class WatsonxClient:
                     return obj.isoformat()
                 raise TypeError(f"Type {type(obj)} not serializable")
 
-            context_content = json.dumps({"workflow_graph": context["workflow_graph"]}, default=json_serial)
+            with span("serialize_context") as serialize_span:
+                context_content = json.dumps({"workflow_graph": context["workflow_graph"]}, default=json_serial)
+                serialize_span.set_attribute("context.bytes", len(context_content))
             messages.append({
                 "role": "user",
                 "content": f"Here is the current workflow graph context:\n{context_content}\n\nUser question: {message}"
@@ -135,39 +302,42 @@ class WatsonxClient:
             "messages": messages,
         }
 
-        print(f"[DEBUG] Request payload: {payload}")
-        print(f"[DEBUG] Auth token (first 20 chars): {token[:20]}...")
-
-        async with httpx.AsyncClient(follow_redirects=True) as client:
-            response = await client.post(
+        log_payload(logger, "watsonx chat request", payload)
+
+        client = self._client()
+        response = await self._timed_post(
+            client,
+            "chat",
+            url,
+            headers=headers,
+            json=payload,
+            timeout=60.0,  # Agents may take time to reason
+        )
+
+        logger.debug("watsonx chat response status: %s", response.status_code)
+        log_payload(logger, "watsonx chat response", response.content)
+
+        if response.status_code == 401:
+            # Token expired, clear and retry once
+            await self._invalidate_token(token)
+            token = await self._get_access_token()
+            headers["Authorization"] = f"Bearer {token}"
+            response = await self._timed_post(
+                client,
+                "chat",
                 url,
                 headers=headers,
                 json=payload,
-                timeout=60.0,  # Agents may take time to reason
+                timeout=60.0,
+            )
+
+        if response.status_code != 200:
+            raise WatsonxClientError(
+                f"Chat request failed: {response.text}",
+                status_code=response.status_code,
             )
 
-            print(f"[DEBUG] Response status: {response.status_code}")
-            print(f"[DEBUG] Response body: {response.text[:500]}")
-
-            if response.status_code == 401:
-                # Token expired, clear and retry once
-                self._access_token = None
-                token = await self._get_access_token()
-                headers["Authorization"] = f"Bearer {token}"
-                response = await client.post(
-                    url,
-                    headers=headers,
-                    json=payload,
-                    timeout=60.0,
-                )
-
-            if response.status_code != 200:
-                raise WatsonxClientError(
-                    f"Chat request failed: {response.text}",
-                    status_code=response.status_code,
-                )
-
-            return response.json()
+        return response.json()
 
     async def chat_stream(
         self,
@@ -193,6 +363,9 @@ class WatsonxClient:
             "Authorization": f"Bearer {token}",
             "Content-Type": "application/json",
         }
+        traceparent = current_traceparent()
+        if traceparent:
+            headers["traceparent"] = traceparent
 
         payload = {
             "messages": [
@@ -204,7 +377,11 @@ class WatsonxClient:
         if conversation_id:
             payload["conversation_id"] = conversation_id
 
-        async with httpx.AsyncClient() as client:
+        client = self._client()
+        # Latency covers the whole stream, labeled with the response status
+        start = time.perf_counter()
+        status = "error"
+        try:
             async with client.stream(
                 "POST",
                 url,
@@ -212,6 +389,7 @@ class WatsonxClient:
                 json=payload,
                 timeout=60.0,
             ) as response:
+                status = str(response.status_code)
                 if response.status_code != 200:
                     error_text = await response.aread()
                     raise WatsonxClientError(
@@ -221,7 +399,9 @@ class WatsonxClient:
 
                 async for chunk in response.aiter_text():
                     yield chunk
+        finally:
+            WATSONX_REQUEST_SECONDS.observe(time.perf_counter() - start, "chat_stream", status)
 
 
-# Singleton instance
+# Singleton instance (cheap: the HTTP client is created on first use)
 watsonx_client = WatsonxClient()
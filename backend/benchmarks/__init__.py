@@ -0,0 +1,4 @@
+"""Performance benchmarks for the FlowSight backend.
+
+Run from the ``backend`` directory, e.g. ``python -m benchmarks.bench_text_scan``.
+"""
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark: streaming HTML-to-text vs. the regex tag stripper for Teams bodies.
+
+Also reports the pure ``html.parser`` path, which bodies with script/style
+blocks or comments take.
+
+Usage:
+    python -m benchmarks.bench_html_text --messages 200000
+"""
+
+import argparse
+import random
+import time
+
+from app.pipeline.cleaners.html_text import HTMLTextExtractor, html_to_text
+from app.pipeline.cleaners.text_scan import strip_html
+
+_FRAGMENTS = [
+    "<p>Deployment to production completed successfully for PAY-102.</p>",
+    '<p><at id="0">Alice Chen</at>&nbsp;can you review PR #145?</p>',
+    "<div>CI failed on #151 &amp; #152 &mdash; looking into it</div>",
+    "<p>Notes:</p><ul><li>retry with backoff</li><li>alert on &gt;5% errors</li></ul>",
+    '<attachment id="1712345678901"></attachment>',
+    "<pre><code>if (retries &lt; 3) { retry(); }</code></pre>",
+    "<p>merged, thanks!</p>",
+    "plain text reply without markup",
+]
+
+# A pasted log / large table: the case the output cap is for
+_LARGE_ROW = "<tr><td>payment-service</td><td>ERROR</td><td>timeout after 30s</td></tr>"
+
+
+def generate_bodies(count: int, seed: int = 42, large_every: int = 1000) -> list[str]:
+    """Build deterministic Teams-style HTML bodies, with an occasional very large one."""
+    rng = random.Random(seed)
+    bodies = []
+    for i in range(count):
+        if large_every and i % large_every == large_every - 1:
+            bodies.append("<table>" + _LARGE_ROW * rng.randint(2000, 5000) + "</table>")
+        else:
+            bodies.append("".join(rng.choices(_FRAGMENTS, k=rng.randint(1, 4))))
+    return bodies
+
+
+def parser_only(body: str) -> str:
+    """Extract text with the html.parser subclass alone (no fast path)."""
+    parser = HTMLTextExtractor()
+    parser.feed(body)
+    parser.close()
+    return parser.text()
+
+
+def _time(fn, bodies: list[str]) -> float:
+    started = time.perf_counter()
+    for body in bodies:
+        fn(body)
+    return time.perf_counter() - started
+
+
+def main():
+    """Run the benchmark and print throughput."""
+    parser = argparse.ArgumentParser(description="Benchmark HTML body extraction")
+    parser.add_argument("-n", "--messages", type=int, default=200_000, help="Number of bodies")
+    parser.add_argument("--large-every", type=int, default=1000, help="One large body every N (0 = none)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    bodies = generate_bodies(args.messages, args.seed, args.large_every)
+    total_chars = sum(len(b) for b in bodies)
+    print(f"{len(bodies):,} bodies, {total_chars / 1e6:.1f}M chars")
+
+    for name, fn in [
+        ("regex strip", strip_html),
+        ("html.parser only", parser_only),
+        ("html_to_text", html_to_text),
+    ]:
+        elapsed = _time(fn, bodies)
+        print(f"  {name:<18} {elapsed:8.2f}s  {len(bodies) / elapsed:>12,.0f} bodies/s")
+
+
+if __name__ == "__main__":
+    main()
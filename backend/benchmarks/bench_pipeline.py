@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+End-to-end pipeline benchmark on synthetic GitHub, Jira, Slack and Teams data.
+
+Times every stage per source and scale:
+
+    clean            JiraCleaner / SlackCleaner / TeamsCleaner.clean_all
+    transform        transform_*_to_raw_events
+    normalize        normalize_events_to_graph over all sources' events
+    extract_metadata HybridEmbeddingStrategy.extract_metadata per GitHub event
+    hybrid_search    re-ranking of vector + BM25 candidates (in-memory collection)
+    serialize_*      JSON encoding of the raw events and the workflow graph
+
+Results are written as JSON; pass a previous file with ``--compare`` to
+flag stages that got slower than ``--threshold``.
+
+Usage:
+    python -m benchmarks.bench_pipeline                          # 1k and 100k
+    python -m benchmarks.bench_pipeline --scales 1k,100k,1m --output results.json
+    python -m benchmarks.bench_pipeline --compare baseline.json --threshold 0.15
+"""
+
+import argparse
+import gc
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+from app.models.events import RawEventsPayload
+from app.models.graph import GraphEnvelope
+from app.pipeline.cleaners.jira_cleaner import JiraCleaner
+from app.pipeline.cleaners.slack_cleaner import SlackCleaner
+from app.pipeline.cleaners.teams_cleaner import TeamsCleaner
+from app.pipeline.core.embedding_strategy import HybridEmbeddingStrategy, hybrid_search
+from app.pipeline.core.transformer import (
+    transform_github_to_raw_events,
+    transform_jira_to_raw_events,
+    transform_slack_to_raw_events,
+    transform_teams_to_raw_events,
+)
+from app.services.normalizer import normalize_events_to_graph
+from benchmarks.datasets import GENERATORS, SCALES, parse_scale
+
+CLEANERS = {"jira": JiraCleaner, "slack": SlackCleaner, "teams": TeamsCleaner}
+TRANSFORMS = {
+    "github": transform_github_to_raw_events,
+    "jira": transform_jira_to_raw_events,
+    "slack": transform_slack_to_raw_events,
+    "teams": transform_teams_to_raw_events,
+}
+# GitHub collection -> embedding event type (as in HybridEmbeddingStrategy.embed_github_data)
+GITHUB_EVENT_TYPES = {
+    "commits": "commit",
+    "pull_requests": "pull_request",
+    "ci_runs": "workflow_run",
+    "deployments": "deployment",
+}
+# Re-rank at most this many candidates per side (the API asks for limit * 2)
+MAX_SEARCH_CANDIDATES = 100_000
+
+
+class InMemoryCollection:
+    """Stands in for an Astra collection: returns fixed vector and BM25 candidate lists."""
+
+    def __init__(self, documents: list[dict[str, Any]], seed: int = 42):
+        rng = random.Random(seed)
+        self._vector = [{**doc, "$similarity": rng.random()} for doc in documents]
+        self._bm25 = documents[:]
+        rng.shuffle(self._bm25)
+
+    def vector_find(self, embedding, limit: int, filter=None, include_similarity: bool = True):
+        return self._vector[:limit]
+
+    def find(self, query, limit: int):
+        return self._bm25[:limit]
+
+
+def _measure(fn: Callable[[], Any], repeat: int) -> tuple[float, Any]:
+    """Best-of-``repeat`` wall time for ``fn`` (GC collected before, disabled during)."""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            result = fn()
+            best = min(best, time.perf_counter() - started)
+        finally:
+            gc.enable()
+    return best, result
+
+
+def _github_events(github: dict[str, Any]) -> list[dict[str, Any]]:
+    return [
+        {"type": event_type, **record}
+        for collection, event_type in GITHUB_EVENT_TYPES.items()
+        for record in github.get(collection, [])
+    ]
+
+
+def run_scale(size: int, sources: list[str], seed: int, workers: int, repeat: int) -> list[dict[str, Any]]:
+    """Run every stage for one scale and return result rows."""
+    rows: list[dict[str, Any]] = []
+
+    def record(source: str, stage: str, records: int, seconds: float) -> None:
+        rows.append({
+            "scale": size,
+            "source": source,
+            "stage": stage,
+            "records": records,
+            "seconds": round(seconds, 6),
+            "records_per_sec": round(records / seconds, 1) if seconds > 0 else None,
+        })
+        print(f"  {source:<7} {stage:<18} {records:>10,} {seconds:>10.3f}s  {records / max(seconds, 1e-9):>14,.0f}/s")
+
+    all_events = []
+    github = None
+    for source in sources:
+        started = time.perf_counter()
+        dataset = GENERATORS[source](size, seed)
+        print(f"  {source:<7} {'(generate)':<18} {size:>10,} {time.perf_counter() - started:>10.3f}s")
+
+        if source in CLEANERS:
+            seconds, dataset = _measure(
+                lambda: CLEANERS[source]().clean_all(dataset, workers=workers), repeat
+            )
+            record(source, "clean", size, seconds)
+        if source == "github":
+            github = dataset
+
+        seconds, events = _measure(lambda: TRANSFORMS[source](dataset), repeat)
+        record(source, "transform", len(events), seconds)
+        all_events.extend(events)
+
+    seconds, graph = _measure(lambda: normalize_events_to_graph(all_events), repeat)
+    record("all", "normalize", len(all_events), seconds)
+
+    if github is not None:
+        strategy = HybridEmbeddingStrategy()
+        github_events = _github_events(github)
+        seconds, metadata = _measure(lambda: [strategy.extract_metadata(e) for e in github_events], repeat)
+        record("github", "extract_metadata", len(github_events), seconds)
+
+        candidates = [
+            {"_id": f"doc-{i}", "search_metadata": meta}
+            for i, meta in enumerate(metadata[:MAX_SEARCH_CANDIDATES])
+        ]
+        collection = InMemoryCollection(candidates, seed)
+        limit = max(len(candidates) // 2, 1)
+        seconds, _ = _measure(
+            lambda: hybrid_search(collection, "payment retry", [0.0], limit=limit), repeat
+        )
+        record("github", "hybrid_search", len(candidates) * 2, seconds)
+
+    payload = RawEventsPayload(raw_events=all_events)
+    seconds, body = _measure(lambda: payload.model_dump_json(by_alias=True), repeat)
+    record("all", "serialize_events", len(all_events), seconds)
+
+    envelope = GraphEnvelope(workflow_graph=graph)
+    seconds, body = _measure(lambda: envelope.model_dump_json(by_alias=True), repeat)
+    record("all", "serialize_graph", len(graph.nodes) + len(graph.edges), seconds)
+    return rows
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: list[dict[str, Any]], baseline_path: str, threshold: float) -> int:
+    """
+    Print per-stage change against a previous results file.
+
+    Returns:
+        Number of stages slower than the baseline by more than ``threshold``
+    """
+    baseline = json.loads(Path(baseline_path).read_text())
+    previous = {(r["scale"], r["source"], r["stage"]): r["seconds"] for r in baseline["results"]}
+    regressions = 0
+    print(f"\nCompared with {baseline_path} (commit {baseline['meta'].get('commit')}):")
+    for row in results:
+        before = previous.get((row["scale"], row["source"], row["stage"]))
+        if not before:
+            continue
+        change = row["seconds"] / before - 1
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        print(f"  {row['scale']:>9,} {row['source']:<7} {row['stage']:<18} {change:>+8.1%}{flag}")
+    return regressions
+
+
+def main():
+    """Run the benchmark, write JSON results and optionally compare with a baseline."""
+    parser = argparse.ArgumentParser(description="Benchmark the FlowSight pipeline stages")
+    parser.add_argument(
+        "--scales", default="1k,100k", help=f"Comma-separated sizes ({', '.join(SCALES)} or integers)"
+    )
+    parser.add_argument(
+        "--sources", default=",".join(GENERATORS), help="Comma-separated sources to include"
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--workers", type=int, default=1, help="Cleaner worker processes (0 = one per CPU)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per stage; the best is kept")
+    parser.add_argument("--output", default="benchmarks/results/bench_pipeline.json", help="Results JSON file")
+    parser.add_argument("--compare", help="Previous results JSON to compare against")
+    parser.add_argument(
+        "--threshold", type=float, default=0.10, help="Slowdown fraction reported as a regression"
+    )
+    args = parser.parse_args()
+
+    sources = [s.strip() for s in args.sources.split(",") if s.strip()]
+    unknown = [s for s in sources if s not in GENERATORS]
+    if unknown:
+        parser.error(f"unknown sources: {', '.join(unknown)}")
+
+    results: list[dict[str, Any]] = []
+    for scale in args.scales.split(","):
+        size = parse_scale(scale)
+        print(f"\nScale {size:,} records per source")
+        results.extend(run_scale(size, sources, args.seed, args.workers, args.repeat))
+
+    report = {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "workers": args.workers,
+        },
+        "results": results,
+    }
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.threshold)
+        if regressions:
+            print(f"\n{regressions} stage(s) slower than the baseline by more than {args.threshold:.0%}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Cold-start import budget for the API and the pipeline CLIs.
+
+Imports each entry module in a fresh interpreter under ``python -X importtime``
+and checks two things:
+
+    budget   cumulative import time of the module (best of ``--repeat``) must
+             stay under its budget in BUDGETS_MS
+    lazy     modules in LAZY_MODULES (HTTP clients, Astra SDK) must not be
+             imported at all; they load on first use
+
+Scale-from-zero pays this on every new instance, so a regression here is
+added to the first request's latency.
+
+Usage:
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --modules app.main --top 25
+    python -m benchmarks.bench_startup --scale 2.0      # looser budgets on slow machines
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+# Import budgets (ms, cumulative, best of --repeat). FastAPI + pydantic alone
+# account for ~300ms of app.main.
+BUDGETS_MS = {
+    "app.main": 600,
+    "app.pipeline.cli.cli": 100,
+    "app.pipeline.cli.run_all": 100,
+    "app.pipeline.cli.extract_jira": 300,
+    "app.pipeline.cli.extract_slack": 300,
+    "app.pipeline.cli.extract_teams": 300,
+    "app.pipeline.cli.load_warehouse": 300,
+}
+# Must not be imported by any entry module; they are imported where used
+LAZY_MODULES = ("httpx", "requests", "astrapy", "urllib3")
+
+
+def import_profile(module: str) -> tuple[float, dict[str, tuple[int, int]]]:
+    """
+    Import ``module`` in a fresh interpreter with ``-X importtime``.
+
+    Returns:
+        Wall time of the subprocess in seconds and ``{name: (self_us, cumulative_us)}``
+    """
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    wall = time.perf_counter() - started
+    if proc.returncode != 0:
+        raise RuntimeError(f"importing {module} failed:\n{proc.stderr[-2000:]}")
+
+    profile: dict[str, tuple[int, int]] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        profile[name.strip()] = (int(self_us), int(cumulative_us))
+    return wall, profile
+
+
+def measure(module: str, repeat: int) -> dict[str, Any]:
+    """Best-of-``repeat`` import profile for one module."""
+    best_ms, best_wall, best_profile = float("inf"), 0.0, {}
+    for _ in range(repeat):
+        wall, profile = import_profile(module)
+        ms = profile[module][1] / 1000
+        if ms < best_ms:
+            best_ms, best_wall, best_profile = ms, wall, profile
+    return {
+        "module": module,
+        "import_ms": round(best_ms, 1),
+        "process_ms": round(best_wall * 1000, 1),
+        "modules_loaded": len(best_profile),
+        "lazy_violations": sorted(name for name in LAZY_MODULES if name in best_profile),
+        "profile": best_profile,
+    }
+
+
+def print_top(result: dict[str, Any], top: int) -> None:
+    """Print the modules with the highest self import time."""
+    rows = sorted(result["profile"].items(), key=lambda item: item[1][0], reverse=True)[:top]
+    print(f"\nSlowest imports under {result['module']} (self time):")
+    for name, (self_us, cumulative_us) in rows:
+        print(f"  {self_us / 1000:>8.1f}ms {cumulative_us / 1000:>9.1f}ms  {name}")
+
+
+def main():
+    """Measure import times, print them against the budgets and exit non-zero on overruns."""
+    parser = argparse.ArgumentParser(description="Check cold-start import time budgets")
+    parser.add_argument("--modules", default=",".join(BUDGETS_MS), help="Comma-separated entry modules")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh imports per module; the best is kept")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply every budget (slow CI machines)")
+    parser.add_argument("--top", type=int, default=0, help="Show the N slowest imports of the first module")
+    parser.add_argument("--output", default="benchmarks/results/bench_startup.json", help="Results JSON file")
+    args = parser.parse_args()
+
+    modules = [m.strip() for m in args.modules.split(",") if m.strip()]
+    results = []
+    failures = 0
+    print(f"{'module':<34} {'import':>10} {'budget':>10} {'process':>10} {'modules':>8}")
+    for module in modules:
+        result = measure(module, args.repeat)
+        budget = BUDGETS_MS.get(module)
+        result["budget_ms"] = budget * args.scale if budget else None
+        over = result["budget_ms"] is not None and result["import_ms"] > result["budget_ms"]
+        flag = "  OVER BUDGET" if over else ""
+        if result["lazy_violations"]:
+            flag += f"  eager: {', '.join(result['lazy_violations'])}"
+        failures += bool(flag)
+        budget_text = f"{result['budget_ms']:.0f}ms" if budget else "-"
+        print(
+            f"{module:<34} {result['import_ms']:>8.1f}ms {budget_text:>10} "
+            f"{result['process_ms']:>8.1f}ms {result['modules_loaded']:>8}{flag}"
+        )
+        results.append(result)
+
+    if args.top and results:
+        print_top(results[0], args.top)
+
+    report = {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+            "scale": args.scale,
+        },
+        "results": [{k: v for k, v in r.items() if k != "profile"} for r in results],
+    }
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"\nResults written to {output}")
+
+    if failures:
+        print(f"\n{failures} module(s) over budget or importing lazy dependencies eagerly")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,332 @@
+"""Deterministic synthetic GitHub, Jira, Slack and Teams datasets.
+
+Each generator returns a dataset with the top-level layout of the matching
+``data/*.json`` file, with records carrying the fields the extractors emit
+(and the cleaners read). The same ``(size, seed)`` always produces the same
+data, so timings are comparable across runs and machines.
+
+Records cross-reference each other the way real data does: PRs list their
+commits and linked issues, CI runs and deployments name their PR, and chat
+messages mention PRs and issue keys, so the normalizer builds a connected
+graph rather than isolated nodes.
+
+``size`` is the number of records for the source (commits + PRs + CI runs +
+deployments for GitHub; issues for Jira; messages for Slack; messages +
+meetings for Teams).
+"""
+
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+
+SCALES = {"1k": 1_000, "100k": 100_000, "1m": 1_000_000}
+
+PROJECT_KEY = "PAY"
+BASE_TIME = datetime(2025, 1, 1, tzinfo=timezone.utc)
+# Generated at a fixed time so open Jira intervals have a stable duration
+GENERATED_AT = "2025-06-30T12:00:00"
+
+USERS = ["alice-chen", "bob-martinez", "carol-johnson", "david-kim", "eva-singh", "frank-ruiz"]
+EMAILS = [f"{u.replace('-', '.')}@company.com" for u in USERS]
+BRANCHES = ["main", "feature/webhook-handlers", "fix/retry-logic", "feature/refunds", "chore/deps"]
+COMMIT_SUBJECTS = [
+    "feat(webhooks): add Stripe webhook handler",
+    "fix: retry payment API calls with exponential backoff",
+    "refactor: extract refund service",
+    "test: cover idempotency keys",
+    "Merge pull request from feature branch",
+    "chore: bump dependencies",
+    "hotfix: handle null currency code",
+]
+ISSUE_TYPES = ["Epic", "Story", "Bug", "Task", "Sub-task"]
+ISSUE_STATUSES = ["To Do", "In Progress", "In Review", "Blocked", "Done"]
+PRIORITIES = ["Highest", "High", "Medium", "Low"]
+CI_STATUSES = ["success", "success", "success", "failure", "cancelled", "in_progress"]
+ENVIRONMENTS = ["staging", "production"]
+SLACK_FRAGMENTS = [
+    "Hey team, PR-{pr} is ready for review!",
+    "cc <@U02BOB> <@U01ALICE>",
+    "{issue} is blocking {issue2}.",
+    "see <https://github.com/acme/payments/pull/{pr}|PR #{pr}>",
+    "posted in <#C01PAYMENT|payment-team>",
+    "CI failed again on #{pr}, looking into it",
+    "merged, thanks!",
+    "Added exponential backoff for payment API retries with comprehensive tests.",
+]
+TEAMS_FRAGMENTS = [
+    "<p>Deployment to production completed successfully for {issue}.</p>",
+    '<p><at id="0">Alice Chen</at>&nbsp;can you review PR-{pr}?</p>',
+    "<div>CI failed on #{pr} &amp; #{pr2} &mdash; looking into it</div>",
+    "<p>Notes:</p><ul><li>retry with backoff</li><li>alert on &gt;5% errors</li></ul>",
+    "<p>merged, thanks!</p>",
+    "plain text reply without markup",
+]
+
+
+def _iso(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _sha(rng: random.Random) -> str:
+    return f"{rng.getrandbits(160):040x}"
+
+
+def _issue_key(rng: random.Random, issues: int) -> str:
+    return f"{PROJECT_KEY}-{rng.randrange(1, max(issues, 1) + 1)}"
+
+
+def generate_github(size: int, seed: int = 42) -> dict[str, Any]:
+    """GitHub dataset: 50% commits, 20% PRs, 20% CI runs, 10% deployments."""
+    rng = random.Random(seed)
+    n_commits, n_prs = size // 2, size // 5
+    n_ci = size // 5
+    n_deploys = size - n_commits - n_prs - n_ci
+    issues = max(size // 10, 1)
+
+    commits = []
+    for i in range(n_commits):
+        commits.append({
+            "sha": _sha(rng),
+            "message": rng.choice(COMMIT_SUBJECTS),
+            "author": rng.choice(USERS),
+            "timestamp": _iso(BASE_TIME + timedelta(minutes=i)),
+            "branch": rng.choice(BRANCHES),
+        })
+
+    pull_requests = []
+    per_pr = max(n_commits // max(n_prs, 1), 1)
+    for i in range(n_prs):
+        number = i + 1
+        created = BASE_TIME + timedelta(minutes=i * per_pr + 30)
+        state = rng.choice(["open", "merged", "merged", "closed", "draft"])
+        pr_commits = [c["sha"] for c in commits[i * per_pr:(i + 1) * per_pr]]
+        pull_requests.append({
+            "number": number,
+            "title": f"{rng.choice(COMMIT_SUBJECTS)} ({_issue_key(rng, issues)})",
+            "author": rng.choice(USERS),
+            "state": state,
+            "created_at": _iso(created),
+            "merged_at": _iso(created + timedelta(hours=rng.randint(1, 96))) if state == "merged" else None,
+            "base_branch": "main",
+            "head_branch": rng.choice(BRANCHES[1:]),
+            "linked_issues": [_issue_key(rng, issues)],
+            "commits": pr_commits,
+            "reviews": [
+                {"reviewer": rng.choice(USERS), "state": rng.choice(["APPROVED", "COMMENTED"]),
+                 "submitted_at": _iso(created + timedelta(hours=1))}
+                for _ in range(rng.randint(0, 3))
+            ],
+            "labels": rng.sample(["critical", "bug", "enhancement", "payments"], rng.randint(0, 2)),
+            "review_time_hours": rng.randint(1, 96),
+            "files_changed": rng.randint(1, 40),
+            "additions": rng.randint(1, 2000),
+            "deletions": rng.randint(0, 800),
+        })
+
+    ci_runs = []
+    for i in range(n_ci):
+        started = BASE_TIME + timedelta(minutes=i * 3)
+        duration = rng.randint(2, 45)
+        ci_runs.append({
+            "id": f"run-{i + 1}",
+            "workflow": rng.choice(["CI Pipeline", "Integration Tests", "Security Scan"]),
+            "trigger": "pull_request",
+            "pr_number": rng.randint(1, max(n_prs, 1)),
+            "status": rng.choice(CI_STATUSES),
+            "started_at": _iso(started),
+            "completed_at": _iso(started + timedelta(minutes=duration)),
+            "duration_minutes": duration,
+        })
+
+    deployments = []
+    for i in range(n_deploys):
+        deployments.append({
+            "id": f"deploy-{i + 1}",
+            "environment": rng.choice(ENVIRONMENTS),
+            "ref": commits[rng.randrange(n_commits)]["sha"] if n_commits else _sha(rng),
+            "pr_number": rng.randint(1, max(n_prs, 1)),
+            "status": rng.choice(["success", "success", "failure"]),
+            "deployed_by": rng.choice(USERS),
+            "deployed_at": _iso(BASE_TIME + timedelta(minutes=i * 10)),
+            "duration_minutes": rng.randint(1, 20),
+        })
+
+    return {
+        "repository": {
+            "name": "order-management-service",
+            "org": "acme-payments",
+            "url": "https://github.com/acme-payments/order-management-service",
+        },
+        "commits": commits,
+        "pull_requests": pull_requests,
+        "ci_runs": ci_runs,
+        "deployments": deployments,
+        "metadata": {
+            "generated_at": GENERATED_AT,
+            "total_commits": len(commits),
+            "total_prs": len(pull_requests),
+            "open_prs": sum(1 for pr in pull_requests if pr["state"] == "open"),
+        },
+    }
+
+
+def generate_jira(size: int, seed: int = 42) -> dict[str, Any]:
+    """Jira dataset of ``size`` issues, each with 1-3 status intervals."""
+    rng = random.Random(seed)
+    prs = max(size // 5, 1)
+    issues = []
+    for i in range(size):
+        created = BASE_TIME + timedelta(minutes=i * 5)
+        history = []
+        start = created
+        for position in range(rng.randint(1, 3)):
+            end = start + timedelta(hours=rng.randint(1, 120))
+            history.append({
+                "status": ISSUE_STATUSES[min(position, len(ISSUE_STATUSES) - 1)],
+                "start": _iso(start),
+                "end": _iso(end),
+            })
+            start = end
+        # The last interval is the current (open) status
+        history[-1]["end"] = None
+        summary = f"Payment gateway work item {i + 1}"
+        if rng.random() < 0.3:
+            summary += f" (see PR-{rng.randint(1, prs)})"
+        issues.append({
+            "key": f"{PROJECT_KEY}-{i + 1}",
+            "type": rng.choice(ISSUE_TYPES),
+            "summary": summary,
+            "status": history[-1]["status"],
+            "priority": rng.choice(PRIORITIES),
+            "assignee": rng.choice(EMAILS),
+            "reporter": rng.choice(EMAILS),
+            "created": _iso(created),
+            "updated": _iso(start),
+            "story_points": rng.choice([None, 1, 2, 3, 5, 8]),
+            "labels": rng.sample(["backend", "payments", "reliability", "tech-debt"], rng.randint(0, 2)),
+            "epic_link": None,
+            "status_history": history,
+        })
+
+    return {
+        "project": {"key": PROJECT_KEY, "name": "Payment Services"},
+        "sprints": [
+            {"id": "10", "name": "Sprint 10", "state": "active",
+             "start_date": "2025-01-17T14:00:00Z", "end_date": "2025-01-31T14:00:00Z",
+             "goal": "Complete Payment Gateway v2 reliability improvements"},
+        ],
+        "issues": issues,
+        "metadata": {
+            "generated_at": GENERATED_AT,
+            "total_issues": len(issues),
+            "blocked_issues": sum(1 for issue in issues if issue["status"] == "Blocked"),
+        },
+    }
+
+
+def _chat_text(rng: random.Random, fragments: list[str], prs: int, issues: int) -> str:
+    return " ".join(
+        fragment.format(
+            pr=rng.randint(1, prs),
+            pr2=rng.randint(1, prs),
+            issue=_issue_key(rng, issues),
+            issue2=_issue_key(rng, issues),
+        )
+        for fragment in rng.choices(fragments, k=rng.randint(1, 3))
+    )
+
+
+def generate_slack(size: int, seed: int = 42) -> dict[str, Any]:
+    """Slack dataset of ``size`` channel messages (about one in five is a thread reply)."""
+    rng = random.Random(seed)
+    prs, issues = max(size // 5, 1), max(size // 10, 1)
+    channels = [
+        {"id": "C01PAYMENT", "name": "payment-team", "purpose": "Payment team coordination"},
+        {"id": "C02DEPLOYS", "name": "deployments", "purpose": "Release announcements"},
+        {"id": "C03INCIDENT", "name": "incidents", "purpose": "Incident response"},
+    ]
+    messages = []
+    base_epoch = BASE_TIME.timestamp()
+    for i in range(size):
+        channel = channels[i % len(channels)]
+        ts = f"{base_epoch + i * 30:.0f}.{i % 1_000_000:06d}"
+        thread_ts = messages[rng.randrange(len(messages))]["ts"] if messages and rng.random() < 0.2 else None
+        user = rng.randrange(len(USERS))
+        message = {
+            "ts": ts,
+            "channel_id": channel["id"],
+            "channel": channel["name"],
+            "user": f"U{user:02d}{USERS[user].split('-')[0].upper()}",
+            "username": USERS[user],
+            "text": _chat_text(rng, SLACK_FRAGMENTS, prs, issues),
+            "timestamp": _iso(BASE_TIME + timedelta(seconds=i * 30)),
+            "thread_ts": thread_ts,
+        }
+        if rng.random() < 0.3:
+            message["reactions"] = [{"name": "eyes", "count": 1, "users": ["U01ALICE"]}]
+        messages.append(message)
+
+    return {
+        "workspace": "acme-engineering",
+        "channels": channels,
+        "messages": messages,
+        "metadata": {"generated_at": GENERATED_AT, "total_messages": len(messages)},
+    }
+
+
+def generate_teams(size: int, seed: int = 42) -> dict[str, Any]:
+    """Teams dataset: 95% channel messages (HTML bodies), 5% meetings."""
+    rng = random.Random(seed)
+    prs, issues = max(size // 5, 1), max(size // 10, 1)
+    n_meetings = size // 20
+    channels = [
+        {"id": "19:general", "name": "General", "description": "Team-wide announcements"},
+        {"id": "19:payments", "name": "Payments", "description": "Payment engineering"},
+    ]
+    messages = []
+    for i in range(size - n_meetings):
+        messages.append({
+            "id": f"msg-{i + 1}",
+            "from": rng.choice(EMAILS),
+            "created_datetime": _iso(BASE_TIME + timedelta(seconds=i * 45)),
+            "body": _chat_text(rng, TEAMS_FRAGMENTS, prs, issues),
+            "importance": rng.choice(["normal", "normal", "high"]),
+            "channel_name": channels[i % len(channels)]["name"],
+            "mentions": [rng.choice(EMAILS)] if rng.random() < 0.2 else [],
+        })
+    meetings = []
+    for i in range(n_meetings):
+        start = BASE_TIME + timedelta(hours=i)
+        meetings.append({
+            "id": f"meet-{i + 1}",
+            "subject": rng.choice(["Daily Standup", "Sprint Planning", "Incident Review"]),
+            "start_time": _iso(start),
+            "end_time": _iso(start + timedelta(minutes=rng.choice([15, 30, 60]))),
+            "organizer": rng.choice(EMAILS),
+            "attendees": rng.sample(EMAILS, rng.randint(2, len(EMAILS))),
+        })
+
+    return {
+        "organization": "Acme Payments",
+        "team": {"id": "team-1", "name": "Payment Engineering", "description": "Payments"},
+        "channels": channels,
+        "messages": messages,
+        "meetings": meetings,
+        "metadata": {"generated_at": GENERATED_AT, "total_meetings": len(meetings)},
+    }
+
+
+GENERATORS: dict[str, Callable[[int, int], dict[str, Any]]] = {
+    "github": generate_github,
+    "jira": generate_jira,
+    "slack": generate_slack,
+    "teams": generate_teams,
+}
+
+
+def parse_scale(value: str) -> int:
+    """``"1k"``/``"100k"``/``"1m"`` (or a plain integer) to a record count."""
+    value = value.strip().lower()
+    if value in SCALES:
+        return SCALES[value]
+    return int(value.replace("_", ""))
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for IBM Cloud IAM and watsonx Orchestrate chat completions.
+
+Serves the endpoints ``WatsonxClient`` calls, with configurable latency
+and error injection, so ``/chat`` and ``/chat/stream`` can be load-tested
+offline (see ``benchmarks/load_test.py``):
+
+    POST /identity/token                               IAM API-key exchange
+    POST /v1/orchestrate/{agent_id}/chat/completions   chat, JSON or SSE (``"stream": true``)
+    GET  /stats                                        request / error counters
+
+Usage:
+    python -m benchmarks.fake_watsonx --port 9100 --latency-ms 800 --jitter-ms 300 --error-rate 0.02
+
+Then start the API against it:
+    STUB_MODE=false WATSONX_API_KEY=fake WATSONX_AGENT_ID=bench \\
+    WATSONX_URL=http://127.0.0.1:9100 WATSONX_IAM_URL=http://127.0.0.1:9100/identity/token \\
+    uvicorn app.main:app --port 8080
+"""
+
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass
+from urllib.parse import parse_qs
+
+import orjson
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import StreamingResponse
+
+REPLY = (
+    "The team is making steady progress, but PR-145 has been waiting for review for 6 hours "
+    "and is blocking PAY-102. CI run 1001 failed on the retry tests; a fix is in PR-146."
+)
+
+
+@dataclass
+class FakeConfig:
+    """Latency and failure behaviour of the fake server."""
+
+    latency_ms: float = 500.0  # mean chat latency (time to first byte when streaming)
+    jitter_ms: float = 100.0  # uniform +/- jitter around the mean
+    iam_latency_ms: float = 50.0
+    error_rate: float = 0.0  # fraction of chat calls failing with one of error_statuses
+    error_statuses: tuple[int, ...] = (500, 503, 429)
+    iam_error_rate: float = 0.0
+    token_ttl: int = 3600  # seconds; short values exercise token refresh
+    stream_chunks: int = 20
+    chunk_delay_ms: float = 25.0
+    seed: int | None = None
+
+
+def create_app(config: FakeConfig) -> FastAPI:
+    """Build the fake IAM + Orchestrate application."""
+    app = FastAPI(title="Fake watsonx", docs_url=None, redoc_url=None, openapi_url=None)
+    rng = random.Random(config.seed)
+    stats: Counter = Counter()
+    tokens: dict[str, float] = {}
+
+    async def delay(mean_ms: float) -> None:
+        jitter = rng.uniform(-config.jitter_ms, config.jitter_ms) if config.jitter_ms else 0.0
+        await asyncio.sleep(max(mean_ms + jitter, 0.0) / 1000)
+
+    def injected_error() -> Response | None:
+        if config.error_rate and rng.random() < config.error_rate:
+            status = rng.choice(config.error_statuses)
+            stats[f"error_{status}"] += 1
+            return Response(
+                orjson.dumps({"error": "injected failure", "status": status}),
+                status_code=status,
+                media_type="application/json",
+            )
+        return None
+
+    @app.post("/identity/token")
+    async def iam_token(request: Request) -> Response:
+        stats["iam_requests"] += 1
+        # urlencoded form; parsed directly so python-multipart isn't needed
+        form = parse_qs((await request.body()).decode())
+        await asyncio.sleep(config.iam_latency_ms / 1000)
+        if not form.get("apikey"):
+            stats["iam_rejected"] += 1
+            return Response(orjson.dumps({"errorMessage": "Provided API key could not be found"}), 400)
+        if config.iam_error_rate and rng.random() < config.iam_error_rate:
+            stats["iam_error_503"] += 1
+            return Response(orjson.dumps({"errorMessage": "IAM unavailable"}), 503)
+        token = uuid.uuid4().hex
+        tokens[token] = time.time() + config.token_ttl
+        return Response(
+            orjson.dumps({"access_token": token, "token_type": "Bearer", "expires_in": config.token_ttl}),
+            media_type="application/json",
+        )
+
+    @app.post("/v1/orchestrate/{agent_id}/chat/completions")
+    async def chat_completions(agent_id: str, request: Request) -> Response:
+        stats["chat_requests"] += 1
+        token = request.headers.get("authorization", "").removeprefix("Bearer ").strip()
+        if tokens.get(token, 0) < time.time():
+            stats["chat_unauthorized"] += 1
+            return Response(orjson.dumps({"error": "invalid or expired token"}), 401)
+
+        payload = orjson.loads(await request.body())
+        if payload.get("stream"):
+            return await stream_reply(agent_id)
+
+        await delay(config.latency_ms)
+        error = injected_error()
+        if error is not None:
+            return error
+        return Response(
+            orjson.dumps({
+                "id": f"chatcmpl-{uuid.uuid4().hex[:12]}",
+                "object": "chat.completion",
+                "model": agent_id,
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": REPLY}, "finish_reason": "stop"}],
+                "conversation_id": request.headers.get("x-ibm-thread-id") or str(uuid.uuid4()),
+            }),
+            media_type="application/json",
+        )
+
+    async def stream_reply(agent_id: str) -> Response:
+        stats["stream_requests"] += 1
+        await delay(config.latency_ms)
+        error = injected_error()
+        if error is not None:
+            return error
+
+        words = REPLY.split(" ")
+        per_chunk = max(len(words) // max(config.stream_chunks, 1), 1)
+
+        async def events():
+            for i in range(0, len(words), per_chunk):
+                delta = {"choices": [{"index": 0, "delta": {"content": " ".join(words[i:i + per_chunk]) + " "}}]}
+                yield b"data: " + orjson.dumps(delta) + b"\n\n"
+                await asyncio.sleep(config.chunk_delay_ms / 1000)
+            yield b"data: [DONE]\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    @app.get("/stats")
+    async def get_stats() -> Response:
+        return Response(orjson.dumps(dict(stats)), media_type="application/json")
+
+    return app
+
+
+def main():
+    """Run the fake server with uvicorn."""
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Local fake IAM + watsonx Orchestrate server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--latency-ms", type=float, default=500.0, help="Mean chat latency")
+    parser.add_argument("--jitter-ms", type=float, default=100.0, help="Uniform +/- latency jitter")
+    parser.add_argument("--iam-latency-ms", type=float, default=50.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of chat calls that fail")
+    parser.add_argument(
+        "--error-statuses", default="500,503,429", help="Comma-separated statuses used for injected failures"
+    )
+    parser.add_argument("--iam-error-rate", type=float, default=0.0)
+    parser.add_argument("--token-ttl", type=int, default=3600, help="IAM token lifetime in seconds")
+    parser.add_argument("--stream-chunks", type=int, default=20)
+    parser.add_argument("--chunk-delay-ms", type=float, default=25.0)
+    parser.add_argument("--seed", type=int, default=None, help="Seed latency/error randomness")
+    args = parser.parse_args()
+
+    config = FakeConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        iam_latency_ms=args.iam_latency_ms,
+        error_rate=args.error_rate,
+        error_statuses=tuple(int(s) for s in args.error_statuses.split(",") if s),
+        iam_error_rate=args.iam_error_rate,
+        token_ttl=args.token_ttl,
+        stream_chunks=args.stream_chunks,
+        chunk_delay_ms=args.chunk_delay_ms,
+        seed=args.seed,
+    )
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
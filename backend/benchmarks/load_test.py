@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Async load generator for the FlowSight API.
+
+Drives a weighted mix of scenarios with a fixed number of concurrent
+workers for a duration (or a request count) and reports throughput,
+p50/p95/p99 latency and an error breakdown per scenario:
+
+    chat           POST /chat
+    stream         POST /chat/stream (latency = full stream; TTFB reported separately)
+    events         GET  /mock/events
+    workflow       GET  /mock/workflow
+    workflow_page  GET  /mock/workflow?limit=100
+    branches       GET  /mock/branches
+
+Errors are keyed by ``http_<status>``, exception class, or ``stream_error``
+for SSE ``{"error": ...}`` frames (the stream endpoint reports upstream
+failures inside a 200 response).
+
+Usage (against the local fake watsonx server, see ``benchmarks/fake_watsonx.py``):
+    python -m benchmarks.load_test --concurrency 50 --duration 30
+    python -m benchmarks.load_test --mix chat=1,stream=1 --requests 2000 --output load.json
+"""
+
+import argparse
+import asyncio
+import math
+import random
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+import httpx
+import orjson
+
+CHAT_MESSAGES = [
+    "How is the team doing?",
+    "What's blocking the payment retry work?",
+    "Summarize the current sprint",
+    "Why did CI fail?",
+    "Who should review PR-145?",
+]
+
+DEFAULT_MIX = "chat=2,stream=1,events=2,workflow=2,workflow_page=1,branches=1"
+
+
+def percentile(sorted_values: list[float], pct: float) -> float | None:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return None
+    # 1-based rank ceil(p/100 * n), at least the first value
+    rank = max(math.ceil(pct / 100 * len(sorted_values)), 1)
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class Stats:
+    """Latencies and errors for one scenario."""
+
+    def __init__(self):
+        self.latencies: list[float] = []
+        self.ttfb: list[float] = []
+        self.errors: Counter = Counter()
+
+    @property
+    def requests(self) -> int:
+        return len(self.latencies) + sum(self.errors.values())
+
+    def summary(self, elapsed: float) -> dict[str, Any]:
+        latencies = sorted(self.latencies)
+        row: dict[str, Any] = {
+            "requests": self.requests,
+            "ok": len(latencies),
+            "errors": sum(self.errors.values()),
+            "rps": round(self.requests / elapsed, 1) if elapsed > 0 else None,
+        }
+        for pct in (50, 95, 99):
+            value = percentile(latencies, pct)
+            row[f"p{pct}_ms"] = round(value * 1000, 1) if value is not None else None
+        if self.ttfb:
+            ttfb = sorted(self.ttfb)
+            row["ttfb_p50_ms"] = round(percentile(ttfb, 50) * 1000, 1)
+            row["ttfb_p95_ms"] = round(percentile(ttfb, 95) * 1000, 1)
+        row["error_breakdown"] = dict(self.errors)
+        return row
+
+
+async def _get(client: httpx.AsyncClient, path: str, params: dict | None, stats: Stats) -> None:
+    started = time.perf_counter()
+    response = await client.get(path, params=params)
+    await response.aread()
+    if response.status_code >= 400:
+        stats.errors[f"http_{response.status_code}"] += 1
+        return
+    stats.latencies.append(time.perf_counter() - started)
+
+
+async def run_chat(client: httpx.AsyncClient, rng: random.Random, stats: Stats) -> None:
+    started = time.perf_counter()
+    response = await client.post("/chat", json={"message": rng.choice(CHAT_MESSAGES)})
+    if response.status_code >= 400:
+        stats.errors[f"http_{response.status_code}"] += 1
+        return
+    stats.latencies.append(time.perf_counter() - started)
+
+
+async def run_stream(client: httpx.AsyncClient, rng: random.Random, stats: Stats) -> None:
+    started = time.perf_counter()
+    first_byte: float | None = None
+    failed = False
+    async with client.stream("POST", "/chat/stream", json={"message": rng.choice(CHAT_MESSAGES)}) as response:
+        if response.status_code >= 400:
+            await response.aread()
+            stats.errors[f"http_{response.status_code}"] += 1
+            return
+        async for line in response.aiter_lines():
+            if not line.startswith("data: "):
+                continue
+            if first_byte is None:
+                first_byte = time.perf_counter() - started
+            data = line[6:]
+            if data.startswith("{") and '"error"' in data:
+                failed = True
+    if failed:
+        stats.errors["stream_error"] += 1
+        return
+    stats.latencies.append(time.perf_counter() - started)
+    if first_byte is not None:
+        stats.ttfb.append(first_byte)
+
+
+async def run_events(client: httpx.AsyncClient, rng: random.Random, stats: Stats) -> None:
+    await _get(client, "/mock/events", None, stats)
+
+
+async def run_workflow(client: httpx.AsyncClient, rng: random.Random, stats: Stats) -> None:
+    await _get(client, "/mock/workflow", None, stats)
+
+
+async def run_workflow_page(client: httpx.AsyncClient, rng: random.Random, stats: Stats) -> None:
+    await _get(client, "/mock/workflow", {"limit": 100}, stats)
+
+
+async def run_branches(client: httpx.AsyncClient, rng: random.Random, stats: Stats) -> None:
+    await _get(client, "/mock/branches", None, stats)
+
+
+SCENARIOS = {
+    "chat": run_chat,
+    "stream": run_stream,
+    "events": run_events,
+    "workflow": run_workflow,
+    "workflow_page": run_workflow_page,
+    "branches": run_branches,
+}
+
+
+def parse_mix(mix: str) -> dict[str, float]:
+    """Parse ``"chat=2,events=1"`` into scenario weights."""
+    weights: dict[str, float] = {}
+    for part in mix.split(","):
+        if not part.strip():
+            continue
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in SCENARIOS:
+            raise ValueError(f"unknown scenario {name!r} (choose from {', '.join(SCENARIOS)})")
+        weights[name] = float(weight or 1)
+    if not weights or sum(weights.values()) <= 0:
+        raise ValueError("mix must give at least one scenario a positive weight")
+    return weights
+
+
+async def run_load(
+    base_url: str,
+    weights: dict[str, float],
+    concurrency: int,
+    duration: float | None,
+    total_requests: int | None,
+    timeout: float,
+    seed: int,
+) -> tuple[dict[str, Stats], float]:
+    """
+    Run ``concurrency`` workers until the duration or request budget is spent.
+
+    Returns:
+        Per-scenario stats and the elapsed wall time in seconds
+    """
+    stats = {name: Stats() for name in weights}
+    names, cumulative = list(weights), list(weights.values())
+    remaining = [total_requests] if total_requests else None
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits) as client:
+        started = time.perf_counter()
+        deadline = started + duration if duration else None
+
+        async def worker(worker_id: int) -> None:
+            rng = random.Random(seed + worker_id)
+            while True:
+                if deadline is not None and time.perf_counter() >= deadline:
+                    return
+                if remaining is not None:
+                    if remaining[0] <= 0:
+                        return
+                    remaining[0] -= 1
+                name = rng.choices(names, weights=cumulative)[0]
+                try:
+                    await SCENARIOS[name](client, rng, stats[name])
+                except Exception as e:
+                    stats[name].errors[type(e).__name__] += 1
+
+        await asyncio.gather(*(worker(i) for i in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    return stats, elapsed
+
+
+def print_report(rows: dict[str, dict[str, Any]], elapsed: float) -> None:
+    print(f"\n{'scenario':<14} {'reqs':>7} {'err':>5} {'rps':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for name, row in rows.items():
+        print(
+            f"{name:<14} {row['requests']:>7,} {row['errors']:>5,} {row['rps'] or 0:>8.1f} "
+            f"{row['p50_ms'] or 0:>9.1f} {row['p95_ms'] or 0:>9.1f} {row['p99_ms'] or 0:>9.1f}"
+        )
+        if "ttfb_p50_ms" in row:
+            print(f"{'  ttfb':<14} {'':>7} {'':>5} {'':>8} {row['ttfb_p50_ms']:>9.1f} {row['ttfb_p95_ms']:>9.1f}")
+    print(f"\nElapsed {elapsed:.1f}s")
+    errors = rows["all"]["error_breakdown"]
+    if errors:
+        print("Errors: " + ", ".join(f"{kind}={count}" for kind, count in sorted(errors.items())))
+
+
+def main():
+    """Run the load test, print a report and optionally write it as JSON."""
+    parser = argparse.ArgumentParser(description="Load test the FlowSight API")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8080/api/v1")
+    parser.add_argument("--concurrency", type=int, default=20, help="Concurrent workers")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to run (ignored with --requests)")
+    parser.add_argument("--requests", type=int, default=None, help="Stop after this many requests")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"Scenario weights (default {DEFAULT_MIX})")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Per-request timeout in seconds")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write the report as JSON to this file")
+    args = parser.parse_args()
+
+    try:
+        weights = parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+
+    duration = None if args.requests else args.duration
+    print(f"Load testing {args.base_url} with {args.concurrency} workers "
+          f"({f'{args.requests:,} requests' if args.requests else f'{duration:.0f}s'})")
+    stats, elapsed = asyncio.run(
+        run_load(args.base_url, weights, args.concurrency, duration, args.requests, args.timeout, args.seed)
+    )
+
+    total = Stats()
+    for scenario in stats.values():
+        total.latencies.extend(scenario.latencies)
+        total.errors.update(scenario.errors)
+    rows = {name: scenario.summary(elapsed) for name, scenario in stats.items()}
+    rows["all"] = total.summary(elapsed)
+    print_report(rows, elapsed)
+
+    if args.output:
+        report = {
+            "meta": {
+                "base_url": args.base_url,
+                "concurrency": args.concurrency,
+                "duration": duration,
+                "requests": args.requests,
+                "mix": weights,
+                "seed": args.seed,
+                "elapsed": round(elapsed, 3),
+            },
+            "results": rows,
+        }
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        print(f"Report written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""EmbeddingJob checkpointing, resume and retries."""
+
+import pytest
+
+from app.pipeline.core.embedding_jobs import EmbeddingCheckpoint, EmbeddingJob
+
+BATCH_SIZE = 10
+
+
+class Crash(BaseException):
+    """Stands in for the process dying; not caught by the job's retries."""
+
+
+class HTTPError(Exception):
+    """Minimal stand-in for ``requests.HTTPError``."""
+
+    def __init__(self, status_code: int):
+        super().__init__(f"HTTP {status_code}")
+        self.response = type("Response", (), {"status_code": status_code, "headers": {}})()
+
+
+class FakeEmbedder:
+    """Embeds each text as [len(text)], failing on demand."""
+
+    def __init__(self, crash_after_calls: int | None = None, reject: set[str] = frozenset(), status: int | None = None):
+        self.crash_after_calls = crash_after_calls
+        self.reject = reject
+        self.status = status
+        self.calls: list[list[str]] = []
+
+    def __call__(self, texts: list[str]) -> list[list[float]]:
+        if self.crash_after_calls is not None and len(self.calls) == self.crash_after_calls:
+            raise Crash()
+        self.calls.append(texts)
+        if self.status is not None:
+            raise HTTPError(self.status)
+        if self.reject & set(texts):
+            raise HTTPError(400)
+        return [[float(len(text))] for text in texts]
+
+
+def texts_fn(record: dict) -> dict[str, str]:
+    return {"event_embedding": record["text"], "contextual_embedding": record["context"]}
+
+
+def fingerprint(record: dict) -> str:
+    return f"{record['text']}|{record['context']}"
+
+
+def make_records(count: int = 35) -> list[tuple[str, dict]]:
+    return [(f"r{i}", {"text": f"text {i}", "context": f"context {i % 3}"}) for i in range(count)]
+
+
+def make_job(path, embedder: FakeEmbedder, **kwargs) -> EmbeddingJob:
+    return EmbeddingJob(
+        texts_fn,
+        embedder,
+        EmbeddingCheckpoint(str(path)),
+        "test",
+        batch_size=BATCH_SIZE,
+        sleep=lambda seconds: None,
+        **kwargs,
+    )
+
+
+def test_resume_after_crash_skips_committed_batches(tmp_path):
+    path = tmp_path / "embeddings.db"
+    records = make_records()
+
+    with pytest.raises(Crash):
+        make_job(path, FakeEmbedder(crash_after_calls=2)).run(records, fingerprint)
+
+    embedder = FakeEmbedder()
+    results, stats = make_job(path, embedder).run(records, fingerprint)
+
+    assert stats.resumed == 2 * BATCH_SIZE
+    assert stats.embedded == len(records) - 2 * BATCH_SIZE
+    assert stats.failed == 0
+    assert len(embedder.calls) == 2
+    assert "text 0" not in {text for call in embedder.calls for text in call}
+    assert set(results) == {record_id for record_id, _ in records}
+    assert results["r0"] == {"event_embedding": [6.0], "contextual_embedding": [9.0]}
+
+
+def test_changed_fingerprint_is_re_embedded(tmp_path):
+    path = tmp_path / "embeddings.db"
+    records = make_records()
+    make_job(path, FakeEmbedder()).run(records, fingerprint)
+
+    records[5] = ("r5", {"text": "edited text", "context": "context 2"})
+    embedder = FakeEmbedder()
+    results, stats = make_job(path, embedder).run(records, fingerprint)
+
+    assert stats.resumed == len(records) - 1
+    assert stats.embedded == 1
+    assert embedder.calls == [["edited text", "context 2"]]
+    assert results["r5"]["event_embedding"] == [11.0]
+
+
+def test_failed_record_is_retried_on_next_run(tmp_path):
+    path = tmp_path / "embeddings.db"
+    records = make_records()
+
+    results, stats = make_job(path, FakeEmbedder(reject={"text 7"})).run(records, fingerprint)
+    assert stats.failed == 1
+    assert "r7" not in results
+    assert EmbeddingCheckpoint(str(path)).summary("test")["failed"] == 1
+
+    embedder = FakeEmbedder()
+    results, stats = make_job(path, embedder).run(records, fingerprint)
+
+    assert stats.resumed == len(records) - 1
+    assert stats.embedded == 1
+    assert stats.failed == 0
+    assert embedder.calls == [["text 7", "context 1"]]
+    assert "r7" in results
+
+
+def test_transient_errors_fail_the_batch_without_per_text_calls(tmp_path):
+    records = make_records()
+    embedder = FakeEmbedder(status=503)
+
+    results, stats = make_job(tmp_path / "embeddings.db", embedder, max_retries=2).run(records, fingerprint)
+
+    batches = -(-len(records) // BATCH_SIZE)
+    assert results == {}
+    assert stats.failed == len(records)
+    assert len(embedder.calls) == batches * 3
+    assert stats.retries == batches * 2
@@ -0,0 +1,45 @@
+"""PipelineRunner checkpoint lifecycle."""
+
+from app.pipeline.core.orchestrator import PipelineRunner, Stage
+
+
+def make_stages(calls: list[str], fail: set[str] = frozenset()) -> list[Stage]:
+    def stage_fn(name: str):
+        def run(inputs: dict) -> list[str]:
+            calls.append(name)
+            if name in fail:
+                raise RuntimeError(f"{name} failed")
+            return [name]
+        return run
+
+    return [Stage("a", stage_fn("a")), Stage("b", stage_fn("b"), depends_on=["a"])]
+
+
+def statuses(results) -> dict[str, str]:
+    return {name: result.status for name, result in results.items()}
+
+
+def test_completed_run_clears_checkpoints(tmp_path):
+    checkpoint_dir = tmp_path / "checkpoints"
+    calls: list[str] = []
+
+    first = PipelineRunner(make_stages(calls), checkpoint_dir=str(checkpoint_dir)).run()
+    second = PipelineRunner(make_stages(calls), checkpoint_dir=str(checkpoint_dir)).run()
+
+    assert statuses(first) == statuses(second) == {"a": "done", "b": "done"}
+    assert calls == ["a", "b", "a", "b"]
+    assert not checkpoint_dir.exists()
+
+
+def test_interrupted_run_resumes_completed_stages(tmp_path):
+    checkpoint_dir = tmp_path / "checkpoints"
+    calls: list[str] = []
+
+    first = PipelineRunner(make_stages(calls, fail={"b"}), checkpoint_dir=str(checkpoint_dir)).run()
+    assert statuses(first) == {"a": "done", "b": "failed"}
+    assert checkpoint_dir.exists()
+
+    second = PipelineRunner(make_stages(calls), checkpoint_dir=str(checkpoint_dir)).run()
+    assert statuses(second) == {"a": "resumed", "b": "done"}
+    assert calls == ["a", "b", "b"]
+    assert not checkpoint_dir.exists()
@@ -0,0 +1,57 @@
+"""SharedStore leases across processes."""
+
+import multiprocessing
+import time
+
+from app.core.shared_state import SharedStore
+
+
+def _race_add(path: str, key: str, value: bytes, barrier, results) -> None:
+    # Each process opens its own connection, as uvicorn workers do
+    store = SharedStore(path)
+    barrier.wait()
+    results.put((value, store.add(key, value, ttl=60)))
+    store.close()
+
+
+def _race(path: str, key: str, rounds: int) -> list[list[tuple[bytes, bool]]]:
+    ctx = multiprocessing.get_context("fork")
+    outcomes = []
+    for round_ in range(rounds):
+        barrier = ctx.Barrier(2)
+        results = ctx.Queue()
+        workers = [
+            ctx.Process(target=_race_add, args=(path, f"{key}:{round_}", name, barrier, results))
+            for name in (b"a", b"b")
+        ]
+        for worker in workers:
+            worker.start()
+        outcomes.append([results.get(timeout=10) for _ in workers])
+        for worker in workers:
+            worker.join(timeout=10)
+            assert worker.exitcode == 0
+    return outcomes
+
+
+def test_lapsed_lease_has_exactly_one_winner(tmp_path):
+    path = str(tmp_path / "shared.db")
+    store = SharedStore(path)
+    rounds = 10
+    for round_ in range(rounds):
+        store.set(f"lease:{round_}", b"stale", ttl=0.01)
+    time.sleep(0.05)
+
+    for round_, outcome in enumerate(_race(path, "lease", rounds)):
+        winners = [value for value, won in outcome if won]
+        assert len(winners) == 1
+        assert store.get(f"lease:{round_}") == winners[0]
+
+
+def test_live_lease_is_not_taken(tmp_path):
+    path = str(tmp_path / "shared.db")
+    store = SharedStore(path)
+    store.set("lease:0", b"holder", ttl=60)
+
+    outcome = _race(path, "lease", 1)[0]
+    assert [won for _, won in outcome] == [False, False]
+    assert store.get("lease:0") == b"holder"
@@ -0,0 +1,68 @@
+"""EventWarehouse writes and incremental graph updates."""
+
+from datetime import datetime, timedelta
+
+from app.models.events import RawEvent
+from app.services.warehouse import EventWarehouse
+
+BASE = datetime(2025, 1, 1)
+
+
+def event(source: str, type: str, id: str, hours: int = 0, **fields) -> RawEvent:
+    return RawEvent(source=source, type=type, id=id, timestamp=BASE + timedelta(hours=hours), **fields)
+
+
+def graph_snapshot(warehouse: EventWarehouse):
+    graph = warehouse.get_graph()
+    return (
+        sorted(node.model_dump_json() for node in graph.nodes),
+        sorted((edge.from_node, edge.to_node, edge.type) for edge in graph.edges),
+    )
+
+
+def assert_matches_rebuild(warehouse: EventWarehouse) -> None:
+    assert warehouse._graph_current()
+    incremental = graph_snapshot(warehouse)
+    warehouse.rebuild_graph()
+    assert incremental == graph_snapshot(warehouse)
+
+
+def test_duplicate_key_in_batch_keeps_only_last_version():
+    warehouse = EventWarehouse()
+    warehouse.add_events([event("github", "pull_request", "1", key="PR-1")], "acme")
+    warehouse.rebuild_graph()
+
+    written = warehouse.add_events(
+        [
+            event("jira", "issue", "2", 1, key="PAY-2", references=["pr:1"]),
+            event("jira", "issue", "2", 2, key="PAY-2", status="Done"),
+        ],
+        "acme",
+    )
+
+    assert written == 1
+    assert warehouse.events_referencing("pr:1") == []
+    assert warehouse.get_node("ISSUE_PAY-2").status == "Done"
+    assert warehouse.edges_for("PR_PR-1") == []
+    assert_matches_rebuild(warehouse)
+
+
+def test_incremental_links_match_rebuild():
+    warehouse = EventWarehouse()
+    warehouse.add_events([event("jira", "issue", "2", key="PAY-2", references=["pr:1"])], "acme")
+    warehouse.rebuild_graph()
+
+    # The PR arrives after the issue that references it, then a CI run for it
+    warehouse.add_events(
+        [event("github", "pull_request", "1", 1, key="PR-1", references=["commit:abc123"])], "acme"
+    )
+    warehouse.add_events([event("github", "commit", "abc123", 2)], "acme")
+    warehouse.add_events([event("github", "workflow_run", "7", 3, references=["pr:1"])], "acme")
+
+    edges = {(edge.from_node, edge.to_node, edge.type) for edge in warehouse.get_graph().edges}
+    assert edges == {
+        ("ISSUE_PAY-2", "PR_PR-1", "depends_on"),
+        ("COMMIT_abc123", "PR_PR-1", "triggers"),
+        ("PR_PR-1", "CI_7", "triggers"),
+    }
+    assert_matches_rebuild(warehouse)
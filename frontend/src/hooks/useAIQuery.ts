@@ -1,5 +1,6 @@
 import { useState, useCallback, useEffect } from 'react';
 import type { AIMessage } from '../types/ai';
+import { parseServerTiming } from '../services/api';
 import { loadConnectionsContextForAI, type AIConnectionsContext } from '../utils/aiContext';
 
 const API_BASE = import.meta.env.VITE_API_URL || 'http://localhost:8080';
@@ -17,7 +18,7 @@ async function fetchChatResponse(
   message: string,
   conversationId?: string,
   connectionsContext?: AIConnectionsContext | null
-): Promise<{ content: string; conversationId?: string }> {
+): Promise<{ content: string; conversationId?: string; timings: Record<string, number> }> {
   const body: { message: string; conversation_id?: string; context?: AIConnectionsContext } = {
     message,
     conversation_id: conversationId ?? undefined,
@@ -40,6 +41,7 @@ async function fetchChatResponse(
   return {
     content: data.message?.content || 'No response',
     conversationId: data.conversation_id,
+    timings: parseServerTiming(res.headers.get('Server-Timing')),
   };
 }
 
@@ -68,7 +70,7 @@ export function useAIQuery() {
     setLoading(true);
 
     try {
-      const { content: reply, conversationId: newConvId } = await fetchChatResponse(
+      const { content: reply, conversationId: newConvId, timings } = await fetchChatResponse(
         trimmed,
         conversationId,
         connectionsContext
@@ -80,6 +82,7 @@ export function useAIQuery() {
         role: 'assistant',
         content: reply,
         timestamp: formatTime(new Date()),
+        timings,
       };
       setMessages((prev) => [...prev, assistantMessage]);
       setLoading(false);
@@ -1,5 +1,18 @@
 const API_BASE = import.meta.env.VITE_API_URL || 'http://localhost:8080';
 
+// Parse `Server-Timing: load_graph;dur=0.4, watsonx_chat;dur=812.3, total;dur=815.0`
+// into { load_graph: 0.4, watsonx_chat: 812.3, total: 815 }
+export function parseServerTiming(header: string | null): Record<string, number> {
+  const timings: Record<string, number> = {};
+  if (!header) return timings;
+  for (const entry of header.split(',')) {
+    const [name, ...params] = entry.trim().split(';');
+    const dur = params.map((p) => p.trim()).find((p) => p.startsWith('dur='));
+    if (name && dur) timings[name] = Number(dur.slice(4));
+  }
+  return timings;
+}
+
 export async function fetchBranches() {
   const res = await fetch(`${API_BASE}/api/v1/mock/branches`);
   if (!res.ok) throw new Error('Failed to fetch branches');
@@ -12,8 +25,30 @@ export async function fetchBranchDetail(id: string) {
   return res.json();
 }
 
-export async function fetchWorkflow() {
-  const res = await fetch(`${API_BASE}/api/v1/mock/workflow`);
+export interface WorkflowQuery {
+  type?: string[];
+  status?: string[];
+  since?: string;
+  until?: string;
+  cursor?: string;
+  limit?: number;
+  fields?: string[];
+  includeEdges?: boolean;
+}
+
+// With any query option the backend returns one page plus `next_cursor`
+export async function fetchWorkflow(query: WorkflowQuery = {}) {
+  const params = new URLSearchParams();
+  query.type?.forEach((t) => params.append('type', t));
+  query.status?.forEach((s) => params.append('status', s));
+  if (query.since) params.set('since', query.since);
+  if (query.until) params.set('until', query.until);
+  if (query.cursor) params.set('cursor', query.cursor);
+  if (query.limit) params.set('limit', String(query.limit));
+  if (query.fields?.length) params.set('fields', query.fields.join(','));
+  if (query.includeEdges === false) params.set('include_edges', 'false');
+  const qs = params.toString();
+  const res = await fetch(`${API_BASE}/api/v1/mock/workflow${qs ? `?${qs}` : ''}`);
   if (!res.ok) throw new Error('Failed to fetch workflow');
   return res.json();
 }
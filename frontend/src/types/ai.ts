@@ -3,6 +3,8 @@ export interface AIMessage {
   role: 'user' | 'assistant';
   content: string;
   timestamp: string;
+  /** Backend stage durations in ms, from the Server-Timing header */
+  timings?: Record<string, number>;
 }
 
 export interface Recommendation {